@@ -16,22 +16,60 @@ Configuration:
 import sys
 import os
 import time
+import logging
 import platform
+import random
+import re
 import threading
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
+from operator import attrgetter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Optional, Dict, Any
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.errors import GoogleAdsException
+from google.protobuf import field_mask_pb2
 import openpyxl
 from openpyxl import load_workbook
 from dotenv import load_dotenv
 import shutil
+import json
 from datetime import datetime
 
 # Load environment variables
 load_dotenv()
 
+# Tree rebuild progress goes through logging so it can be silenced in bulk runs
+# (LOG_LEVEL=INFO / WARNING) without paying for message formatting
+log = logging.getLogger(__name__)
+
+
+def configure_logging(level: str = None):
+    """
+    Show this module's log output on stdout, in order with its prints.
+
+    Called by main(); scripts that call the process_* / rebuild_* functions
+    directly call it themselves. Safe to call more than once.
+
+    Args:
+        level: Log level name; defaults to the LOG_LEVEL environment variable,
+            or DEBUG (everything, like the prints it replaced). Unknown names
+            fall back to DEBUG.
+    """
+    if not log.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.propagate = False
+
+    level_name = (level or os.environ.get("LOG_LEVEL") or "DEBUG").upper()
+    if not isinstance(logging.getLevelName(level_name), int):
+        print(f"⚠️  Unknown log level '{level_name}', using DEBUG")
+        level_name = "DEBUG"
+    log.setLevel(level_name)
+
 # Add script directory to Python path for imports
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 if SCRIPT_DIR not in sys.path:
@@ -41,12 +79,21 @@ if SCRIPT_DIR not in sys.path:
 try:
     from google_ads_helpers import (
         safe_remove_entire_listing_tree,
+        get_listing_tree_root,
         create_listing_group_subdivision,
         create_listing_group_unit_biddable,
         add_standard_shopping_campaign,
-        add_shopping_ad_group,
+        set_campaign_budget_fields,
+        set_shopping_campaign_fields,
         add_shopping_product_ad,
         enable_negative_list_for_campaign,
+        ensure_campaign_label_exists,
+        create_location_op,
+        script_label,
+        next_id,
+        error_code_field,
+        quota_retry_delay,
+        is_concurrent_modification,
     )
 except ImportError as e:
     print(f"⚠️  Warning: Could not import helper functions from google_ads_helpers.py")
@@ -60,7 +107,45 @@ except ImportError as e:
 
 CUSTOMER_ID = "3800751597"
 MCC_ACCOUNT_ID = "3011145605"  # MCC account where bid strategies are stored
+MERCHANT_CENTER_ACCOUNT_ID = 140784594  # Merchant Center linked to all created campaigns
+CAMPAIGN_COUNTRY = "NL"  # Sales country of all created campaigns
 DEFAULT_BID_MICROS = 200_000  # €0.20
+DEFAULT_BUDGET_MICROS = 10_000_000  # €10, used when a budget is missing or invalid
+
+# Max entries per memoized campaign pattern lookup per run
+GAQL_CACHE_SIZE = 4096
+
+# Max ad groups of one campaign set up in parallel (ad group + tree + ad).
+# Kept small to stay clear of CONCURRENT_MODIFICATION on the campaign.
+AD_GROUP_SETUP_WORKERS = 8
+
+# Max concurrent GAQL reads when a lookup is split into several queries
+AD_GROUP_LOOKUP_WORKERS = 8
+
+# Max listing tree rebuilds of different ad groups in flight at once
+TREE_REBUILD_WORKERS = 16
+
+# Client-side cap on sequential per-shop API work (token bucket, see TokenBucket)
+API_RATE_LIMIT_QPS = 8
+API_RATE_LIMIT_BURST = 16
+# Adaptive rate (AIMD): halved on quota / concurrent modification errors, never
+# below the minimum, and raised by the step per successful call up to the cap
+API_RATE_LIMIT_MIN_QPS = 0.5
+API_RATE_LIMIT_STEP_QPS = 0.1
+
+# Section separators for console output, built once
+SEPARATOR = "=" * 70
+SUB_SEPARATOR = "─" * 70
+
+# Minimum seconds between two progress lines of a long row loop (see ProgressMeter)
+PROGRESS_LOG_INTERVAL_SECONDS = 1.0
+
+# Tree rebuilds with more exclusions than this go through a batch job, since a
+# single mutate request is capped at 5000 operations
+MAX_OPS_PER_MUTATE = 4500
+
+# Longest custom label / item ID value accepted in a listing tree node
+MAX_LISTING_VALUE_LENGTH = 255
 
 # Negative keyword list to add to all created campaigns
 NEGATIVE_LIST_NAME = "DMA negatives"
@@ -295,110 +380,405 @@ def initialize_google_ads_client():
 
 
 # ============================================================================
-# BID STRATEGY RETRIEVAL
+# QUOTA / CONCURRENT MODIFICATION RETRY
 # ============================================================================
 
-def get_bid_strategy_by_name(
-    client: GoogleAdsClient,
-    customer_id: str,
-    strategy_name: str
-) -> Optional[str]:
+def _backoff_delay(attempt: int, base: float = 2, cap: float = 30, jitter: float = 0.5) -> float:
+    """
+    Seconds to wait before retry number attempt + 1 (attempt starts at 0).
+
+    min(base * 2^attempt, cap), stretched by a random factor of up to
+    1 + jitter so retries from parallel workers don't line up.
+    """
+    return min(cap, base * (2 ** attempt)) * (1 + random.uniform(0, jitter))
+
+
+def with_quota_retry(max_retries: int = 5, max_backoff: float = 64):
+    """
+    Decorator: retry a Google Ads call on quota errors with exponential backoff.
+
+    Sleeps for the QuotaErrorDetails.retry_delay from the API when given,
+    otherwise min(2^attempt + jitter, max_backoff). The retry delay also holds
+    back api_rate_limiter, so other workers don't hit the exhausted quota in
+    the meantime. Non-quota errors are re-raised immediately, quota errors
+    after max_retries attempts.
+
+    Args:
+        max_retries: Max number of retries after the first attempt
+        max_backoff: Upper bound for the computed backoff in seconds
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except GoogleAdsException as ex:
+                    retry_delay = quota_retry_delay(ex)
+                    if retry_delay is None:
+                        raise
+                    api_rate_limiter.slow_down(hold_for=retry_delay)
+                    if attempt == max_retries:
+                        raise
+                    backoff = min((2 ** attempt) + random.random(), max_backoff)
+                    sleep_for = max(retry_delay, backoff)
+                    print(f"   ⏳ Quota exhausted, retrying in {sleep_for:.1f}s "
+                          f"(attempt {attempt + 1}/{max_retries})...")
+                    time.sleep(sleep_for)
+        return wrapper
+    return decorator
+
+
+# Error codes that get a short message in the result column, in priority order
+_FRIENDLY_ERRORS = {
+    "SUBDIVISION_REQUIRES_OTHERS_CASE": "Tree structure error: missing OTHERS case",
+    "CONCURRENT_MODIFICATION": "Concurrent modification (retry needed)",
+    "NOT_FOUND": "Resource not found",
+    "INVALID_ARGUMENT": "Invalid argument in API call",
+    "PERMISSION_DENIED": "Permission denied",
+}
+# One case-insensitive scan for all codes; "not found" is folded into NOT_FOUND
+_FRIENDLY_ERROR_PATTERN = re.compile("|".join(_FRIENDLY_ERRORS) + "|not found", re.IGNORECASE)
+
+
+def friendly_error_message(error_msg: str, max_length: int = 80) -> str:
+    """
+    Short, user-facing version of an API error for the result column.
+
+    Known error codes map to a fixed message (see _FRIENDLY_ERRORS); anything
+    else is truncated to max_length characters.
+    """
+    found = {match.upper().replace(" ", "_") for match in _FRIENDLY_ERROR_PATTERN.findall(error_msg)}
+    for code, message in _FRIENDLY_ERRORS.items():
+        if code in found:
+            return message
+    return error_msg[:max_length]
+
+
+def with_concurrent_modification_retry(max_tries: int = 5, base_delay: float = 0.1):
+    """
+    Decorator: retry a Google Ads call on CONCURRENT_MODIFICATION errors.
+
+    Replaces fixed sleeps between mutates: the call runs immediately and only
+    waits (base_delay * 2^attempt, jittered) when the API actually reports a
+    conflicting change. All other errors are re-raised immediately.
+
+    Args:
+        max_tries: Max number of attempts including the first
+        base_delay: Backoff in seconds before the first retry
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_tries):
+                try:
+                    return func(*args, **kwargs)
+                except GoogleAdsException as ex:
+                    if not is_concurrent_modification(ex):
+                        raise
+                    api_rate_limiter.slow_down()
+                    if attempt == max_tries - 1:
+                        raise
+                    sleep_for = base_delay * (2 ** attempt) * (1 + random.random())
+                    print(f"   ⏳ Concurrent modification, retrying in {sleep_for:.1f}s "
+                          f"(attempt {attempt + 1}/{max_tries - 1})...")
+                    time.sleep(sleep_for)
+        return wrapper
+    return decorator
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter with an adaptive (AIMD) rate.
+
+    acquire() takes one token and only sleeps when the bucket is empty, so
+    calls run at full speed while usage stays under the current rate (with
+    bursts up to burst calls). Replaces fixed sleeps between API calls; actual
+    conflicts are handled by with_concurrent_modification_retry.
+
+    The retry decorators call slow_down() when the API reports quota
+    exhaustion or a concurrent modification, which halves the rate; every
+    acquire() raises it again by step_qps, up to rate_qps. For quota errors
+    the server's retry delay is passed as hold_for, so no tokens are handed
+    out until it has passed.
+
+    Args:
+        rate_qps: Max tokens added per second
+        burst: Bucket size (max calls without waiting)
+        min_rate_qps: Lower bound for the rate after slow_down()
+        step_qps: Rate increase per acquire() while below rate_qps
+    """
+
+    def __init__(self, rate_qps: float, burst: int, min_rate_qps: float = None, step_qps: float = 0.0):
+        self._max_rate = rate_qps
+        self._min_rate = min(min_rate_qps or rate_qps, rate_qps)
+        self._step = step_qps
+        self._rate = rate_qps
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current rate in tokens per second."""
+        return self._rate
+
+    def acquire(self):
+        """Take one token, sleeping only as long as needed for it to refill."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            self._rate = min(self._max_rate, self._rate + self._step)
+        if wait:
+            time.sleep(wait)
+
+    def slow_down(self, hold_for: float = 0.0):
+        """
+        Halve the rate (not below min_rate_qps) and drop any saved-up burst.
+
+        Args:
+            hold_for: Seconds before the next token is available (e.g. the
+                retry delay the API asked for)
+        """
+        with self._lock:
+            self._rate = max(self._min_rate, self._rate / 2)
+            self._tokens = min(self._tokens, -hold_for * self._rate)
+            log.debug("API rate limit lowered to %.2f calls/s", self._rate)
+
+
+# Shared by all sheet loops, so the cap holds across groups and sheets
+api_rate_limiter = TokenBucket(
+    API_RATE_LIMIT_QPS, API_RATE_LIMIT_BURST, API_RATE_LIMIT_MIN_QPS, API_RATE_LIMIT_STEP_QPS
+)
+
+
+@with_quota_retry()
+@with_concurrent_modification_retry()
+def mutate_ad_group_criteria_with_retry(agc_service, customer_id: str, operations: list):
+    """
+    mutate_ad_group_criteria wrapped in with_quota_retry and
+    with_concurrent_modification_retry.
+
+    Args:
+        agc_service: AdGroupCriterionService client
+        customer_id: Customer ID
+        operations: List of AdGroupCriterionOperation
+
+    Returns:
+        MutateAdGroupCriteriaResponse
+    """
+    return agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=operations)
+
+
+@with_quota_retry()
+@with_concurrent_modification_retry()
+def google_ads_mutate_with_retry(ga_service, customer_id: str, mutate_operations: list):
+    """
+    GoogleAdsService.mutate wrapped in with_quota_retry and
+    with_concurrent_modification_retry.
+
+    Args:
+        ga_service: GoogleAdsService client
+        customer_id: Customer ID
+        mutate_operations: List of MutateOperation
+
+    Returns:
+        MutateGoogleAdsResponse
+    """
+    return ga_service.mutate(customer_id=customer_id, mutate_operations=mutate_operations)
+
+
+@with_quota_retry()
+def google_ads_mutate_partial(client: GoogleAdsClient, ga_service, customer_id: str, mutate_operations: list) -> tuple:
     """
-    Retrieve portfolio bid strategy by name.
+    GoogleAdsService.mutate with partial_failure=True, wrapped in with_quota_retry.
+
+    Operations that depend on a failed one through a temporary resource name
+    fail as well; everything else is applied.
 
     Args:
         client: Google Ads client
+        ga_service: GoogleAdsService client
         customer_id: Customer ID
-        strategy_name: Bid strategy name to search for
+        mutate_operations: List of MutateOperation
 
     Returns:
-        Bid strategy resource name or None if not found
+        tuple: (MutateGoogleAdsResponse, {operation_index: error message} for
+        the operations that failed)
     """
-    ga_service = client.get_service("GoogleAdsService")
+    request = client.get_type("MutateGoogleAdsRequest")
+    request.customer_id = customer_id
+    request.mutate_operations = mutate_operations
+    request.partial_failure = True
+    response = ga_service.mutate(request=request)
 
-    # Escape single quotes in strategy name for GAQL (replace ' with \')
-    escaped_strategy_name = strategy_name.replace("'", "\\'")
+    failed = {}
+    if response.partial_failure_error and response.partial_failure_error.code != 0:
+        failure_type = type(client.get_type("GoogleAdsFailure"))
+        for detail in response.partial_failure_error.details:
+            failed.update(failure_errors_by_index(failure_type.deserialize(detail.value), len(mutate_operations)))
+    return response, failed
 
-    query = f"""
-        SELECT
-            bidding_strategy.id,
-            bidding_strategy.name,
-            bidding_strategy.resource_name
-        FROM bidding_strategy
-        WHERE bidding_strategy.name = '{escaped_strategy_name}'
-        LIMIT 1
+
+def failure_errors_by_index(failure, operation_count: int = None) -> Dict[int, str]:
     """
+    Map a GoogleAdsFailure to {operation_index: error message}.
 
-    try:
-        response = ga_service.search(customer_id=customer_id, query=query)
+    Works for partial_failure_error details as well as GoogleAdsException.failure.
+    An error without an operation index applies to the whole request: with
+    operation_count it is reported for every operation (so partial-failure
+    callers never take it for success), without it it is skipped.
+    """
+    errors = {}
+    for error in failure.errors:
+        error_msg = f"{str(error.error_code).strip()}: {error.message}"
+        if error.location.field_path_elements:
+            errors.setdefault(error.location.field_path_elements[0].index, error_msg)
+        elif operation_count is not None:
+            for index in range(operation_count):
+                errors.setdefault(index, error_msg)
+    return errors
 
-        for row in response:
-            print(f"   📊 Found bid strategy: {row.bidding_strategy.name} (ID: {row.bidding_strategy.id})")
-            return row.bidding_strategy.resource_name
 
-        print(f"   ⚠️  Bid strategy '{strategy_name}' not found")
-        return None
+def _error_code_name(error) -> str:
+    """Enum name of a GoogleAdsError's error code, e.g. 'LISTING_GROUP_ALREADY_EXISTS'."""
+    field = error_code_field(error)
+    return getattr(error.error_code, field).name if field else ""
 
-    except Exception as e:
-        print(f"   ❌ Error searching for bid strategy '{strategy_name}': {e}")
-        return None
+
+def failure_error_codes_by_index(failure, operation_count: int = None) -> Dict[int, str]:
+    """
+    Map a GoogleAdsFailure to {operation_index: error code name}.
+
+    Same indexes as failure_errors_by_index, but classifying by the enum name
+    instead of searching the formatted message.
+    """
+    codes = {}
+    for error in failure.errors:
+        if error.location.field_path_elements:
+            codes.setdefault(error.location.field_path_elements[0].index, _error_code_name(error))
+        elif operation_count is not None:
+            for index in range(operation_count):
+                codes.setdefault(index, _error_code_name(error))
+    return codes
+
+
+def google_ads_error_codes(ex: GoogleAdsException) -> set:
+    """Error code names (see _error_code_name) of all errors in a GoogleAdsException."""
+    return {_error_code_name(error) for error in ex.failure.errors}
+
+
+@with_quota_retry()
+def mutate_ad_group_criteria_partial(client: GoogleAdsClient, agc_service, customer_id: str, operations: list) -> dict:
+    """
+    mutate_ad_group_criteria with partial_failure=True, wrapped in with_quota_retry.
+
+    Valid operations are applied even if others fail, so one bad exclusion no
+    longer rolls back (and forces a re-send of) the whole request. Only use this
+    for independent operations like exclusion units under an existing parent -
+    tree structure must stay atomic.
+
+    Args:
+        client: Google Ads client
+        agc_service: AdGroupCriterionService client
+        customer_id: Customer ID
+        operations: List of AdGroupCriterionOperation
+
+    Returns:
+        dict: {operation_index: (error code name, error message)} for the
+        operations that failed
+    """
+    request = client.get_type("MutateAdGroupCriteriaRequest")
+    request.customer_id = customer_id
+    request.operations = operations
+    request.partial_failure = True
+    response = agc_service.mutate_ad_group_criteria(request=request)
+
+    failed = {}
+    if response.partial_failure_error and response.partial_failure_error.code != 0:
+        failure_type = type(client.get_type("GoogleAdsFailure"))
+        for detail in response.partial_failure_error.details:
+            failure = failure_type.deserialize(detail.value)
+            codes = failure_error_codes_by_index(failure, len(operations))
+            for index, error_msg in failure_errors_by_index(failure, len(operations)).items():
+                failed.setdefault(index, (codes[index], error_msg))
+    return failed
+
+
+def escape_gaql_string(value: str) -> str:
+    """Escape a value for use inside a single-quoted GAQL string literal."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def gaql_string_list(values) -> str:
+    """
+    Comma-separated, quoted and escaped GAQL string literals for an IN (...) filter.
+
+    Duplicates are dropped and the values sorted, so the same set of names
+    always produces the same query text.
+    """
+    return ", ".join("'" + escape_gaql_string(value) + "'" for value in sorted(set(values)))
 
 
 # ============================================================================
-# CAMPAIGN AND AD GROUP RETRIEVAL
+# BID STRATEGY RETRIEVAL
 # ============================================================================
 
-def get_campaign_by_name_pattern(
+def get_bid_strategies_by_name(
     client: GoogleAdsClient,
     customer_id: str,
-    name_pattern: str
-) -> Optional[Dict[str, Any]]:
+    strategy_names
+) -> Dict[str, str]:
     """
-    Retrieve campaign by name pattern.
+    Retrieve several portfolio bid strategies by name in one query.
+
+    Use this before a campaign loop instead of looking them up per campaign.
 
     Args:
         client: Google Ads client
         customer_id: Customer ID
-        name_pattern: Campaign name pattern (e.g., "PLA/Electronics_A")
+        strategy_names: Bid strategy names to search for
 
     Returns:
-        Dict with campaign info (id, name, resource_name) or None if not found
+        Dict of strategy name -> resource name (names that were not found are missing)
     """
-    ga_service = client.get_service("GoogleAdsService")
-
-    # Escape single quotes in name pattern for GAQL (replace ' with \')
-    escaped_name_pattern = name_pattern.replace("'", "\\'")
+    names = sorted(set(strategy_names))
+    if not names:
+        return {}
 
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    escaped_names = gaql_string_list(names)
     query = f"""
         SELECT
-            campaign.id,
-            campaign.name,
-            campaign.resource_name,
-            campaign.status
-        FROM campaign
-        WHERE campaign.name LIKE '%{escaped_name_pattern}%'
-            AND campaign.status != 'REMOVED'
-        LIMIT 1
+            bidding_strategy.id,
+            bidding_strategy.name,
+            bidding_strategy.resource_name
+        FROM bidding_strategy
+        WHERE bidding_strategy.name IN ({escaped_names})
     """
 
+    strategies = {}
     try:
-        response = ga_service.search(customer_id=customer_id, query=query)
-
-        for row in response:
-            campaign = row.campaign
-            return {
-                'id': campaign.id,
-                'name': campaign.name,
-                'resource_name': campaign.resource_name,
-                'status': campaign.status.name
-            }
+        for row in search_stream_rows(ga_service, customer_id, query):
+            print(f"   📊 Found bid strategy: {row.bidding_strategy.name} (ID: {row.bidding_strategy.id})")
+            strategies[row.bidding_strategy.name] = row.bidding_strategy.resource_name
+    except Exception as e:
+        print(f"   ❌ Error searching for bid strategies {names}: {e}")
+        return {}
 
-        return None
+    for name in names:
+        if name not in strategies:
+            print(f"   ⚠️  Bid strategy '{name}' not found")
+    return strategies
 
-    except GoogleAdsException as e:
-        print(f"❌ Error searching for campaign '{name_pattern}': {e}")
-        return None
 
+# ============================================================================
+# CAMPAIGN AND AD GROUP RETRIEVAL
+# ============================================================================
 
 def get_ad_group_from_campaign(
     client: GoogleAdsClient,
@@ -416,7 +796,7 @@ def get_ad_group_from_campaign(
     Returns:
         Dict with ad group info (id, name, resource_name) or None if not found
     """
-    ga_service = client.get_service("GoogleAdsService")
+    ga_service = get_cached_service(client, "GoogleAdsService")
 
     query = f"""
         SELECT
@@ -449,32 +829,18 @@ def get_ad_group_from_campaign(
         return None
 
 
-def get_campaign_and_ad_group_by_pattern(
+@lru_cache(maxsize=GAQL_CACHE_SIZE)
+def _lookup_campaign_and_ad_group_by_pattern(
     client: GoogleAdsClient,
     customer_id: str,
     name_pattern: str
 ) -> Optional[Dict[str, Any]]:
     """
-    Retrieve campaign AND ad group by campaign name pattern in a single query.
-    This is more efficient than making two separate API calls.
-
-    Args:
-        client: Google Ads client
-        customer_id: Customer ID
-        name_pattern: Campaign name pattern (e.g., "PLA/Electronics_A")
-
-    Returns:
-        Dict with campaign and ad_group info:
-        {
-            'campaign': {'id': ..., 'name': ..., 'resource_name': ..., 'status': ...},
-            'ad_group': {'id': ..., 'name': ..., 'resource_name': ..., 'status': ...}
-        }
-        or None if not found
+    Cached campaign + ad group query. Raises on API errors so failures are not cached.
     """
-    ga_service = client.get_service("GoogleAdsService")
+    ga_service = get_cached_service(client, "GoogleAdsService")
 
-    # Escape single quotes in name pattern for GAQL (replace ' with \')
-    escaped_name_pattern = name_pattern.replace("'", "\\'")
+    escaped_name_pattern = escape_gaql_string(name_pattern)
 
     query = f"""
         SELECT
@@ -493,123 +859,309 @@ def get_campaign_and_ad_group_by_pattern(
         LIMIT 1
     """
 
-    try:
-        response = ga_service.search(customer_id=customer_id, query=query)
+    response = ga_service.search(customer_id=customer_id, query=query)
 
-        for row in response:
-            return {
-                'campaign': {
-                    'id': row.campaign.id,
-                    'name': row.campaign.name,
-                    'resource_name': row.campaign.resource_name,
-                    'status': row.campaign.status.name
-                },
-                'ad_group': {
-                    'id': row.ad_group.id,
-                    'name': row.ad_group.name,
-                    'resource_name': row.ad_group.resource_name,
-                    'status': row.ad_group.status.name
-                }
+    for row in response:
+        return {
+            'campaign': {
+                'id': row.campaign.id,
+                'name': row.campaign.name,
+                'resource_name': row.campaign.resource_name,
+                'status': row.campaign.status.name
+            },
+            'ad_group': {
+                'id': row.ad_group.id,
+                'name': row.ad_group.name,
+                'resource_name': row.ad_group.resource_name,
+                'status': row.ad_group.status.name
             }
+        }
 
-        return None
+    return None
+
+
+def get_campaign_and_ad_group_by_pattern(
+    client: GoogleAdsClient,
+    customer_id: str,
+    name_pattern: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve campaign AND ad group by campaign name pattern in a single query.
+    This is more efficient than making two separate API calls.
+
+    Results are memoized per (client, customer_id, name_pattern) for the
+    duration of the run; see clear_gaql_caches().
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        name_pattern: Campaign name pattern (e.g., "PLA/Electronics_A")
 
+    Returns:
+        Dict with campaign and ad_group info:
+        {
+            'campaign': {'id': ..., 'name': ..., 'resource_name': ..., 'status': ...},
+            'ad_group': {'id': ..., 'name': ..., 'resource_name': ..., 'status': ...}
+        }
+        or None if not found
+    """
+    try:
+        result = _lookup_campaign_and_ad_group_by_pattern(client, customer_id, name_pattern)
     except GoogleAdsException as e:
         print(f"❌ Error searching for campaign+ad group '{name_pattern}': {e}")
         return None
 
+    if not result:
+        return None
+
+    # Hand out copies so callers can't corrupt the cached entry
+    return {
+        'campaign': dict(result['campaign']),
+        'ad_group': dict(result['ad_group'])
+    }
+
+
+def clear_gaql_caches():
+    """
+    Drop all memoized lookup results.
+
+    Call this when a long-running process needs to see campaigns that were
+    created after they were first looked up, or listing trees that were
+    changed outside this script.
+    """
+    _lookup_campaign_and_ad_group_by_pattern.cache_clear()
+    _ad_group_meta_cache.clear()
+    _cl3_tree_meta_cache.clear()
+
 
 # ============================================================================
 # LISTING TREE REBUILD FUNCTIONS (Custom Label 3 Targeting)
 # ============================================================================
 
-def rebuild_tree_with_custom_label_3_inclusion(
-    client: GoogleAdsClient,
-    customer_id: str,
-    ad_group_id: int,
-    shop_name: str,
-    default_bid_micros: int = DEFAULT_BID_MICROS
-):
+@with_quota_retry()
+def search_stream_rows(ga_service, customer_id: str, query: str) -> list:
     """
-    Rebuild listing tree to TARGET (include) a specific shop name via custom label 3.
+    Run a GAQL query via search_stream and materialize all rows.
 
-    Structure:
-    Root SUBDIVISION
-    ├─ Custom Label 3 = shop_name [POSITIVE, biddable] → Target this shop
-    └─ Custom Label 3 OTHERS [NEGATIVE] → Exclude all other shops
+    Unlike search(), which pages through results with one round trip per page,
+    search_stream returns every row in a single streamed response.
 
     Args:
-        client: Google Ads client
+        ga_service: GoogleAdsService client
         customer_id: Customer ID
-        ad_group_id: Ad group ID
-        shop_name: Shop name to target (custom label 3 value)
-        default_bid_micros: Bid amount in micros
+        query: GAQL query
+
+    Returns:
+        List of GoogleAdsRow
     """
-    print(f"   Rebuilding tree to TARGET shop '{shop_name}' (custom label 3)")
+    stream = ga_service.search_stream(customer_id=customer_id, query=query)
+    return [row for batch in stream for row in batch.results]
 
-    # Remove existing tree
-    safe_remove_entire_listing_tree(client, customer_id, str(ad_group_id))
-    time.sleep(0.5)
 
-    agc_service = client.get_service("AdGroupCriterionService")
+@lru_cache(maxsize=None)
+def get_cached_service(client: GoogleAdsClient, name: str):
+    """
+    client.get_service(name), created once per client and reused.
 
-    # MUTATE 1: Create root SUBDIVISION + Custom Label 3 OTHERS (negative)
-    ops1 = []
+    Service clients are thread-safe, so one instance can serve every
+    builder call and worker thread.
+    """
+    return client.get_service(name)
 
-    # 1. ROOT SUBDIVISION
-    root_op = create_listing_group_subdivision(
-        client=client,
-        customer_id=customer_id,
-        ad_group_id=str(ad_group_id),
-        parent_ad_group_criterion_resource_name=None,
-        listing_dimension_info=None
-    )
-    root_tmp = root_op.create.resource_name
-    ops1.append(root_op)
 
-    # 2. Custom Label 3 OTHERS (negative - blocks all other shops)
-    dim_cl3_others = client.get_type("ListingDimensionInfo")
-    dim_cl3_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3  # INDEX3 = Custom Label 3
-    # Don't set value - OTHERS case
+@lru_cache(maxsize=None)
+def get_cached_type(client: GoogleAdsClient, name: str):
+    """
+    Message class for client.get_type(name), resolved once per client.
 
-    ops1.append(
-        create_listing_group_unit_biddable(
-            client=client,
-            customer_id=customer_id,
-            ad_group_id=str(ad_group_id),
-            parent_ad_group_criterion_resource_name=root_tmp,
-            listing_dimension_info=dim_cl3_others,
-            targeting_negative=True,  # NEGATIVE - blocks everything else
-            cpc_bid_micros=None
-        )
-    )
+    Call the returned class to create a fresh message, e.g. in loops that
+    build one operation per item.
+    """
+    return type(client.get_type(name))
 
-    # Execute first mutate
-    resp1 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops1)
-    root_actual = resp1.results[0].resource_name
-    time.sleep(0.5)
 
-    # MUTATE 2: Add specific shop name as POSITIVE unit
-    ops2 = []
+@lru_cache(maxsize=None)
+def _listing_dimension_info_type(client: GoogleAdsClient):
+    """ListingDimensionInfo message class, resolved once per client."""
+    return type(client.get_type("ListingDimensionInfo"))
 
-    dim_shop = client.get_type("ListingDimensionInfo")
-    dim_shop.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3  # INDEX3 = Custom Label 3
-    dim_shop.product_custom_attribute.value = shop_name
 
-    ops2.append(
-        create_listing_group_unit_biddable(
-            client=client,
+@lru_cache(maxsize=None)
+def _product_item_id_info_type(client: GoogleAdsClient):
+    """ProductItemIdInfo message class, resolved once per client."""
+    return type(client.get_type("ProductItemIdInfo"))
+
+
+def make_custom_label_dim(client: GoogleAdsClient, index, value: str = None):
+    """
+    Build a ListingDimensionInfo for a custom label node.
+
+    Args:
+        client: Google Ads client
+        index: ProductCustomAttributeIndexEnum value (INDEX0..INDEX4)
+        value: Custom label value, or None for the OTHERS case
+
+    Returns:
+        ListingDimensionInfo
+    """
+    dim = _listing_dimension_info_type(client)()
+    dim.product_custom_attribute.index = index
+    if value is not None:
+        dim.product_custom_attribute.value = value
+    return dim
+
+
+def make_item_id_dim(client: GoogleAdsClient, value: str = None):
+    """
+    Build a ListingDimensionInfo for an item ID node.
+
+    Args:
+        client: Google Ads client
+        value: Item ID, or None for the OTHERS case
+
+    Returns:
+        ListingDimensionInfo
+    """
+    dim = _listing_dimension_info_type(client)()
+    # Assigning an empty ProductItemIdInfo selects the item ID dimension (OTHERS)
+    dim.product_item_id = _product_item_id_info_type(client)()
+    if value is not None:
+        dim.product_item_id.value = value
+    return dim
+
+
+def cl3_exclusion_operations(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id: str,
+    parent_resource_name: str,
+    shop_names: list
+) -> list:
+    """
+    Build negative CL3 unit create operations, one per shop, under one parent.
+
+    The operations only differ in their temporary resource name and CL3
+    value, so the first one is built by create_listing_group_unit_biddable and
+    the others are copies of it with those two fields overwritten.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_id: Ad group ID (real or temporary)
+        parent_resource_name: Resource name of the parent subdivision
+        shop_names: Shop names to exclude (CL3 values)
+
+    Returns:
+        List of AdGroupCriterionOperation, in shop_names order
+    """
+    if not shop_names:
+        return []
+
+    template = create_listing_group_unit_biddable(
+        client=client,
+        customer_id=customer_id,
+        ad_group_id=ad_group_id,
+        parent_ad_group_criterion_resource_name=parent_resource_name,
+        listing_dimension_info=make_custom_label_dim(
+            client, client.enums.ProductCustomAttributeIndexEnum.INDEX3, str(shop_names[0])
+        ),
+        targeting_negative=True,
+        cpc_bid_micros=None
+    )
+    operations = [template]
+
+    op_type = get_cached_type(client, "AdGroupCriterionOperation")
+    criterion_path = get_cached_service(client, "AdGroupCriterionService").ad_group_criterion_path
+    for shop_name in shop_names[1:]:
+        op = op_type()
+        op._pb.CopyFrom(template._pb)
+        criterion = op._pb.create
+        criterion.resource_name = criterion_path(customer_id, ad_group_id, next_id())
+        criterion.listing_group.case_value.product_custom_attribute.value = str(shop_name)
+        operations.append(op)
+    return operations
+
+
+# (index name, value) of a ProductCustomAttributeInfo in one call
+_custom_attribute_fields = attrgetter("index.name", "value")
+
+
+def rebuild_tree_with_custom_label_3_inclusion(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id: int,
+    shop_name: str,
+    default_bid_micros: int = DEFAULT_BID_MICROS
+):
+    """
+    Rebuild listing tree to TARGET (include) a specific shop name via custom label 3.
+
+    Structure:
+    Root SUBDIVISION
+    ├─ Custom Label 3 = shop_name [POSITIVE, biddable] → Target this shop
+    └─ Custom Label 3 OTHERS [NEGATIVE] → Exclude all other shops
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_id: Ad group ID
+        shop_name: Shop name to target (custom label 3 value)
+        default_bid_micros: Bid amount in micros
+    """
+    log.info("   Rebuilding tree to TARGET shop '%s' (custom label 3)", shop_name)
+    ad_group_id_str = str(ad_group_id)  # Stringified once, reused for every operation
+
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    idx3 = client.enums.ProductCustomAttributeIndexEnum.INDEX3
+
+    # Single MUTATE: root SUBDIVISION + CL3 OTHERS (negative) + shop unit (positive).
+    # Children reference the root through its temporary resource name.
+    ops = _start_tree_rebuild_ops(client, customer_id, ad_group_id)
+
+    # 1. ROOT SUBDIVISION
+    root_op = create_listing_group_subdivision(
+        client=client,
+        customer_id=customer_id,
+        ad_group_id=ad_group_id_str,
+        parent_ad_group_criterion_resource_name=None,
+        listing_dimension_info=None
+    )
+    root_tmp = root_op.create.resource_name
+    ops.append(root_op)
+
+    # 2. Custom Label 3 OTHERS (negative - blocks all other shops)
+    dim_cl3_others = make_custom_label_dim(client, idx3)  # INDEX3 = Custom Label 3
+    # Don't set value - OTHERS case
+
+    ops.append(
+        create_listing_group_unit_biddable(
+            client=client,
+            customer_id=customer_id,
+            ad_group_id=ad_group_id_str,
+            parent_ad_group_criterion_resource_name=root_tmp,
+            listing_dimension_info=dim_cl3_others,
+            targeting_negative=True,  # NEGATIVE - blocks everything else
+            cpc_bid_micros=None
+        )
+    )
+
+    # 3. Specific shop name as POSITIVE unit
+    dim_shop = make_custom_label_dim(client, idx3, shop_name)  # INDEX3 = Custom Label 3
+
+    ops.append(
+        create_listing_group_unit_biddable(
+            client=client,
             customer_id=customer_id,
-            ad_group_id=str(ad_group_id),
-            parent_ad_group_criterion_resource_name=root_actual,
+            ad_group_id=ad_group_id_str,
+            parent_ad_group_criterion_resource_name=root_tmp,
             listing_dimension_info=dim_shop,
             targeting_negative=False,  # POSITIVE targeting
             cpc_bid_micros=default_bid_micros
         )
     )
 
-    agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops2)
-    print(f"   ✅ Tree rebuilt: ONLY targeting shop '{shop_name}'")
+    mutate_ad_group_criteria_with_retry(agc_service, customer_id, ops)
+    log.info("   ✅ Tree rebuilt: ONLY targeting shop '%s'", shop_name)
 
 
 def rebuild_tree_with_custom_label_3_exclusion(
@@ -635,18 +1187,17 @@ def rebuild_tree_with_custom_label_3_exclusion(
         shop_name: Shop name to exclude (custom label 3 value)
         default_bid_micros: Bid amount in micros
     """
-    print(f"   Rebuilding tree to EXCLUDE shop '{shop_name}' (custom label 3)")
+    log.info("   Rebuilding tree to EXCLUDE shop '%s' (custom label 3)", shop_name)
+    ad_group_id_str = str(ad_group_id)
 
     # Step 1: Read existing tree structure
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    ag_path = f"customers/{customer_id}/adGroups/{ad_group_id}"
 
+    # Only the columns read below are selected
     query = f"""
         SELECT
-            ad_group_criterion.resource_name,
             ad_group_criterion.listing_group.type,
-            ad_group_criterion.listing_group.parent_ad_group_criterion,
             ad_group_criterion.listing_group.case_value.product_custom_attribute.index,
             ad_group_criterion.listing_group.case_value.product_custom_attribute.value,
             ad_group_criterion.negative,
@@ -657,97 +1208,94 @@ def rebuild_tree_with_custom_label_3_exclusion(
     """
 
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
+        results = search_stream_rows(ga_service, customer_id, query)
     except Exception as e:
-        print(f"   ❌ Error reading existing tree: {e}")
+        log.error("   ❌ Error reading existing tree: %s", e)
         raise  # Re-raise exception so calling code can handle it properly
 
-    # Step 2: Collect ALL custom label structures to preserve (EXCEPT CL2/INDEX2 and CL3/INDEX3)
-    custom_label_structures = []
-    custom_label_subdivisions = []
+    # Step 2: Classify custom label nodes to preserve (EXCEPT CL2/INDEX2 and CL3/INDEX3)
+    # in a single pass, bucketed by (node type, custom label index)
+    buckets = defaultdict(list)
 
-    if results:
-        for row in results:
-            criterion = row.ad_group_criterion
-            lg = criterion.listing_group
-            case_val = lg.case_value
-
-            if (case_val and
-                case_val._pb.WhichOneof("dimension") == "product_custom_attribute"):
-                index_name = case_val.product_custom_attribute.index.name
-                value = case_val.product_custom_attribute.value
-
-                # Skip Custom Label 2 (INDEX2) and Custom Label 3 (INDEX3) - we're replacing them
-                # INDEX2 is the old (incorrect) shop name targeting, INDEX3 is the new (correct) one
-                if index_name == 'INDEX2' or index_name == 'INDEX3':
-                    continue
-
-                # Skip OTHERS cases (empty value)
-                if not value or value == '':
-                    continue
-
-                # Collect SUBDIVISION nodes separately
-                if lg.type_.name == 'SUBDIVISION':
-                    custom_label_subdivisions.append({
-                        'index': index_name,
-                        'value': value,
-                        'parent': lg.parent_ad_group_criterion if lg.parent_ad_group_criterion else None
-                    })
-
-                # Preserve all other custom label UNIT nodes (both negative and positive)
-                if lg.type_.name == 'UNIT':
-                    custom_label_structures.append({
-                        'index': index_name,
-                        'value': value,
-                        'negative': criterion.negative,
-                        'bid_micros': criterion.cpc_bid_micros
-                    })
-
-    if custom_label_subdivisions:
-        print(f"      ℹ️ Found {len(custom_label_subdivisions)} existing subdivision(s):")
-        for struct in custom_label_subdivisions:
-            print(f"         - {struct['index']}: '{struct['value']}' (SUBDIVISION)")
-
-    if custom_label_structures:
-        print(f"      ℹ️ Preserving {len(custom_label_structures)} existing UNIT structure(s):")
-        for struct in custom_label_structures:
-            neg_str = "[NEGATIVE]" if struct['negative'] else "[POSITIVE]"
-            print(f"         - {struct['index']}: '{struct['value']}' {neg_str}")
+    for row in results:
+        criterion = row.ad_group_criterion
+        lg = criterion.listing_group
+        case_val = lg.case_value
 
-    # Step 3: Remove old tree
-    safe_remove_entire_listing_tree(client, customer_id, str(ad_group_id))
-    # No sleep needed - API operations are synchronous
+        # proto-plus field presence: True only when the oneof is set to a custom attribute
+        if "product_custom_attribute" not in case_val:
+            continue
 
-    agc_service = client.get_service("AdGroupCriterionService")
+        index_name, value = _custom_attribute_fields(case_val.product_custom_attribute)
 
-    # Step 4: Rebuild tree hierarchically with preserved structures + CL3 exclusion
-    # Use SUBDIVISIONS to determine hierarchy, not UNIT nodes
+        # Skip Custom Label 2 (INDEX2) and Custom Label 3 (INDEX3) - we're replacing them
+        # INDEX2 is the old (incorrect) shop name targeting, INDEX3 is the new (correct) one
+        if index_name == 'INDEX2' or index_name == 'INDEX3':
+            continue
+
+        # Skip OTHERS cases (empty value)
+        if not value:
+            continue
+
+        type_name = lg.type_.name
+        node = {'index': index_name, 'value': value}
+        # Preserve custom label UNIT nodes (both negative and positive) with their bids
+        if type_name == 'UNIT':
+            node['negative'] = criterion.negative
+            node['bid_micros'] = criterion.cpc_bid_micros
+        buckets[(type_name, index_name)].append(node)
+
+    # Group subdivisions and UNIT structures by INDEX (dimension type)
+    cl0_subdivisions = buckets[('SUBDIVISION', 'INDEX0')]
+    cl1_subdivisions = buckets[('SUBDIVISION', 'INDEX1')]
+    cl0_units = buckets[('UNIT', 'INDEX0')]
+    cl1_units = buckets[('UNIT', 'INDEX1')]
+
+    subdivision_count = sum(len(nodes) for (type_name, _), nodes in buckets.items() if type_name == 'SUBDIVISION')
+    preserved_count = sum(len(nodes) for (type_name, _), nodes in buckets.items() if type_name == 'UNIT')
+
+    if subdivision_count:
+        log.info("      ℹ️ Found %s existing subdivision(s):", subdivision_count)
+        if log.isEnabledFor(logging.DEBUG):
+            for (type_name, _), nodes in buckets.items():
+                if type_name == 'SUBDIVISION':
+                    for struct in nodes:
+                        log.debug("         - %s: '%s' (SUBDIVISION)", struct['index'], struct['value'])
+
+    if preserved_count:
+        log.info("      ℹ️ Preserving %s existing UNIT structure(s):", preserved_count)
+        if log.isEnabledFor(logging.DEBUG):
+            for (type_name, _), nodes in buckets.items():
+                if type_name == 'UNIT':
+                    for struct in nodes:
+                        neg_str = "[NEGATIVE]" if struct['negative'] else "[POSITIVE]"
+                        log.debug("         - %s: '%s' %s", struct['index'], struct['value'], neg_str)
 
-    # Group subdivisions by INDEX (dimension type)
-    cl0_subdivisions = [s for s in custom_label_subdivisions if s['index'] == 'INDEX0']
-    cl1_subdivisions = [s for s in custom_label_subdivisions if s['index'] == 'INDEX1']
+    # Step 3: Remove old tree
+    ops = _start_tree_rebuild_ops(client, customer_id, ad_group_id)
 
-    # Group UNIT structures by INDEX
-    cl0_units = [s for s in custom_label_structures if s['index'] == 'INDEX0']
-    cl1_units = [s for s in custom_label_structures if s['index'] == 'INDEX1']
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    # Resolve the custom label index enums once instead of per node
+    index_enum = client.enums.ProductCustomAttributeIndexEnum
+    idx0, idx1, idx3 = index_enum.INDEX0, index_enum.INDEX1, index_enum.INDEX3
 
-    ops1 = []
+    # Step 4: Rebuild tree hierarchically with preserved structures + CL3 exclusion
+    # Use SUBDIVISIONS to determine hierarchy, not UNIT nodes
 
     # 1. ROOT SUBDIVISION
     root_op = create_listing_group_subdivision(
         client=client,
         customer_id=customer_id,
-        ad_group_id=str(ad_group_id),
+        ad_group_id=ad_group_id_str,
         parent_ad_group_criterion_resource_name=None,
         listing_dimension_info=None
     )
     root_tmp = root_op.create.resource_name
-    ops1.append(root_op)
+    ops.append(root_op)
 
     # Determine hierarchy based on SUBDIVISIONS (not units)
     current_parent_tmp = root_tmp
     deepest_subdivision_tmp = root_tmp
-    result_index_map = [0]  # Track which result index is which subdivision
 
     # If CL0 or CL1 subdivisions exist, rebuild them
     if cl0_subdivisions:
@@ -755,29 +1303,25 @@ def rebuild_tree_with_custom_label_3_exclusion(
         cl0_subdiv = cl0_subdivisions[0]
 
         # Create CL0 subdivision
-        dim_cl0 = client.get_type("ListingDimensionInfo")
-        dim_cl0.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX0
-        dim_cl0.product_custom_attribute.value = cl0_subdiv['value']
+        dim_cl0 = make_custom_label_dim(client, idx0, cl0_subdiv['value'])
 
         cl0_subdivision_op = create_listing_group_subdivision(
             client=client,
             customer_id=customer_id,
-            ad_group_id=str(ad_group_id),
+            ad_group_id=ad_group_id_str,
             parent_ad_group_criterion_resource_name=current_parent_tmp,
             listing_dimension_info=dim_cl0
         )
         cl0_subdivision_tmp = cl0_subdivision_op.create.resource_name
-        ops1.append(cl0_subdivision_op)
-        result_index_map.append(len(ops1) - 1)  # Track CL0 subdivision index
+        ops.append(cl0_subdivision_op)
 
         # Add CL0 OTHERS (negative)
-        dim_cl0_others = client.get_type("ListingDimensionInfo")
-        dim_cl0_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX0
-        ops1.append(
+        dim_cl0_others = make_custom_label_dim(client, idx0)
+        ops.append(
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
+                ad_group_id=ad_group_id_str,
                 parent_ad_group_criterion_resource_name=current_parent_tmp,
                 listing_dimension_info=dim_cl0_others,
                 targeting_negative=True,
@@ -793,29 +1337,25 @@ def rebuild_tree_with_custom_label_3_exclusion(
         cl1_subdiv = cl1_subdivisions[0]
 
         # Create CL1 subdivision
-        dim_cl1 = client.get_type("ListingDimensionInfo")
-        dim_cl1.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-        dim_cl1.product_custom_attribute.value = cl1_subdiv['value']
+        dim_cl1 = make_custom_label_dim(client, idx1, cl1_subdiv['value'])
 
         cl1_subdivision_op = create_listing_group_subdivision(
             client=client,
             customer_id=customer_id,
-            ad_group_id=str(ad_group_id),
+            ad_group_id=ad_group_id_str,
             parent_ad_group_criterion_resource_name=current_parent_tmp,
             listing_dimension_info=dim_cl1
         )
         cl1_subdivision_tmp = cl1_subdivision_op.create.resource_name
-        ops1.append(cl1_subdivision_op)
-        result_index_map.append(len(ops1) - 1)  # Track CL1 subdivision index
+        ops.append(cl1_subdivision_op)
 
         # Add CL1 OTHERS (negative)
-        dim_cl1_others = client.get_type("ListingDimensionInfo")
-        dim_cl1_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-        ops1.append(
+        dim_cl1_others = make_custom_label_dim(client, idx1)
+        ops.append(
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
+                ad_group_id=ad_group_id_str,
                 parent_ad_group_criterion_resource_name=current_parent_tmp,
                 listing_dimension_info=dim_cl1_others,
                 targeting_negative=True,
@@ -832,28 +1372,25 @@ def rebuild_tree_with_custom_label_3_exclusion(
         # For each CL0 unit, create as subdivision and add CL3 under it
         for unit in cl0_units:
             # Create CL0 subdivision (instead of unit)
-            dim_cl0_subdiv = client.get_type("ListingDimensionInfo")
-            dim_cl0_subdiv.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX0
-            dim_cl0_subdiv.product_custom_attribute.value = unit['value']
+            dim_cl0_subdiv = make_custom_label_dim(client, idx0, unit['value'])
 
             cl0_unit_subdivision_op = create_listing_group_subdivision(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
+                ad_group_id=ad_group_id_str,
                 parent_ad_group_criterion_resource_name=deepest_subdivision_tmp,
                 listing_dimension_info=dim_cl0_subdiv
             )
             cl0_unit_subdivision_tmp = cl0_unit_subdivision_op.create.resource_name
-            ops1.append(cl0_unit_subdivision_op)
+            ops.append(cl0_unit_subdivision_op)
 
             # Add CL3 OTHERS under this CL0 subdivision
-            dim_cl3_others = client.get_type("ListingDimensionInfo")
-            dim_cl3_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-            ops1.append(
+            dim_cl3_others = make_custom_label_dim(client, idx3)
+            ops.append(
                 create_listing_group_unit_biddable(
                     client=client,
                     customer_id=customer_id,
-                    ad_group_id=str(ad_group_id),
+                    ad_group_id=ad_group_id_str,
                     parent_ad_group_criterion_resource_name=cl0_unit_subdivision_tmp,
                     listing_dimension_info=dim_cl3_others,
                     targeting_negative=False,
@@ -861,14 +1398,27 @@ def rebuild_tree_with_custom_label_3_exclusion(
                 )
             )
 
+            # Add shop exclusion under this CL0 subdivision (same request, via temp name)
+            dim_shop = make_custom_label_dim(client, idx3, shop_name)
+            ops.append(
+                create_listing_group_unit_biddable(
+                    client=client,
+                    customer_id=customer_id,
+                    ad_group_id=ad_group_id_str,
+                    parent_ad_group_criterion_resource_name=cl0_unit_subdivision_tmp,
+                    listing_dimension_info=dim_shop,
+                    targeting_negative=True,
+                    cpc_bid_micros=None
+                )
+            )
+
         # Add CL0 OTHERS (negative) under deepest subdivision
-        dim_cl0_others = client.get_type("ListingDimensionInfo")
-        dim_cl0_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX0
-        ops1.append(
+        dim_cl0_others = make_custom_label_dim(client, idx0)
+        ops.append(
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
+                ad_group_id=ad_group_id_str,
                 parent_ad_group_criterion_resource_name=deepest_subdivision_tmp,
                 listing_dimension_info=dim_cl0_others,
                 targeting_negative=True,
@@ -877,13 +1427,12 @@ def rebuild_tree_with_custom_label_3_exclusion(
         )
     else:
         # No CL0 units - just add CL3 directly under deepest subdivision
-        dim_cl3_others = client.get_type("ListingDimensionInfo")
-        dim_cl3_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-        ops1.append(
+        dim_cl3_others = make_custom_label_dim(client, idx3)
+        ops.append(
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
+                ad_group_id=ad_group_id_str,
                 parent_ad_group_criterion_resource_name=deepest_subdivision_tmp,
                 listing_dimension_info=dim_cl3_others,
                 targeting_negative=False,
@@ -891,152 +1440,91 @@ def rebuild_tree_with_custom_label_3_exclusion(
             )
         )
 
-    # Execute first mutate
-    try:
-        resp1 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops1)
-    except Exception as e:
-        print(f"   ❌ Error rebuilding tree: {e}")
-        raise  # Re-raise exception so calling code can handle it properly
-
-    # No sleep needed - API operations are synchronous
-
-    # MUTATE 2: Add shop exclusion under each CL0 subdivision (if they exist)
-    ops2 = []
-
-    if cl0_units:
-        # We created CL0 subdivisions - need to find their actual resource names and add exclusion to each
-        # Calculate the index of the first CL0 subdivision in results
-        base_index = 1  # Start after ROOT
-        if cl0_subdivisions:
-            base_index += 2  # CL0 subdivision + CL0 OTHERS
-        if cl1_subdivisions:
-            base_index += 2  # CL1 subdivision + CL1 OTHERS
-
-        # Each CL0 unit became: CL0 subdivision + CL3 OTHERS
-        # So CL0 subdivisions are at: base_index, base_index+2, base_index+4, ...
-        for i, unit in enumerate(cl0_units):
-            cl0_subdivision_actual = resp1.results[base_index + (i * 2)].resource_name
-
-            dim_shop = client.get_type("ListingDimensionInfo")
-            dim_shop.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-            dim_shop.product_custom_attribute.value = shop_name
-            ops2.append(
-                create_listing_group_unit_biddable(
-                    client=client,
-                    customer_id=customer_id,
-                    ad_group_id=str(ad_group_id),
-                    parent_ad_group_criterion_resource_name=cl0_subdivision_actual,
-                    listing_dimension_info=dim_shop,
-                    targeting_negative=True,
-                    cpc_bid_micros=None
-                )
-            )
-    else:
-        # No CL0 units - add exclusion under the deepest subdivision (CL1 or ROOT)
-        if cl1_subdivisions:
-            if cl0_subdivisions:
-                deepest_subdivision_actual = resp1.results[3].resource_name  # ROOT, CL0 subdivision, CL0 OTHERS, CL1 subdivision
-            else:
-                deepest_subdivision_actual = resp1.results[1].resource_name  # ROOT, CL1 subdivision
-        elif cl0_subdivisions:
-            deepest_subdivision_actual = resp1.results[1].resource_name  # ROOT, CL0 subdivision
-        else:
-            deepest_subdivision_actual = resp1.results[0].resource_name  # ROOT
-
-        dim_shop = client.get_type("ListingDimensionInfo")
-        dim_shop.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-        dim_shop.product_custom_attribute.value = shop_name
-        ops2.append(
+        # Add shop exclusion under the deepest subdivision (CL1, CL0 or ROOT)
+        dim_shop = make_custom_label_dim(client, idx3, shop_name)
+        ops.append(
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
-                parent_ad_group_criterion_resource_name=deepest_subdivision_actual,
+                ad_group_id=ad_group_id_str,
+                parent_ad_group_criterion_resource_name=deepest_subdivision_tmp,
                 listing_dimension_info=dim_shop,
                 targeting_negative=True,
                 cpc_bid_micros=None
             )
         )
 
+    # Execute the whole rebuild (structure + shop exclusion) in a single mutate.
+    # Parents are referenced through temporary resource names, so no
+    # result-index bookkeeping or second round trip is needed.
     try:
-        agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops2)
+        mutate_ad_group_criteria_with_retry(agc_service, customer_id, ops)
     except Exception as e:
-        print(f"   ❌ Error adding shop exclusion: {e}")
+        log.error("   ❌ Error rebuilding tree: %s", e)
         raise  # Re-raise exception so calling code can handle it properly
 
-    preserved_count = len(custom_label_structures)
     if preserved_count > 0:
-        print(f"   ✅ Tree rebuilt: EXCLUDING shop '{shop_name}', preserved {preserved_count} existing structure(s)")
+        log.info("   ✅ Tree rebuilt: EXCLUDING shop '%s', preserved %s existing structure(s)", shop_name, preserved_count)
     else:
-        print(f"   ✅ Tree rebuilt: EXCLUDING shop '{shop_name}', showing all others.")
-
-
-def rebuild_tree_with_shop_exclusions(
-    client: GoogleAdsClient,
-    customer_id: str,
-    ad_group_id: int,
-    shop_names: list,
-    required_cl0_value: str = None,
-    default_bid_micros: int = DEFAULT_BID_MICROS
-):
-    """
-    Rebuild listing tree with CL3 shop exclusions while preserving item ID exclusions.
-    Validates and enforces CL0 and CL1 targeting based on Excel data and ad group name.
+        log.info("   ✅ Tree rebuilt: EXCLUDING shop '%s', showing all others.", shop_name)
 
-    Tree structure (with item IDs):
-    ROOT (subdivision)
-    ├─ CL0 = diepste_cat_id (subdivision) - from Excel column D
-    │  ├─ CL1 = custom_label_1 (subdivision) - from ad group name suffix
-    │  │  ├─ CL3 = shop1 (unit, negative) - exclude shop 1
-    │  │  ├─ CL3 = shop2 (unit, negative) - exclude shop 2
-    │  │  └─ CL3 OTHERS (subdivision) - for all other shops:
-    │  │     ├─ ITEM_ID = xxx (unit, negative) - preserved exclusions
-    │  │     ├─ ITEM_ID = yyy (unit, negative) - preserved exclusions
-    │  │     └─ ITEM_ID OTHERS (unit, positive with bid)
-    │  └─ CL1 OTHERS (unit, negative)
-    └─ CL0 OTHERS (unit, negative)
 
-    Args:
-        client: Google Ads client
-        customer_id: Customer ID
-        ad_group_id: Ad group ID
-        shop_names: List of shop names to exclude (CL3 values)
-        required_cl0_value: Required CL0 value from Excel (diepste_cat_id)
-        default_bid_micros: Bid amount in micros
-    """
-    print(f"   Rebuilding tree to EXCLUDE {len(shop_names)} shop(s): {', '.join(shop_names)}")
+# Recently read ad group tree structure, keyed by (customer_id, ad_group_id)
+# Value: (timestamp, meta dict) - see _read_ad_group_tree_meta
+AD_GROUP_META_TTL_SECONDS = 60
+_ad_group_meta_cache = {}
 
-    # Step 1: Get ad group name to check for CL1 suffix requirement
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
 
-    # Query ad group name
-    ag_name_query = f"""
-        SELECT ad_group.name
-        FROM ad_group
-        WHERE ad_group.id = {ad_group_id}
-    """
+def _get_cached_ad_group_meta(cache_key: tuple) -> Optional[dict]:
+    """Return cached ad group tree meta if it is younger than the TTL."""
+    cached = _ad_group_meta_cache.get(cache_key)
+    if cached and time.time() - cached[0] < AD_GROUP_META_TTL_SECONDS:
+        return cached[1]
+    return None
 
-    try:
-        ag_results = list(ga_service.search(customer_id=customer_id, query=ag_name_query))
-        ad_group_name = ag_results[0].ad_group.name if ag_results else None
-    except Exception as e:
-        print(f"   ⚠️  Warning: Could not read ad group name: {e}")
-        ad_group_name = None
 
-    # Check if ad group name ends with _a, _b, or _c
-    required_cl1 = None
+def _required_cl1_from_ad_group_name(ad_group_name: Optional[str]) -> Optional[str]:
+    """Return 'a', 'b' or 'c' if the ad group name ends with _a, _b or _c, else None."""
     if ad_group_name:
         for suffix in ['_a', '_b', '_c']:
             if ad_group_name.endswith(suffix):
-                required_cl1 = suffix[1:]  # Remove underscore: "_a" → "a"
-                print(f"   📌 Ad group name ends with '{suffix}' → CL1 must be '{required_cl1}'")
-                break
+                return suffix[1:]  # Remove underscore: "_a" → "a"
+    return None
+
+
+def _clean_listing_values(values: list, label: str) -> list:
+    """
+    Order-preserving dedupe of listing dimension values, dropping empty values
+    and values longer than MAX_LISTING_VALUE_LENGTH. Each duplicate would
+    otherwise become its own operation and fail the mutate.
+    """
+    cleaned = [
+        str(value) for value in dict.fromkeys(values)
+        if value and len(str(value)) <= MAX_LISTING_VALUE_LENGTH
+    ]
+    removed = len(values) - len(cleaned)
+    if removed:
+        log.info("   🧹 Dropped %s duplicate/invalid %s", removed, label)
+    return cleaned
+
+
+def _read_ad_group_tree_meta(client: GoogleAdsClient, customer_id: str, ad_group_id) -> dict:
+    """
+    Read the ad group name and the parts of its listing tree that
+    rebuild_tree_with_shop_exclusions preserves.
+
+    Returns:
+        dict with ad_group_name, cl0_value, cl1_value, existing_bid (None if no
+        positive bid found), item_id_exclusions and existing_shop_exclusions
+    """
+    # Read existing tree AND ad group name in one query
+    # (ad_group.name is in scope for ad_group_criterion rows)
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    ag_path = f"customers/{customer_id}/adGroups/{ad_group_id}"
 
-    # Step 2: Read existing tree to find CL0, CL1, and item ID exclusions
     query = f"""
         SELECT
+            ad_group.name,
             ad_group_criterion.listing_group.type,
             ad_group_criterion.listing_group.case_value.product_item_id.value,
             ad_group_criterion.listing_group.case_value.product_custom_attribute.index,
@@ -1049,31 +1537,57 @@ def rebuild_tree_with_shop_exclusions(
     """
 
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
+        results = search_stream_rows(ga_service, customer_id, query)
     except Exception as e:
         print(f"   ❌ Error reading existing tree: {e}")
         raise
 
+    if results:
+        ad_group_name = results[0].ad_group.name
+    else:
+        # No listing tree yet - fall back to a direct ad group name lookup
+        ag_name_query = f"""
+            SELECT ad_group.name
+            FROM ad_group
+            WHERE ad_group.id = {ad_group_id}
+            LIMIT 1
+        """
+        try:
+            # Only the first row is needed - don't drain the response into a list
+            ad_group_name = next(
+                (row.ad_group.name for row in ga_service.search(customer_id=customer_id, query=ag_name_query)),
+                None
+            )
+        except Exception as e:
+            print(f"   ⚠️  Warning: Could not read ad group name: {e}")
+            ad_group_name = None
+
     # Extract CL0, CL1, item IDs, existing shop exclusions, and bid from existing tree
     cl0_value = None
     cl1_value = None
-    existing_bid = default_bid_micros
+    existing_bid = None
     item_id_exclusions = []  # List of item IDs to preserve
     existing_shop_exclusions = []  # List of existing CL3 shop exclusions to preserve
 
     for row in results:
-        case_value = row.ad_group_criterion.listing_group.case_value
+        # Bind the nested fields once per row
+        criterion = row.ad_group_criterion
+        lg = criterion.listing_group
+        case_value = lg.case_value
+        negative = criterion.negative
 
         # Check for item ID
-        if case_value.product_item_id.value:
+        item_id = case_value.product_item_id.value
+        if item_id:
             # Only preserve NEGATIVE item IDs (exclusions)
-            if row.ad_group_criterion.negative:
-                item_id_exclusions.append(case_value.product_item_id.value)
+            if negative:
+                item_id_exclusions.append(item_id)
 
         # Check for custom attributes (CL0-CL4)
-        if case_value.product_custom_attribute:
-            index = case_value.product_custom_attribute.index.name
-            value = case_value.product_custom_attribute.value
+        pca = case_value.product_custom_attribute
+        if pca:
+            index, value = _custom_attribute_fields(pca)
+            is_unit = lg.type_.name == 'UNIT'
 
             # Get CL0 and CL1 from any node (subdivision or unit)
             if index == 'INDEX0' and value:
@@ -1082,113 +1596,84 @@ def rebuild_tree_with_shop_exclusions(
                 cl1_value = value
             # Capture existing CL3 shop exclusions (NEGATIVE units with value, not OTHERS)
             elif index == 'INDEX3' and value:
-                if (row.ad_group_criterion.listing_group.type.name == 'UNIT' and
-                    row.ad_group_criterion.negative):
+                if is_unit and negative:
                     existing_shop_exclusions.append(value)
 
             # Capture existing bid from positive units only
-            if (row.ad_group_criterion.listing_group.type.name == 'UNIT' and
-                not row.ad_group_criterion.negative and
-                row.ad_group_criterion.cpc_bid_micros):
-                existing_bid = row.ad_group_criterion.cpc_bid_micros
-
-    # Override CL0 if required value is specified from Excel
-    if required_cl0_value:
-        if cl0_value and cl0_value != required_cl0_value:
-            print(f"   ⚠️  Overriding existing CL0='{cl0_value}' with required CL0='{required_cl0_value}' (from Excel diepste_cat_id)")
-        cl0_value = required_cl0_value
-
-    # Override CL1 if ad group name requires specific value
-    if required_cl1:
-        if cl1_value and cl1_value != required_cl1:
-            print(f"   ⚠️  Overriding existing CL1='{cl1_value}' with required CL1='{required_cl1}' (from ad group name)")
-        cl1_value = required_cl1
-
-    # Validate we have required values
-    if not cl0_value:
-        if required_cl0_value:
-            cl0_value = required_cl0_value
-        else:
-            raise Exception(f"Could not find CL0 value in existing tree and Excel doesn't specify one")
-    if not cl1_value:
-        raise Exception(f"Could not find CL1 value in existing tree and ad group name doesn't specify one")
+            if is_unit and not negative:
+                bid_micros = criterion.cpc_bid_micros
+                if bid_micros:
+                    existing_bid = bid_micros
+
+    return {
+        'ad_group_name': ad_group_name,
+        'cl0_value': cl0_value,
+        'cl1_value': cl1_value,
+        'existing_bid': existing_bid,
+        'item_id_exclusions': item_id_exclusions,
+        'existing_shop_exclusions': existing_shop_exclusions
+    }
 
-    # Log what we found
-    print(f"   Found existing structure: CL0={cl0_value}, CL1={cl1_value}, bid={existing_bid/10000:.2f}€")
-    if existing_shop_exclusions:
-        print(f"   Found {len(existing_shop_exclusions)} existing shop exclusion(s): {', '.join(existing_shop_exclusions)}")
-    if item_id_exclusions:
-        print(f"   Found {len(item_id_exclusions)} item ID exclusion(s)")
 
-    # Merge new shop exclusions with existing ones (preserve all existing)
-    # IMPORTANT: Use lowercase for comparison to avoid duplicates due to case differences
-    existing_lower = {shop.lower(): shop for shop in existing_shop_exclusions}  # Map lowercase to original
-    all_shop_exclusions = set(existing_shop_exclusions)  # Start with existing (preserve original case)
-    new_shops_added = []
+def _shop_exclusion_tree_operations(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id_str: str,
+    cl0_value: str,
+    cl1_value: str,
+    bid_micros: int,
+    shop_names: list,
+    item_id_exclusions: list
+) -> list:
+    """
+    Build the CREATE operations for a CL0 > CL1 > CL3 shop exclusion tree.
 
-    for shop in shop_names:
-        shop_lower = shop.lower()
-        if shop_lower not in existing_lower:
-            all_shop_exclusions.add(shop)
-            existing_lower[shop_lower] = shop  # Track this one too
-            new_shops_added.append(shop)
+    See rebuild_tree_with_shop_exclusions for the tree structure. Returns the
+    operations in parent-before-child order, ready for one mutate or batch job.
+    """
+    has_item_ids = len(item_id_exclusions) > 0
 
-    if new_shops_added:
-        print(f"   Adding {len(new_shops_added)} new shop exclusion(s): {', '.join(new_shops_added)}")
-    else:
-        print(f"   No new shop exclusions to add (all {len(shop_names)} already exist)")
+    # Resolve the custom label index enums once instead of per node
+    index_enum = client.enums.ProductCustomAttributeIndexEnum
+    idx0, idx1, idx3 = index_enum.INDEX0, index_enum.INDEX1, index_enum.INDEX3
 
-    # Convert back to sorted list for consistent ordering (case-insensitive sort)
-    shop_names = sorted(all_shop_exclusions, key=str.lower)
-    print(f"   Total shop exclusions after merge: {len(shop_names)}")
+    # Build the whole tree as ONE mutate request. Every child references its
+    # parent through the parent's temporary resource name, so the API resolves
+    # the hierarchy server-side in a single round trip.
 
-    # Step 3: Remove entire tree
-    safe_remove_entire_listing_tree(client, customer_id, str(ad_group_id))
-    print(f"   Removed existing tree")
-
-    # Step 4: Rebuild tree with shop exclusions and preserved item IDs
-    has_item_ids = len(item_id_exclusions) > 0
-
-    # Rebuild tree with multiple shop exclusions
-    agc_service = client.get_service("AdGroupCriterionService")
-
-    # MUTATE 1: Create ROOT + CL0 subdivision + CL0 OTHERS (satisfies CL0) + ROOT OTHERS
-    ops1 = []
+    # ROOT + CL0 subdivision + CL1 OTHERS (satisfies CL0) + CL0 OTHERS (satisfies ROOT)
 
     # ROOT subdivision
     root_op = create_listing_group_subdivision(
         client=client,
         customer_id=customer_id,
-        ad_group_id=str(ad_group_id),
+        ad_group_id=ad_group_id_str,
         parent_ad_group_criterion_resource_name=None,
         listing_dimension_info=None
     )
     root_tmp = root_op.create.resource_name
-    ops1.append(root_op)
+    ops = [root_op]
 
     # CL0 subdivision (under ROOT)
-    dim_cl0 = client.get_type("ListingDimensionInfo")
-    dim_cl0.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX0
-    dim_cl0.product_custom_attribute.value = str(cl0_value)
+    dim_cl0 = make_custom_label_dim(client, idx0, str(cl0_value))
 
     cl0_subdivision_op = create_listing_group_subdivision(
         client=client,
         customer_id=customer_id,
-        ad_group_id=str(ad_group_id),
+        ad_group_id=ad_group_id_str,
         parent_ad_group_criterion_resource_name=root_tmp,
         listing_dimension_info=dim_cl0
     )
     cl0_subdivision_tmp = cl0_subdivision_op.create.resource_name
-    ops1.append(cl0_subdivision_op)
+    ops.append(cl0_subdivision_op)
 
     # CL1 OTHERS (negative - under CL0) - This satisfies CL0 subdivision requirement
-    dim_cl1_others_temp = client.get_type("ListingDimensionInfo")
-    dim_cl1_others_temp.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-    ops1.append(
+    dim_cl1_others_temp = make_custom_label_dim(client, idx1)
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
-            ad_group_id=str(ad_group_id),
+            ad_group_id=ad_group_id_str,
             parent_ad_group_criterion_resource_name=cl0_subdivision_tmp,  # Under CL0!
             listing_dimension_info=dim_cl1_others_temp,
             targeting_negative=True,
@@ -1197,13 +1682,12 @@ def rebuild_tree_with_shop_exclusions(
     )
 
     # CL0 OTHERS (negative - under ROOT) - This satisfies ROOT subdivision requirement
-    dim_cl0_others = client.get_type("ListingDimensionInfo")
-    dim_cl0_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX0
-    ops1.append(
+    dim_cl0_others = make_custom_label_dim(client, idx0)
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
-            ad_group_id=str(ad_group_id),
+            ad_group_id=ad_group_id_str,
             parent_ad_group_criterion_resource_name=root_tmp,  # Under ROOT
             listing_dimension_info=dim_cl0_others,
             targeting_negative=True,
@@ -1211,207 +1695,923 @@ def rebuild_tree_with_shop_exclusions(
         )
     )
 
-    try:
-        response1 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops1)
-        cl0_actual = response1.results[1].resource_name
-    except Exception as e:
-        raise Exception(f"Error creating ROOT and CL0: {e}")
-
-    # MUTATE 2: Create CL1 subdivision + CL3 OTHERS (subdivision if item IDs, else unit)
-    ops2 = []
+    # CL1 subdivision + CL3 OTHERS (subdivision if item IDs, else unit)
 
     # CL1 subdivision (specific value, e.g., "b")
-    dim_cl1 = client.get_type("ListingDimensionInfo")
-    dim_cl1.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-    dim_cl1.product_custom_attribute.value = str(cl1_value)
+    dim_cl1 = make_custom_label_dim(client, idx1, str(cl1_value))
 
     cl1_subdivision_op = create_listing_group_subdivision(
         client=client,
         customer_id=customer_id,
-        ad_group_id=str(ad_group_id),
-        parent_ad_group_criterion_resource_name=cl0_actual,
+        ad_group_id=ad_group_id_str,
+        parent_ad_group_criterion_resource_name=cl0_subdivision_tmp,
         listing_dimension_info=dim_cl1
     )
     cl1_subdivision_tmp = cl1_subdivision_op.create.resource_name
-    ops2.append(cl1_subdivision_op)
+    ops.append(cl1_subdivision_op)
 
     # CL3 OTHERS - subdivision if item IDs exist, else unit
-    dim_cl3_others = client.get_type("ListingDimensionInfo")
-    dim_cl3_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
+    dim_cl3_others = make_custom_label_dim(client, idx3)
 
     if has_item_ids:
         # Create as SUBDIVISION to hold item ID exclusions underneath
         cl3_others_op = create_listing_group_subdivision(
             client=client,
             customer_id=customer_id,
-            ad_group_id=str(ad_group_id),
+            ad_group_id=ad_group_id_str,
             parent_ad_group_criterion_resource_name=cl1_subdivision_tmp,
             listing_dimension_info=dim_cl3_others
         )
         cl3_others_tmp = cl3_others_op.create.resource_name
-        ops2.append(cl3_others_op)
+        ops.append(cl3_others_op)
 
         # Add ITEM_ID OTHERS under CL3 OTHERS to satisfy subdivision requirement
-        dim_item_others = client.get_type("ListingDimensionInfo")
-        dim_item_others.product_item_id = client.get_type("ProductItemIdInfo")
-        # Don't set value - this makes it OTHERS
-        ops2.append(
+        dim_item_others = make_item_id_dim(client)  # No value - this makes it OTHERS
+        ops.append(
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
+                ad_group_id=ad_group_id_str,
                 parent_ad_group_criterion_resource_name=cl3_others_tmp,
                 listing_dimension_info=dim_item_others,
                 targeting_negative=False,  # Positive
-                cpc_bid_micros=existing_bid
+                cpc_bid_micros=bid_micros
             )
         )
     else:
         # Create as UNIT with bid (no item IDs to preserve)
-        ops2.append(
+        ops.append(
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
+                ad_group_id=ad_group_id_str,
                 parent_ad_group_criterion_resource_name=cl1_subdivision_tmp,
                 listing_dimension_info=dim_cl3_others,
                 targeting_negative=False,  # Positive
-                cpc_bid_micros=existing_bid
+                cpc_bid_micros=bid_micros
             )
         )
 
-    try:
-        response2 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops2)
-        cl1_actual = response2.results[0].resource_name
-        if has_item_ids:
-            cl3_others_actual = response2.results[1].resource_name  # Get actual CL3 OTHERS resource name
-    except Exception as e:
-        raise Exception(f"Error creating CL1 and CL3 OTHERS: {e}")
-
-    # MUTATE 3: Add individual shop exclusions (CL3 OTHERS already exists from MUTATE 2)
-    ops3 = []
+    # Add each shop as a negative CL3 unit under CL1
+    ops.extend(cl3_exclusion_operations(client, customer_id, ad_group_id_str, cl1_subdivision_tmp, shop_names))
 
-    # Add each shop as a negative CL3 unit
-    for shop in shop_names:
-        dim_cl3_shop = client.get_type("ListingDimensionInfo")
-        dim_cl3_shop.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-        dim_cl3_shop.product_custom_attribute.value = str(shop)
-
-        ops3.append(
+    # Add item ID exclusions under CL3 OTHERS (if any exist)
+    if has_item_ids:
+        # Add each item ID as a negative unit under CL3 OTHERS
+        ops.extend([
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
-                ad_group_id=str(ad_group_id),
-                parent_ad_group_criterion_resource_name=cl1_actual,
-                listing_dimension_info=dim_cl3_shop,
-                targeting_negative=True,  # NEGATIVE = exclude this shop
+                ad_group_id=ad_group_id_str,
+                parent_ad_group_criterion_resource_name=cl3_others_tmp,
+                listing_dimension_info=make_item_id_dim(client, item_id),
+                targeting_negative=True,  # NEGATIVE = exclude this item ID
                 cpc_bid_micros=None
             )
-        )
+            for item_id in item_id_exclusions
+        ])
+
+    return ops
+
+
+def rebuild_tree_with_shop_exclusions(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id: int,
+    shop_names: list,
+    required_cl0_value: str = None,
+    default_bid_micros: int = DEFAULT_BID_MICROS,
+    ad_group_name: str = None,
+    existing_item_ids: list = None,
+    existing_shop_exclusions: list = None,
+    existing_bid: int = None,
+    scheduler: "RebuildScheduler" = None
+):
+    """
+    Rebuild listing tree with CL3 shop exclusions while preserving item ID exclusions.
+    Validates and enforces CL0 and CL1 targeting based on Excel data and ad group name.
+
+    Tree structure (with item IDs):
+    ROOT (subdivision)
+    ├─ CL0 = diepste_cat_id (subdivision) - from Excel column D
+    │  ├─ CL1 = custom_label_1 (subdivision) - from ad group name suffix
+    │  │  ├─ CL3 = shop1 (unit, negative) - exclude shop 1
+    │  │  ├─ CL3 = shop2 (unit, negative) - exclude shop 2
+    │  │  └─ CL3 OTHERS (subdivision) - for all other shops:
+    │  │     ├─ ITEM_ID = xxx (unit, negative) - preserved exclusions
+    │  │     ├─ ITEM_ID = yyy (unit, negative) - preserved exclusions
+    │  │     └─ ITEM_ID OTHERS (unit, positive with bid)
+    │  └─ CL1 OTHERS (unit, negative)
+    └─ CL0 OTHERS (unit, negative)
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_id: Ad group ID
+        shop_names: List of shop names to exclude (CL3 values)
+        required_cl0_value: Required CL0 value from Excel (diepste_cat_id)
+        default_bid_micros: Bid amount in micros
+        ad_group_name: Ad group name, if the caller already knows it
+        existing_item_ids: Item ID exclusions currently in the tree
+        existing_shop_exclusions: CL3 shop exclusions currently in the tree
+        existing_bid: Current bid in micros of the positive unit
+        scheduler: Optional RebuildScheduler that coalesces this mutate with
+            rebuilds from other threads into one request
+
+    If required_cl0_value is given, ad_group_name ends with _a/_b/_c and all
+    three existing_* values are given, the existing tree is NOT read.
+
+    Trees with more than MAX_OPS_PER_MUTATE exclusions are rebuilt through a
+    dedicated batch job, since they don't fit in a single mutate.
+    """
+    # Drop duplicate/invalid input before any API call
+    shop_names = _clean_listing_values(shop_names, "shop name(s)")
+    log.info("   Rebuilding tree to EXCLUDE %s shop(s): %s", len(shop_names), ', '.join(shop_names))
+    ad_group_id_str = str(ad_group_id)
+
+    # Step 1: Use caller-provided structure, a recent read, or read the tree + ad group name
+    cache_key = (customer_id, ad_group_id_str)
+    if (required_cl0_value and _required_cl1_from_ad_group_name(ad_group_name)
+            and existing_item_ids is not None
+            and existing_shop_exclusions is not None
+            and existing_bid is not None):
+        meta = {
+            'ad_group_name': ad_group_name,
+            'cl0_value': None,
+            'cl1_value': None,
+            'existing_bid': existing_bid,
+            'item_id_exclusions': existing_item_ids,
+            'existing_shop_exclusions': existing_shop_exclusions
+        }
+        log.info("   ⏭️  Using caller-provided tree structure (skipping tree read)")
+    else:
+        meta = _get_cached_ad_group_meta(cache_key)
+        if meta is None:
+            meta = _read_ad_group_tree_meta(client, customer_id, ad_group_id)
+        else:
+            log.info("   ♻️  Using cached tree structure (read < %ss ago)", AD_GROUP_META_TTL_SECONDS)
+
+    ad_group_name = meta['ad_group_name']
+    cl0_value = meta['cl0_value']
+    cl1_value = meta['cl1_value']
+    existing_bid = meta['existing_bid'] or default_bid_micros
+    item_id_exclusions = _clean_listing_values(meta['item_id_exclusions'], "item ID(s)")  # Item IDs to preserve
+    existing_shop_exclusions = list(meta['existing_shop_exclusions'])  # Existing CL3 shop exclusions to preserve
+
+    # Step 2: Check if ad group name ends with _a, _b, or _c
+    required_cl1 = _required_cl1_from_ad_group_name(ad_group_name)
+    if required_cl1:
+        log.info("   📌 Ad group name ends with '_%s' → CL1 must be '%s'", required_cl1, required_cl1)
+
+    # Override CL0 if required value is specified from Excel
+    if required_cl0_value:
+        if cl0_value and cl0_value != required_cl0_value:
+            log.warning("   ⚠️  Overriding existing CL0='%s' with required CL0='%s' (from Excel diepste_cat_id)", cl0_value, required_cl0_value)
+        cl0_value = required_cl0_value
+
+    # Override CL1 if ad group name requires specific value
+    if required_cl1:
+        if cl1_value and cl1_value != required_cl1:
+            log.warning("   ⚠️  Overriding existing CL1='%s' with required CL1='%s' (from ad group name)", cl1_value, required_cl1)
+        cl1_value = required_cl1
+
+    # Validate we have required values
+    if not cl0_value:
+        if required_cl0_value:
+            cl0_value = required_cl0_value
+        else:
+            raise Exception(f"Could not find CL0 value in existing tree and Excel doesn't specify one")
+    if not cl1_value:
+        raise Exception(f"Could not find CL1 value in existing tree and ad group name doesn't specify one")
+
+    # Log what we found
+    log.info("   Found existing structure: CL0=%s, CL1=%s, bid=%.2f€", cl0_value, cl1_value, existing_bid / 10000)
+    if existing_shop_exclusions:
+        log.info("   Found %s existing shop exclusion(s): %s", len(existing_shop_exclusions), ', '.join(existing_shop_exclusions))
+    if item_id_exclusions:
+        log.info("   Found %s item ID exclusion(s)", len(item_id_exclusions))
+
+    previous_shop_exclusions = list(existing_shop_exclusions)
+
+    # Merge new shop exclusions with existing ones (preserve all existing)
+    # IMPORTANT: Compare casefolded names to avoid duplicates due to case differences
+    # (casefold also handles cases .lower() misses, e.g. German ß)
+    merged_shops = {shop.casefold(): shop for shop in existing_shop_exclusions}  # Map casefolded to original
+    new_shops_added = []
+
+    for shop in shop_names:
+        shop_key = shop.casefold()
+        if shop_key not in merged_shops:
+            merged_shops[shop_key] = shop
+            new_shops_added.append(shop)
+
+    if new_shops_added:
+        log.info("   Adding %s new shop exclusion(s): %s", len(new_shops_added), ', '.join(new_shops_added))
+    else:
+        log.info("   No new shop exclusions to add (all %s already exist)", len(shop_names))
+
+    # Convert back to sorted list for consistent ordering (case-insensitive sort)
+    shop_names = sorted(merged_shops.values(), key=str.casefold)
+    log.info("   Total shop exclusions after merge: %s", len(shop_names))
+
+    # Trees too large for one mutate are rebuilt through their own batch job
+    in_batch_job = len(shop_names) + len(item_id_exclusions) > MAX_OPS_PER_MUTATE
+    if in_batch_job:
+        log.info("   📦 %s exclusion(s) exceed one mutate - rebuilding via batch job",
+                 len(shop_names) + len(item_id_exclusions))
+
+    # Step 3: Remove entire tree (or queue its removal when batching)
+    ops = _start_tree_rebuild_ops(client, customer_id, ad_group_id, in_batch_job)
+    if not in_batch_job:
+        log.info("   Removed existing tree")
+
+    # Step 4: Rebuild tree with shop exclusions and preserved item IDs
+    has_item_ids = len(item_id_exclusions) > 0
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ops.extend(_shop_exclusion_tree_operations(
+        client, customer_id, ad_group_id_str, cl0_value, cl1_value, existing_bid,
+        shop_names, item_id_exclusions
+    ))
 
-    # Execute shop exclusions
     try:
-        agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops3)
+        if in_batch_job:
+            batch_result = run_criterion_batch_job(client, customer_id, ops)
+            if batch_result['errors']:
+                # Batch jobs aren't atomic: the old root may be gone while part of
+                # the new tree failed, so put the previous structure back
+                _restore_shop_exclusion_tree(
+                    client, customer_id, ad_group_id_str,
+                    meta['cl0_value'] or cl0_value, meta['cl1_value'] or cl1_value, existing_bid,
+                    previous_shop_exclusions, item_id_exclusions
+                )
+                raise Exception(f"{len(batch_result['errors'])} batch job operation(s) failed: "
+                                f"{batch_result['errors'][0][1]}")
+        else:
+            _mutate_rebuild_ops(agc_service, customer_id, ops, scheduler)
     except Exception as e:
-        raise Exception(f"Error adding shop exclusions: {e}")
+        _ad_group_meta_cache.pop(cache_key, None)
+        raise Exception(f"Error rebuilding tree with shop exclusions: {e}")
+
+    # We just wrote the tree, so we know its structure: cache it for the next call
+    _ad_group_meta_cache[cache_key] = (time.time(), {
+        'ad_group_name': ad_group_name,
+        'cl0_value': cl0_value,
+        'cl1_value': cl1_value,
+        'existing_bid': existing_bid,
+        'item_id_exclusions': item_id_exclusions,
+        'existing_shop_exclusions': shop_names
+    })
 
-    # MUTATE 4: Add item ID exclusions under CL3 OTHERS (if any exist)
     if has_item_ids:
-        ops4 = []
+        log.info("   ✅ Tree rebuilt with %s shop exclusion(s) and %s item ID exclusion(s) preserved", len(shop_names), len(item_id_exclusions))
+    else:
+        log.info("   ✅ Tree rebuilt with %s shop exclusion(s)", len(shop_names))
+
+
+# ============================================================================
+# BATCH JOB SUBMISSION (bulk listing tree rebuilds)
+# ============================================================================
+
+# Next sequence token per batch job, as returned by add_batch_job_operations
+_batch_job_sequence_tokens = {}
+
+
+def _start_tree_rebuild_ops(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id,
+    in_batch_job: bool = False
+) -> list:
+    """
+    Clear the existing listing tree before a rebuild.
+
+    Synchronous mode removes the tree right away and returns an empty list.
+    Batch mode returns a list holding the root REMOVE operation, so the removal
+    runs inside the batch job just before the new tree is created.
+    """
+    if not in_batch_job:
+        _remove_listing_tree(client, customer_id, ad_group_id)
+        return []
+
+    _forget_cl3_tree_meta(customer_id, ad_group_id)
+
+    root_resource_name = get_listing_tree_root(client, customer_id, str(ad_group_id))
+    if not root_resource_name:
+        return []
+
+    remove_op = get_cached_type(client, "AdGroupCriterionOperation")()
+    remove_op.remove = root_resource_name
+    return [remove_op]
+
+
+def create_batch_job(client: GoogleAdsClient, customer_id: str) -> str:
+    """
+    Create an empty batch job.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+
+    Returns:
+        Batch job resource name
+    """
+    batch_job_service = get_cached_service(client, "BatchJobService")
+    operation = client.get_type("BatchJobOperation")
+    client.copy_from(operation.create, client.get_type("BatchJob"))
+
+    response = batch_job_service.mutate_batch_job(customer_id=customer_id, operation=operation)
+    batch_job_resource_name = response.result.resource_name
+    _batch_job_sequence_tokens[batch_job_resource_name] = None
+    log.info("📦 Created batch job: %s", batch_job_resource_name)
+    return batch_job_resource_name
+
+
+def add_criterion_operations_to_batch_job(
+    client: GoogleAdsClient,
+    customer_id: str,
+    batch_job_resource_name: str,
+    operations: list
+):
+    """
+    Append AdGroupCriterionOperations to a batch job.
+
+    Temporary resource names stay valid across all operations of one batch job,
+    so a rebuild's children can still reference parents created earlier.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        batch_job_resource_name: Batch job to append to
+        operations: List of AdGroupCriterionOperation
+    """
+    if not operations:
+        return
+
+    batch_job_service = get_cached_service(client, "BatchJobService")
+    mutate_operations = []
+    mutate_operation_type = get_cached_type(client, "MutateOperation")
+    for op in operations:
+        mutate_op = mutate_operation_type()
+        client.copy_from(mutate_op.ad_group_criterion_operation, op)
+        mutate_operations.append(mutate_op)
+
+    # Upload in chunks so one request never carries a huge payload
+    for start in range(0, len(mutate_operations), MAX_OPS_PER_MUTATE):
+        request = client.get_type("AddBatchJobOperationsRequest")
+        request.resource_name = batch_job_resource_name
+        request.mutate_operations = mutate_operations[start:start + MAX_OPS_PER_MUTATE]
+        sequence_token = _batch_job_sequence_tokens.get(batch_job_resource_name)
+        if sequence_token:
+            request.sequence_token = sequence_token
+
+        response = batch_job_service.add_batch_job_operations(request=request)
+        _batch_job_sequence_tokens[batch_job_resource_name] = response.next_sequence_token
+
+
+def run_batch_job(
+    client: GoogleAdsClient,
+    batch_job_resource_name: str,
+    timeout_seconds: int = 1800
+) -> dict:
+    """
+    Run a batch job, wait for it to finish and collect per-operation results.
+
+    Args:
+        client: Google Ads client
+        batch_job_resource_name: Batch job to run
+        timeout_seconds: Max time to wait for completion
+
+    Returns:
+        dict: {'success': int, 'errors': list of (operation_index, message)}
+    """
+    batch_job_service = get_cached_service(client, "BatchJobService")
+
+    log.info("⏳ Running batch job %s...", batch_job_resource_name)
+    long_running_op = batch_job_service.run_batch_job(resource_name=batch_job_resource_name)
+    long_running_op.result(timeout=timeout_seconds)
+    _batch_job_sequence_tokens.pop(batch_job_resource_name, None)
+
+    result = {'success': 0, 'errors': []}
+    for row in batch_job_service.list_batch_job_results(resource_name=batch_job_resource_name):
+        if row.status and row.status.code != 0:
+            result['errors'].append((row.operation_index, row.status.message))
+        else:
+            result['success'] += 1
+
+    log.info("✅ Batch job done: %s operation(s) succeeded, %s failed", result['success'], len(result['errors']))
+    return result
+
+
+def run_criterion_batch_job(client: GoogleAdsClient, customer_id: str, operations: list) -> dict:
+    """
+    Create a batch job for AdGroupCriterionOperations, run it and collect results.
+
+    Returns:
+        dict: {'success': int, 'errors': list of (operation_index, message)}
+    """
+    batch_job_resource_name = create_batch_job(client, customer_id)
+    add_criterion_operations_to_batch_job(client, customer_id, batch_job_resource_name, operations)
+    return run_batch_job(client, batch_job_resource_name)
+
+
+def _restore_shop_exclusion_tree(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id_str: str,
+    cl0_value: str,
+    cl1_value: str,
+    bid_micros: int,
+    shop_names: list,
+    item_id_exclusions: list
+):
+    """
+    Put a shop exclusion tree back after a failed batch rebuild.
+
+    Clears whatever part of the new tree was created, then recreates the
+    previous structure. Raises if the ad group is left without a tree.
+    """
+    log.warning("   ↩️  Batch rebuild failed - restoring previous tree with %s shop exclusion(s)",
+                len(shop_names))
+    _remove_listing_tree(client, customer_id, ad_group_id_str)
+    ops = _shop_exclusion_tree_operations(
+        client, customer_id, ad_group_id_str, cl0_value, cl1_value, bid_micros,
+        shop_names, item_id_exclusions
+    )
+    try:
+        if len(ops) > MAX_OPS_PER_MUTATE:
+            batch_result = run_criterion_batch_job(client, customer_id, ops)
+            if batch_result['errors']:
+                raise Exception(batch_result['errors'][0][1])
+        else:
+            mutate_ad_group_criteria_with_retry(
+                get_cached_service(client, "AdGroupCriterionService"), customer_id, ops
+            )
+    except Exception as e:
+        raise Exception(f"Could not restore previous tree, ad group {ad_group_id_str} has no listing tree: {e}")
+    log.info("   ↩️  Previous tree restored")
+
+
+# ============================================================================
+# CONCURRENT REBUILDS
+# ============================================================================
+
+def _interleave_by_customer(keys: list) -> list:
+    """
+    Order (customer_id, ad_group_id) keys round-robin over customers, so
+    concurrent workers spread load instead of hitting one account at once.
+    """
+    per_customer = defaultdict(deque)
+    for key in keys:
+        per_customer[key[0]].append(key)
+
+    ordered = []
+    pending = list(per_customer.values())
+    while pending:
+        for keys_of_customer in pending:
+            ordered.append(keys_of_customer.popleft())
+        pending = [keys_of_customer for keys_of_customer in pending if keys_of_customer]
+    return ordered
+
+
+def rebuild_trees_concurrently(
+    client: GoogleAdsClient,
+    rebuilds: list,
+    max_workers: int = TREE_REBUILD_WORKERS
+):
+    """
+    Run many listing tree rebuilds in parallel threads instead of one by one.
+
+    Rebuilds are I/O-bound (each mutate is a network round trip), so a thread
+    pool overlaps the waiting. Rebuilds of the SAME ad group run sequentially
+    in one worker to avoid CONCURRENT_MODIFICATION errors; different
+    customers are interleaved to spread the per-account rate limits.
+
+    Each rebuild is a (customer_id, rebuild_function, kwargs) tuple, where
+    kwargs must contain ad_group_id, e.g.:
+        ('3800751597', rebuild_tree_with_shop_exclusions, {'ad_group_id': 123, 'shop_names': ['shop.nl']})
+
+    Args:
+        client: Google Ads client
+        rebuilds: List of (customer_id, rebuild_function, kwargs) tuples
+        max_workers: Max number of ad groups rebuilt at once
+
+    Yields:
+        (index, error) per rebuild as soon as it finishes: index into rebuilds,
+        error message or None on success
+    """
+    groups = defaultdict(list)
+    for index, (customer_id, _, kwargs) in enumerate(rebuilds):
+        groups[(customer_id, str(kwargs['ad_group_id']))].append(index)
+
+    def run_group(key):
+        outcomes = []
+        for index in groups[key]:
+            customer_id, rebuild_function, kwargs = rebuilds[index]
+            try:
+                api_rate_limiter.acquire()
+                rebuild_function(client=client, customer_id=customer_id, **kwargs)
+                outcomes.append((index, None))
+            except Exception as e:
+                outcomes.append((index, str(e)))
+        return outcomes
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_group, key) for key in _interleave_by_customer(list(groups))]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+# ============================================================================
+# MICRO-BATCHING SCHEDULER
+# ============================================================================
+
+class RebuildScheduler:
+    """
+    Coalesce listing tree mutates from concurrent rebuilds into fewer requests.
+
+    Rebuild threads submit their operations and wait on a Future. A background
+    thread collects submissions for up to flush_interval_ms (or until
+    max_batch submissions are pending), merges them per customer into as few
+    mutate_ad_group_criteria calls as MAX_OPS_PER_MUTATE allows, and hands
+    each caller its slice of the response. Temporary resource names are
+    globally unique (next_id), so operations of different rebuilds can share
+    a request.
+
+    A merged request is atomic, so if it fails its rebuilds are retried one by
+    one and a single bad tree doesn't fail the others.
+
+    Usage:
+        with RebuildScheduler(client) as scheduler:
+            rebuild_tree_with_shop_exclusions(..., scheduler=scheduler)
+    """
+
+    def __init__(self, client: GoogleAdsClient, max_batch: int = 32, flush_interval_ms: int = 50):
+        self._agc_service = get_cached_service(client, "AdGroupCriterionService")
+        self._queue = queue.Queue()
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval_ms / 1000
+        self._closed = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="RebuildScheduler", daemon=True)
+        self._worker.start()
+
+    def submit(self, customer_id: str, operations: list) -> Future:
+        """
+        Queue operations for the next merged mutate.
+
+        Returns:
+            Future resolving to the list of MutateAdGroupCriterionResult for
+            these operations (in order), or raising the mutate error
+        """
+        if self._closed.is_set():
+            raise RuntimeError("RebuildScheduler is closed")
+        future = Future()
+        self._queue.put((customer_id, operations, future))
+        return future
+
+    def close(self):
+        """Flush everything still pending and stop the background thread."""
+        self._closed.set()
+        self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._collect()
+            if batch:
+                self._flush(batch)
+
+    def _collect(self) -> list:
+        batch = []
+        deadline = time.monotonic() + self._flush_interval
+        while len(batch) < self._max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: list):
+        by_customer = defaultdict(list)
+        for request in batch:
+            by_customer[request[0]].append(request)
+
+        for customer_id, requests in by_customer.items():
+            # Cut the merged request wherever it would exceed one mutate
+            chunk, chunk_ops = [], 0
+            for request in requests:
+                if chunk and chunk_ops + len(request[1]) > MAX_OPS_PER_MUTATE:
+                    self._mutate(customer_id, chunk)
+                    chunk, chunk_ops = [], 0
+                chunk.append(request)
+                chunk_ops += len(request[1])
+            self._mutate(customer_id, chunk)
+
+    def _mutate(self, customer_id: str, requests: list):
+        merged_ops = [op for _, operations, _ in requests for op in operations]
+        try:
+            response = mutate_ad_group_criteria_with_retry(self._agc_service, customer_id, merged_ops)
+        except Exception as e:
+            if len(requests) == 1:
+                requests[0][2].set_exception(e)
+                return
+            # Isolate the failing rebuild(s)
+            for _, operations, future in requests:
+                try:
+                    single = mutate_ad_group_criteria_with_retry(self._agc_service, customer_id, operations)
+                    future.set_result(list(single.results))
+                except Exception as single_error:
+                    future.set_exception(single_error)
+            return
+
+        log.debug("   📨 Merged %s rebuild(s) into one mutate (%s operations)", len(requests), len(merged_ops))
+        offset = 0
+        for _, operations, future in requests:
+            future.set_result(list(response.results[offset:offset + len(operations)]))
+            offset += len(operations)
+
+
+def _mutate_rebuild_ops(agc_service, customer_id: str, operations: list, scheduler: RebuildScheduler = None):
+    """Mutate rebuild operations directly, or through a RebuildScheduler when given."""
+    if scheduler is not None:
+        return scheduler.submit(customer_id, operations).result()
+    return mutate_ad_group_criteria_with_retry(agc_service, customer_id, operations)
+
+
+# ============================================================================
+# EXISTING TREE PRECHECK
+# ============================================================================
+
+# Ad groups (by ID list) that have a listing tree - root nodes only, so each
+# ad group comes back once instead of with its whole tree
+_AD_GROUPS_WITH_TREES_QUERY = (
+    "SELECT ad_group.id FROM ad_group_criterion "
+    "WHERE ad_group_criterion.type = 'LISTING_GROUP' "
+    "AND ad_group_criterion.listing_group.parent_ad_group_criterion IS NULL "
+    "AND ad_group.id IN ({})"
+)
+
+
+def ad_groups_with_existing_trees(client: GoogleAdsClient, customer_id: str, ad_group_ids: list) -> set:
+    """
+    Return the IDs of the given ad groups that already have a listing tree.
+
+    One GAQL query per 1000 ad groups instead of one per ad group, so callers
+    that set up many ad groups can precheck them all up front.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_ids: Ad group IDs to check
+
+    Returns:
+        set: Ad group IDs (as strings) that have at least one listing group
+    """
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    ids = [str(ad_group_id) for ad_group_id in ad_group_ids]
+    with_trees = set()
+
+    for start in range(0, len(ids), 1000):
+        query = _AD_GROUPS_WITH_TREES_QUERY.format(', '.join(ids[start:start + 1000]))
+        for row in search_stream_rows(ga_service, customer_id, query):
+            with_trees.add(str(row.ad_group.id))
+
+    return with_trees
+
+
+def campaign_ad_groups_by_name(client: GoogleAdsClient, customer_id: str, campaign_resource_name: str) -> dict:
+    """
+    Return the non-removed ad groups of a campaign, keyed by name.
+
+    One GAQL query per campaign, so parallel ad group setup doesn't need an
+    existence check per ad group before it can create.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        campaign_resource_name: Campaign resource name
+
+    Returns:
+        dict: ad_group_name -> ad_group_resource_name
+    """
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    query = f"""
+        SELECT ad_group.name, ad_group.resource_name
+        FROM ad_group
+        WHERE ad_group.campaign = '{campaign_resource_name}'
+        AND ad_group.status != 'REMOVED'
+    """
+    return {
+        row.ad_group.name: row.ad_group.resource_name
+        for row in search_stream_rows(ga_service, customer_id, query)
+    }
+
+
+def campaigns_by_name(client: GoogleAdsClient, customer_id: str, campaign_names) -> dict:
+    """
+    Return the non-removed campaigns with one of the given names, keyed by name.
+
+    One search_stream query per 1000 names (campaign.name IN (...)) instead of
+    one search per campaign.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        campaign_names: Campaign names to look up
+
+    Returns:
+        dict: campaign_name -> campaign_resource_name (names not found are missing)
+    """
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    wanted = sorted(set(campaign_names))
+    campaigns = {}
+    for start in range(0, len(wanted), 1000):
+        names_list = gaql_string_list(wanted[start:start + 1000])
+        query = f"""
+            SELECT campaign.name, campaign.resource_name
+            FROM campaign
+            WHERE campaign.name IN ({names_list})
+            AND campaign.status != 'REMOVED'
+        """
+        for row in search_stream_rows(ga_service, customer_id, query):
+            campaigns.setdefault(row.campaign.name, row.campaign.resource_name)
+    return campaigns
+
+
+def create_shopping_campaigns(client: GoogleAdsClient, customer_id: str, new_campaigns: dict) -> dict:
+    """
+    Create several standard shopping campaigns in one GoogleAdsService.mutate
+    request per chunk, instead of the budget + campaign + location + label
+    requests add_standard_shopping_campaign sends per campaign.
+
+    Each campaign gets the same settings as add_standard_shopping_campaign
+    (PAUSED, own budget "Budget_{name}", CAMPAIGN_COUNTRY location, script
+    label) and references its budget by a temporary resource name. Chunks are
+    sent with partial failure: campaigns that fail (or whole chunks whose
+    request fails) are left out of the result and the caller falls back to
+    add_standard_shopping_campaign for them. A campaign whose location failed
+    counts as failed: it is removed again together with its budget.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        new_campaigns: campaign_name -> (budget_micros, bid_strategy_resource_name or None)
+
+    Returns:
+        dict: campaign_name -> campaign_resource_name of the created campaigns
+    """
+    if not new_campaigns:
+        return {}
+
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    label_resource_name = ensure_campaign_label_exists(client, customer_id, script_label)
+    ops_per_campaign = 4 if label_resource_name else 3
+
+    items = list(new_campaigns.items())
+    chunk_size = max(1, MAX_OPS_PER_MUTATE // ops_per_campaign)
+    created = {}
+    mutate_operation_type = get_cached_type(client, "MutateOperation")
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start:start + chunk_size]
+        mutate_operations = []
+        for campaign_name, (budget_micros, bid_strategy_resource_name) in chunk:
+            budget_tmp = f"customers/{customer_id}/campaignBudgets/{next_id()}"
+            campaign_tmp_id = str(next_id())
+            campaign_tmp = f"customers/{customer_id}/campaigns/{campaign_tmp_id}"
+
+            budget_op = mutate_operation_type()
+            budget = budget_op.campaign_budget_operation.create
+            budget.resource_name = budget_tmp
+            set_campaign_budget_fields(client, budget, f"Budget_{campaign_name}", budget_micros)
+            mutate_operations.append(budget_op)
+
+            campaign_op = mutate_operation_type()
+            campaign = campaign_op.campaign_operation.create
+            campaign.resource_name = campaign_tmp
+            set_shopping_campaign_fields(
+                client, campaign, campaign_name, MERCHANT_CENTER_ACCOUNT_ID, bid_strategy_resource_name
+            )
+            campaign.campaign_budget = budget_tmp
+            mutate_operations.append(campaign_op)
+
+            location_op = mutate_operation_type()
+            client.copy_from(
+                location_op.campaign_criterion_operation,
+                create_location_op(client, customer_id, campaign_tmp_id, CAMPAIGN_COUNTRY)
+            )
+            mutate_operations.append(location_op)
+
+            if label_resource_name:
+                label_op = mutate_operation_type()
+                campaign_label = label_op.campaign_label_operation.create
+                campaign_label.campaign = campaign_tmp
+                campaign_label.label = label_resource_name
+                mutate_operations.append(label_op)
+
+        try:
+            response, failed = google_ads_mutate_partial(client, ga_service, customer_id, mutate_operations)
+        except Exception as ex:
+            errors = failure_errors_by_index(ex.failure) if isinstance(ex, GoogleAdsException) else {}
+            detail = min(errors.items())[1] if errors else str(ex)
+            print(f"   ⚠️  Batched creation of {len(chunk)} campaign(s) failed, creating them one by one: {detail}")
+            continue
 
-        # Add each item ID as a negative unit under CL3 OTHERS
-        for item_id in item_id_exclusions:
-            dim_item_id = client.get_type("ListingDimensionInfo")
-            dim_item_id.product_item_id = client.get_type("ProductItemIdInfo")
-            dim_item_id.product_item_id.value = item_id
+        # Each campaign's block is budget, campaign, location[, label]
+        results = response.mutate_operation_responses
+        orphan_campaigns = []
+        orphan_budgets = []
+        for i, (campaign_name, _) in enumerate(chunk):
+            budget_index = i * ops_per_campaign
+            campaign_index = budget_index + 1
+            location_index = campaign_index + 1
+            if campaign_index in failed or budget_index in failed:
+                print(f"   ⚠️  Batched creation of '{campaign_name}' failed, creating it separately: "
+                      f"{failed.get(budget_index) or failed[campaign_index]}")
+                if budget_index not in failed:
+                    orphan_budgets.append(results[budget_index].campaign_budget_result.resource_name)
+                continue
+            if location_index in failed:
+                # Without its location the campaign would target everywhere
+                print(f"   ⚠️  Location of '{campaign_name}' failed, removing it and creating it separately: "
+                      f"{failed[location_index]}")
+                orphan_campaigns.append(results[campaign_index].campaign_result.resource_name)
+                orphan_budgets.append(results[budget_index].campaign_budget_result.resource_name)
+                continue
+            created[campaign_name] = results[campaign_index].campaign_result.resource_name
+            if label_resource_name and location_index + 1 in failed:
+                print(f"   ⚠️  Campaign '{campaign_name}' created, but its label failed: {failed[location_index + 1]}")
+            print(f"   ✅ Campaign created: {campaign_name}")
+
+        # Leftovers of failed campaigns would block the fallback (their names are
+        # taken); campaigns go first so their budgets are no longer in use
+        if orphan_campaigns or orphan_budgets:
+            remove_operations = []
+            for campaign_resource_name in orphan_campaigns:
+                remove_op = mutate_operation_type()
+                remove_op.campaign_operation.remove = campaign_resource_name
+                remove_operations.append(remove_op)
+            for budget_resource_name in orphan_budgets:
+                remove_op = mutate_operation_type()
+                remove_op.campaign_budget_operation.remove = budget_resource_name
+                remove_operations.append(remove_op)
+            try:
+                google_ads_mutate_with_retry(ga_service, customer_id, remove_operations)
+            except Exception as ex:
+                print(f"   ⚠️  Could not remove {len(orphan_campaigns)} campaign(s) / "
+                      f"{len(orphan_budgets)} budget(s) of failed creations: {ex}")
+    return created
 
-            ops4.append(
-                create_listing_group_unit_biddable(
-                    client=client,
-                    customer_id=customer_id,
-                    ad_group_id=str(ad_group_id),
-                    parent_ad_group_criterion_resource_name=cl3_others_actual,
-                    listing_dimension_info=dim_item_id,
-                    targeting_negative=True,  # NEGATIVE = exclude this item ID
-                    cpc_bid_micros=None
-                )
-            )
 
-        # Execute item ID exclusions
+def _listing_tree_exists(client: GoogleAdsClient, customer_id: str, ad_group_id, ad_groups_with_trees: set = None) -> bool:
+    """
+    Check for an existing listing tree, using a precomputed set when given.
+    """
+    if ad_groups_with_trees is None:
+        ga_service = get_cached_service(client, "GoogleAdsService")
+        query = _AD_GROUPS_WITH_TREES_QUERY.format(ad_group_id) + " LIMIT 1"
         try:
-            agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops4)
-            print(f"   ✅ Tree rebuilt with {len(shop_names)} shop exclusion(s) and {len(item_id_exclusions)} item ID exclusion(s) preserved")
-        except Exception as e:
-            raise Exception(f"Error adding item ID exclusions: {e}")
-    else:
-        print(f"   ✅ Tree rebuilt with {len(shop_names)} shop exclusion(s)")
+            return bool(search_stream_rows(ga_service, customer_id, query))
+        except Exception:
+            return False  # No existing tree, proceed to create
+    return str(ad_group_id) in ad_groups_with_trees
 
 
-def build_listing_tree_for_inclusion(
+# ============================================================================
+# LISTING TREE BUILD (new ad groups)
+# ============================================================================
+
+def inclusion_tree_operations(
     client: GoogleAdsClient,
     customer_id: str,
     ad_group_id: str,
     custom_label_1: str,
     maincat_id: str,
-    shop_name: str,
-    default_bid_micros: int = DEFAULT_BID_MICROS
-):
-    """
-    Build listing tree for inclusion logic (NEW STRUCTURE):
-
-    Tree structure:
-    ROOT (subdivision)
-    ├─ Custom Label 3 = shop_name (subdivision)
-    │  ├─ Custom Label 3 OTHERS (unit, negative)
-    │  └─ Custom Label 4 = maincat_id (subdivision)
-    │     ├─ Custom Label 4 OTHERS (unit, negative)
-    │     ├─ Custom Label 1 = custom_label_1 (unit, biddable, positive) ← Added in MUTATE 2
-    │     └─ Custom Label 1 OTHERS (unit, negative) ← Created in MUTATE 1 with temp name
-    └─ Custom Label 3 OTHERS (unit, negative)
-
-    CRITICAL: Google Ads requires that when you create a SUBDIVISION, you must
-    provide its OTHERS case in the SAME mutate operation using temporary resource names.
-
-    MUTATE 1: Create root + CL3 subdivision + CL4 subdivision + all OTHERS cases
-    MUTATE 2: Add positive custom_label_1 target under maincat subdivision
-
-    Args:
-        client: Google Ads client
-        customer_id: Customer ID
-        ad_group_id: Ad group ID
-        custom_label_1: Custom label 1 value (a/b/c)
-        maincat_id: Main category ID to target (custom label 4)
-        shop_name: Shop name to target (custom label 3)
-        default_bid_micros: Default bid in micros
+    shop_name: str
+) -> list:
     """
-    print(f"      Building tree: Shop={shop_name}, Maincat ID={maincat_id}, CL1={custom_label_1}")
+    Build the AdGroupCriterionOperations for an inclusion listing tree
+    (see build_listing_tree_for_inclusion for the structure).
 
-    # Check if listing tree already exists - if so, skip to preserve exclusions
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    ad_group_id may be a temporary (negative) ID when the ad group is created
+    in the same request.
 
-    check_query = f"""
-        SELECT ad_group_criterion.resource_name
-        FROM ad_group_criterion
-        WHERE ad_group_criterion.ad_group = '{ag_path}'
-            AND ad_group_criterion.type = 'LISTING_GROUP'
-        LIMIT 1
+    Returns:
+        List of AdGroupCriterionOperation, parents before children
     """
+    # Resolve the custom label index enums once instead of per node
+    index_enum = client.enums.ProductCustomAttributeIndexEnum
+    idx1, idx3, idx4 = index_enum.INDEX1, index_enum.INDEX3, index_enum.INDEX4
 
-    try:
-        existing_tree = list(ga_service.search(customer_id=customer_id, query=check_query))
-        if existing_tree:
-            print(f"      ℹ️  Listing tree already exists - skipping to preserve exclusions")
-            return
-    except Exception:
-        pass  # No existing tree, proceed to create
-
-    agc_service = client.get_service("AdGroupCriterionService")
-
-    # MUTATE 1: Create root + CL3 subdivision + CL4 subdivision + all OTHERS cases
+    # root + CL3 subdivision + CL4 subdivision + all OTHERS cases + CL1 target
     # CRITICAL: When creating a subdivision, you MUST provide its OTHERS case in the SAME mutate
-    ops1 = []
+    ops = []
 
     # 1. ROOT SUBDIVISION
     root_op = create_listing_group_subdivision(
@@ -1422,12 +2622,10 @@ def build_listing_tree_for_inclusion(
         listing_dimension_info=None
     )
     root_tmp = root_op.create.resource_name
-    ops1.append(root_op)
+    ops.append(root_op)
 
     # 2. Custom Label 3 subdivision (Custom Label 3 = shop_name)
-    dim_cl3 = client.get_type("ListingDimensionInfo")
-    dim_cl3.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3  # INDEX3 = Custom Label 3
-    dim_cl3.product_custom_attribute.value = str(shop_name)
+    dim_cl3 = make_custom_label_dim(client, idx3, str(shop_name))
 
     cl3_subdivision_op = create_listing_group_subdivision(
         client=client,
@@ -1437,15 +2635,14 @@ def build_listing_tree_for_inclusion(
         listing_dimension_info=dim_cl3
     )
     cl3_subdivision_tmp = cl3_subdivision_op.create.resource_name
-    ops1.append(cl3_subdivision_op)
+    ops.append(cl3_subdivision_op)
 
     # 3. Custom Label 3 OTHERS (negative - blocks other shops)
     # This is a child of ROOT and satisfies the OTHERS requirement for root
-    dim_cl3_others = client.get_type("ListingDimensionInfo")
-    dim_cl3_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
+    dim_cl3_others = make_custom_label_dim(client, idx3)
     # Don't set value - OTHERS case
 
-    ops1.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1459,9 +2656,7 @@ def build_listing_tree_for_inclusion(
 
     # 4. Maincat ID subdivision (Custom Label 4 = maincat_id)
     # This is a child of CL3 subdivision (using TEMP name)
-    dim_maincat = client.get_type("ListingDimensionInfo")
-    dim_maincat.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX4  # INDEX4 = Custom Label 4
-    dim_maincat.product_custom_attribute.value = str(maincat_id)
+    dim_maincat = make_custom_label_dim(client, idx4, str(maincat_id))
 
     maincat_subdivision_op = create_listing_group_subdivision(
         client=client,
@@ -1471,15 +2666,14 @@ def build_listing_tree_for_inclusion(
         listing_dimension_info=dim_maincat
     )
     maincat_subdivision_tmp = maincat_subdivision_op.create.resource_name
-    ops1.append(maincat_subdivision_op)
+    ops.append(maincat_subdivision_op)
 
     # 5. Custom Label 4 OTHERS (negative - blocks other categories)
     # This is a child of CL3 subdivision and satisfies the OTHERS requirement for CL3
-    dim_cl4_others = client.get_type("ListingDimensionInfo")
-    dim_cl4_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX4
+    dim_cl4_others = make_custom_label_dim(client, idx4)
     # Don't set value - OTHERS case
 
-    ops1.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1493,11 +2687,10 @@ def build_listing_tree_for_inclusion(
 
     # 6. Custom Label 1 OTHERS (negative - blocks other CL1 values)
     # This is a child of maincat_id subdivision (using TEMP name) and satisfies its OTHERS requirement
-    dim_cl1_others = client.get_type("ListingDimensionInfo")
-    dim_cl1_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
+    dim_cl1_others = make_custom_label_dim(client, idx1)
     # Don't set value - OTHERS case
 
-    ops1.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1509,102 +2702,103 @@ def build_listing_tree_for_inclusion(
         )
     )
 
-    # Execute first mutate
-    resp1 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops1)
-    maincat_subdivision_actual = resp1.results[3].resource_name  # Fourth result is maincat subdivision (0=root, 1=cl3, 2=cl3_others, 3=cl4)
-
-    # Small delay to prevent concurrent modification errors
-    time.sleep(0.5)
-
-    # MUTATE 2: Under maincat_id, add the positive custom_label_1 target
-    # Note: CL1 OTHERS was already created in MUTATE 1
-    ops2 = []
-
+    # 7. Under maincat_id, the positive custom_label_1 target (parent via temp name)
     # Custom Label 1 (Custom Label 1 = custom_label_1) - POSITIVE target
-    dim_cl1 = client.get_type("ListingDimensionInfo")
-    dim_cl1.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1  # INDEX1 = Custom Label 1
-    dim_cl1.product_custom_attribute.value = str(custom_label_1)
+    dim_cl1 = make_custom_label_dim(client, idx1, str(custom_label_1))
 
-    ops2.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
             ad_group_id=ad_group_id,
-            parent_ad_group_criterion_resource_name=maincat_subdivision_actual,
+            parent_ad_group_criterion_resource_name=maincat_subdivision_tmp,
             listing_dimension_info=dim_cl1,
             targeting_negative=False,  # POSITIVE - target this CL1 value
             cpc_bid_micros=10_000  # 1 cent = €0.01 = 10,000 micros
         )
     )
 
-    # Execute second mutate
-    agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops2)
-    print(f"      ✅ Tree created: Shop '{shop_name}' → Maincat '{maincat_id}' → CL1 '{custom_label_1}'")
+    return ops
 
 
-def build_listing_tree_for_inclusion_v2(
+def build_listing_tree_for_inclusion(
     client: GoogleAdsClient,
     customer_id: str,
     ad_group_id: str,
+    custom_label_1: str,
+    maincat_id: str,
     shop_name: str,
-    maincat_ids: list,
-    default_bid_micros: int = DEFAULT_BID_MICROS
+    default_bid_micros: int = DEFAULT_BID_MICROS,
+    ad_groups_with_trees: set = None
 ):
     """
-    Build listing tree for inclusion logic (V2 - NEW STRUCTURE):
+    Build listing tree for inclusion logic (NEW STRUCTURE):
 
     Tree structure:
     ROOT (subdivision)
     ├─ Custom Label 3 = shop_name (subdivision)
-    │  ├─ Custom Label 4 = maincat_id_1 (unit, biddable, positive)
-    │  ├─ Custom Label 4 = maincat_id_2 (unit, biddable, positive)
-    │  ├─ ... (more maincat_ids)
-    │  └─ Custom Label 4 OTHERS (unit, negative)
+    │  ├─ Custom Label 3 OTHERS (unit, negative)
+    │  └─ Custom Label 4 = maincat_id (subdivision)
+    │     ├─ Custom Label 4 OTHERS (unit, negative)
+    │     ├─ Custom Label 1 = custom_label_1 (unit, biddable, positive)
+    │     └─ Custom Label 1 OTHERS (unit, negative)
     └─ Custom Label 3 OTHERS (unit, negative)
 
-    Key differences from v1:
-    - No CL1 targeting (simpler structure)
-    - Multiple maincat_ids per ad group (all as positive units)
-    - shop_name = ad_group_name (same value)
+    CRITICAL: Google Ads requires that when you create a SUBDIVISION, you must
+    provide its OTHERS case in the SAME mutate operation using temporary resource names.
 
-    IMPORTANT: This function will NOT rebuild the tree if one already exists,
-    to preserve any existing exclusions that may have been added.
+    All nodes, including the positive custom_label_1 target, are created in a
+    single mutate.
 
     Args:
         client: Google Ads client
         customer_id: Customer ID
         ad_group_id: Ad group ID
-        shop_name: Shop name to target (custom label 3) - same as ad_group_name
-        maincat_ids: List of maincat IDs to target (custom label 4)
+        custom_label_1: Custom label 1 value (a/b/c)
+        maincat_id: Main category ID to target (custom label 4)
+        shop_name: Shop name to target (custom label 3)
         default_bid_micros: Default bid in micros
+        ad_groups_with_trees: Optional set of ad group IDs that already have a tree,
+            from ad_groups_with_existing_trees. Skips the per-ad-group check query.
     """
-    print(f"      Building tree: Shop={shop_name}, Maincat IDs={maincat_ids}")
+    print(f"      Building tree: Shop={shop_name}, Maincat ID={maincat_id}, CL1={custom_label_1}")
 
     # Check if listing tree already exists - if so, skip to preserve exclusions
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    if _listing_tree_exists(client, customer_id, ad_group_id, ad_groups_with_trees):
+        print(f"      ℹ️  Listing tree already exists - skipping to preserve exclusions")
+        return
 
-    check_query = f"""
-        SELECT ad_group_criterion.resource_name
-        FROM ad_group_criterion
-        WHERE ad_group_criterion.ad_group = '{ag_path}'
-            AND ad_group_criterion.type = 'LISTING_GROUP'
-        LIMIT 1
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ops = inclusion_tree_operations(client, customer_id, ad_group_id, custom_label_1, maincat_id, shop_name)
+
+    # Execute the whole tree in a single mutate
+    mutate_ad_group_criteria_with_retry(agc_service, customer_id, ops)
+    print(f"      ✅ Tree created: Shop '{shop_name}' → Maincat '{maincat_id}' → CL1 '{custom_label_1}'")
+
+
+def inclusion_v2_tree_operations(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id: str,
+    shop_name: str,
+    maincat_ids: list
+) -> list:
     """
+    Build the AdGroupCriterionOperations for an inclusion V2 listing tree
+    (see build_listing_tree_for_inclusion_v2 for the structure).
 
-    try:
-        existing_tree = list(ga_service.search(customer_id=customer_id, query=check_query))
-        if existing_tree:
-            print(f"      ℹ️  Listing tree already exists - skipping to preserve exclusions")
-            return
-    except Exception:
-        pass  # No existing tree, proceed to create
+    ad_group_id may be a temporary (negative) ID when the ad group is created
+    in the same request.
 
-    agc_service = client.get_service("AdGroupCriterionService")
+    Returns:
+        List of AdGroupCriterionOperation, parents before children
+    """
+    # Resolve the custom label index enums once instead of per node
+    index_enum = client.enums.ProductCustomAttributeIndexEnum
+    idx3, idx4 = index_enum.INDEX3, index_enum.INDEX4
 
-    # MUTATE 1: Create ROOT + CL3 subdivision + CL3 OTHERS + CL4 OTHERS
-    ops1 = []
+    # ROOT + CL3 subdivision + CL3 OTHERS + CL4 OTHERS + maincat units
+    ops = []
 
     # 1. ROOT SUBDIVISION
     root_op = create_listing_group_subdivision(
@@ -1615,12 +2809,10 @@ def build_listing_tree_for_inclusion_v2(
         listing_dimension_info=None
     )
     root_tmp = root_op.create.resource_name
-    ops1.append(root_op)
+    ops.append(root_op)
 
     # 2. Custom Label 3 subdivision (CL3 = shop_name)
-    dim_cl3 = client.get_type("ListingDimensionInfo")
-    dim_cl3.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-    dim_cl3.product_custom_attribute.value = str(shop_name)
+    dim_cl3 = make_custom_label_dim(client, idx3, str(shop_name))
 
     cl3_subdivision_op = create_listing_group_subdivision(
         client=client,
@@ -1630,13 +2822,12 @@ def build_listing_tree_for_inclusion_v2(
         listing_dimension_info=dim_cl3
     )
     cl3_subdivision_tmp = cl3_subdivision_op.create.resource_name
-    ops1.append(cl3_subdivision_op)
+    ops.append(cl3_subdivision_op)
 
     # 3. Custom Label 3 OTHERS (negative - blocks other shops)
-    dim_cl3_others = client.get_type("ListingDimensionInfo")
-    dim_cl3_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
+    dim_cl3_others = make_custom_label_dim(client, idx3)
 
-    ops1.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1650,10 +2841,9 @@ def build_listing_tree_for_inclusion_v2(
 
     # 4. Custom Label 4 OTHERS (negative - blocks other categories)
     # Must be created in same mutate as CL3 subdivision
-    dim_cl4_others = client.get_type("ListingDimensionInfo")
-    dim_cl4_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX4
+    dim_cl4_others = make_custom_label_dim(client, idx4)
 
-    ops1.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1665,35 +2855,202 @@ def build_listing_tree_for_inclusion_v2(
         )
     )
 
-    # Execute first mutate
-    resp1 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops1)
-    cl3_subdivision_actual = resp1.results[1].resource_name  # Second result is CL3 subdivision
+    # 5. All maincat_ids as positive CL4 units (parent via temp name)
+    ops.extend([
+        create_listing_group_unit_biddable(
+            client=client,
+            customer_id=customer_id,
+            ad_group_id=ad_group_id,
+            parent_ad_group_criterion_resource_name=cl3_subdivision_tmp,
+            listing_dimension_info=make_custom_label_dim(client, idx4, str(maincat_id)),
+            targeting_negative=False,  # POSITIVE - target this maincat
+            cpc_bid_micros=10_000  # 1 cent = €0.01 = 10,000 micros
+        )
+        for maincat_id in maincat_ids
+    ])
 
-    # MUTATE 2: Add all maincat_ids as positive CL4 units
-    ops2 = []
+    return ops
 
-    for maincat_id in maincat_ids:
-        dim_cl4 = client.get_type("ListingDimensionInfo")
-        dim_cl4.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX4
-        dim_cl4.product_custom_attribute.value = str(maincat_id)
 
-        ops2.append(
-            create_listing_group_unit_biddable(
-                client=client,
-                customer_id=customer_id,
-                ad_group_id=ad_group_id,
-                parent_ad_group_criterion_resource_name=cl3_subdivision_actual,
-                listing_dimension_info=dim_cl4,
-                targeting_negative=False,  # POSITIVE - target this maincat
-                cpc_bid_micros=10_000  # 1 cent = €0.01 = 10,000 micros
-            )
-        )
+def build_listing_tree_for_inclusion_v2(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id: str,
+    shop_name: str,
+    maincat_ids: list,
+    default_bid_micros: int = DEFAULT_BID_MICROS,
+    ad_groups_with_trees: set = None
+):
+    """
+    Build listing tree for inclusion logic (V2 - NEW STRUCTURE):
+
+    Tree structure:
+    ROOT (subdivision)
+    ├─ Custom Label 3 = shop_name (subdivision)
+    │  ├─ Custom Label 4 = maincat_id_1 (unit, biddable, positive)
+    │  ├─ Custom Label 4 = maincat_id_2 (unit, biddable, positive)
+    │  ├─ ... (more maincat_ids)
+    │  └─ Custom Label 4 OTHERS (unit, negative)
+    └─ Custom Label 3 OTHERS (unit, negative)
+
+    Key differences from v1:
+    - No CL1 targeting (simpler structure)
+    - Multiple maincat_ids per ad group (all as positive units)
+    - shop_name = ad_group_name (same value)
+
+    IMPORTANT: This function will NOT rebuild the tree if one already exists,
+    to preserve any existing exclusions that may have been added.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_id: Ad group ID
+        shop_name: Shop name to target (custom label 3) - same as ad_group_name
+        maincat_ids: List of maincat IDs to target (custom label 4)
+        default_bid_micros: Default bid in micros
+        ad_groups_with_trees: Optional set of ad group IDs that already have a tree,
+            from ad_groups_with_existing_trees. Skips the per-ad-group check query.
+    """
+    print(f"      Building tree: Shop={shop_name}, Maincat IDs={maincat_ids}")
+
+    # Check if listing tree already exists - if so, skip to preserve exclusions
+    if _listing_tree_exists(client, customer_id, ad_group_id, ad_groups_with_trees):
+        print(f"      ℹ️  Listing tree already exists - skipping to preserve exclusions")
+        return
 
-    # Execute second mutate
-    agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops2)
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ops = inclusion_v2_tree_operations(client, customer_id, ad_group_id, shop_name, maincat_ids)
+
+    # Execute the whole tree in a single mutate
+    mutate_ad_group_criteria_with_retry(agc_service, customer_id, ops)
     print(f"      ✅ Tree created: Shop '{shop_name}' → {len(maincat_ids)} maincat(s)")
 
 
+def create_inclusion_ad_group_with_tree(
+    client: GoogleAdsClient,
+    customer_id: str,
+    campaign_resource_name: str,
+    ad_group_name: str,
+    shop_name: str,
+    maincat_ids: list,
+    existing_ad_groups: dict = None
+) -> tuple:
+    """
+    Create an inclusion ad group with its V2 listing tree and shopping product
+    ad in one request (see create_ad_group_with_tree).
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        campaign_resource_name: Campaign to create the ad group in
+        ad_group_name: Ad group name
+        shop_name: Shop name to target (custom label 3)
+        maincat_ids: List of maincat IDs to target (custom label 4)
+        existing_ad_groups: Optional name -> resource name dict of the campaign's
+            ad groups, from campaign_ad_groups_by_name. Skips the existence query.
+
+    Returns:
+        Tuple of (ad_group_resource_name, created)
+    """
+    return create_ad_group_with_tree(
+        client, customer_id, campaign_resource_name, ad_group_name,
+        lambda ad_group_id: inclusion_v2_tree_operations(client, customer_id, ad_group_id, shop_name, maincat_ids),
+        existing_ad_groups
+    )
+
+
+def create_ad_group_with_tree(
+    client: GoogleAdsClient,
+    customer_id: str,
+    campaign_resource_name: str,
+    ad_group_name: str,
+    tree_operations,
+    existing_ad_groups: dict = None
+) -> tuple:
+    """
+    Create an ad group, its listing tree and its shopping product ad in ONE
+    GoogleAdsService.mutate request.
+
+    The tree and the ad reference the ad group by its temporary resource name,
+    so no waits are needed between the steps and the ad group is never left
+    half-built (the request is atomic).
+
+    If the ad group already exists in the campaign nothing is created; the
+    caller should then fall back to its build_listing_tree_for_* function and
+    add_shopping_product_ad, which both skip what is already there.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        campaign_resource_name: Campaign to create the ad group in
+        ad_group_name: Ad group name
+        tree_operations: Callable taking the (temporary) ad group ID and
+            returning the tree's AdGroupCriterionOperations, parents first
+        existing_ad_groups: Optional name -> resource name dict of the campaign's
+            ad groups, from campaign_ad_groups_by_name. Skips the existence query.
+
+    Returns:
+        Tuple of (ad_group_resource_name, created)
+    """
+    ga_service = get_cached_service(client, "GoogleAdsService")
+
+    if existing_ad_groups is None:
+        existing_ad_groups = campaign_ad_groups_by_name(client, customer_id, campaign_resource_name)
+    if ad_group_name in existing_ad_groups:
+        print(f"      ✅ Ad group '{ad_group_name}' already exists. Using existing ad group.")
+        return existing_ad_groups[ad_group_name], False
+
+    ad_group_tmp_id = str(next_id())
+    ad_group_tmp = f"customers/{customer_id}/adGroups/{ad_group_tmp_id}"
+    mutate_operations = []
+    mutate_operation_type = get_cached_type(client, "MutateOperation")
+
+    # 1. Ad group (same settings as add_shopping_ad_group)
+    ad_group_op = mutate_operation_type()
+    ad_group = ad_group_op.ad_group_operation.create
+    ad_group.resource_name = ad_group_tmp
+    ad_group.campaign = campaign_resource_name
+    ad_group.name = ad_group_name
+    ad_group.cpc_bid_micros = 20000  # Standard bid: 2 cents
+    ad_group.status = client.enums.AdGroupStatusEnum.ENABLED
+    mutate_operations.append(ad_group_op)
+
+    # 2. Listing tree (parents before children)
+    for criterion_op in tree_operations(ad_group_tmp_id):
+        criterion_op.create.ad_group = ad_group_tmp
+        mutate_op = mutate_operation_type()
+        client.copy_from(mutate_op.ad_group_criterion_operation, criterion_op)
+        mutate_operations.append(mutate_op)
+
+    # 3. Shopping product ad (same as add_shopping_product_ad)
+    ad_op = mutate_operation_type()
+    ad_group_ad = ad_op.ad_group_ad_operation.create
+    ad_group_ad.ad_group = ad_group_tmp
+    ad_group_ad.status = client.enums.AdGroupAdStatusEnum.ENABLED
+    ad_group_ad.ad._pb.shopping_product_ad.CopyFrom(client.get_type("ShoppingProductAdInfo")._pb)
+    mutate_operations.append(ad_op)
+
+    try:
+        response = google_ads_mutate_with_retry(ga_service, customer_id, mutate_operations)
+    except GoogleAdsException as ex:
+        # The request stays atomic (a half-built tree is invalid), so report
+        # which part of this ad group made it fail instead of the raw exception
+        errors = failure_errors_by_index(ex.failure)
+        if not errors:
+            raise
+        index, error_msg = min(errors.items())
+        if index == 0:
+            part = "ad group"
+        elif index == len(mutate_operations) - 1:
+            part = "shopping ad"
+        else:
+            part = "listing tree"
+        raise Exception(f"Creating {part} failed: {error_msg}") from ex
+    ad_group_resource_name = response.mutate_operation_responses[0].ad_group_result.resource_name
+    print(f"      ✅ Ad group, tree and ad created in one request: {ad_group_name}")
+    return ad_group_resource_name, True
+
+
 def build_listing_tree_with_cl1(
     client: GoogleAdsClient,
     customer_id: str,
@@ -1719,10 +3076,10 @@ def build_listing_tree_with_cl1(
     └─ CL3 OTHERS (unit, negative)
 
     IMPORTANT: This function does NOT check for an existing tree. The caller must
-    remove the old tree first (via safe_remove_entire_listing_tree).
+    remove the old tree first (via _remove_listing_tree).
 
-    MUTATE 1: root + CL3 subdiv + CL3 OTHERS + CL4 OTHERS + [CL4 subdiv + CL1 OTHERS] per maincat
-    MUTATE 2: CL1 positive units under each CL4 subdivision (using actual resource names)
+    Single mutate: root + CL3 subdiv + CL3 OTHERS + CL4 OTHERS + [CL4 subdiv + CL1 OTHERS
+    + CL1 positive unit] per maincat. Parents are referenced by temporary resource names.
 
     Args:
         client: Google Ads client
@@ -1735,12 +3092,15 @@ def build_listing_tree_with_cl1(
     """
     print(f"      Building tree with CL1: Shop={shop_name}, Maincat IDs={maincat_ids}, CL1={custom_label_1}")
 
-    agc_service = client.get_service("AdGroupCriterionService")
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    # Resolve the custom label index enums once instead of per node
+    index_enum = client.enums.ProductCustomAttributeIndexEnum
+    idx1, idx3, idx4 = index_enum.INDEX1, index_enum.INDEX3, index_enum.INDEX4
 
     # =========================================================================
-    # MUTATE 1: Create all subdivisions + their OTHERS cases
+    # Subdivisions + their OTHERS cases
     # =========================================================================
-    ops1 = []
+    ops = []
 
     # [0] ROOT subdivision
     root_op = create_listing_group_subdivision(
@@ -1751,12 +3111,10 @@ def build_listing_tree_with_cl1(
         listing_dimension_info=None
     )
     root_tmp = root_op.create.resource_name
-    ops1.append(root_op)
+    ops.append(root_op)
 
     # [1] CL3 = shop_name subdivision (under root)
-    dim_cl3 = client.get_type("ListingDimensionInfo")
-    dim_cl3.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-    dim_cl3.product_custom_attribute.value = str(shop_name)
+    dim_cl3 = make_custom_label_dim(client, idx3, str(shop_name))
 
     cl3_op = create_listing_group_subdivision(
         client=client,
@@ -1766,12 +3124,11 @@ def build_listing_tree_with_cl1(
         listing_dimension_info=dim_cl3
     )
     cl3_tmp = cl3_op.create.resource_name
-    ops1.append(cl3_op)
+    ops.append(cl3_op)
 
     # [2] CL3 OTHERS (unit, negative, under root)
-    dim_cl3_others = client.get_type("ListingDimensionInfo")
-    dim_cl3_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-    ops1.append(
+    dim_cl3_others = make_custom_label_dim(client, idx3)
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1784,9 +3141,8 @@ def build_listing_tree_with_cl1(
     )
 
     # [3] CL4 OTHERS (unit, negative, under CL3)
-    dim_cl4_others = client.get_type("ListingDimensionInfo")
-    dim_cl4_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX4
-    ops1.append(
+    dim_cl4_others = make_custom_label_dim(client, idx4)
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1798,12 +3154,11 @@ def build_listing_tree_with_cl1(
         )
     )
 
-    # For each maincat_id: [4+i*2] CL4 subdivision + [5+i*2] CL1 OTHERS
+    # For each maincat_id: CL4 subdivision + CL1 OTHERS
+    cl4_tmps = []
     for maincat_id in maincat_ids:
         # CL4 = maincat_id subdivision (under CL3)
-        dim_cl4 = client.get_type("ListingDimensionInfo")
-        dim_cl4.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX4
-        dim_cl4.product_custom_attribute.value = str(maincat_id)
+        dim_cl4 = make_custom_label_dim(client, idx4, str(maincat_id))
 
         cl4_op = create_listing_group_subdivision(
             client=client,
@@ -1813,12 +3168,12 @@ def build_listing_tree_with_cl1(
             listing_dimension_info=dim_cl4
         )
         cl4_tmp = cl4_op.create.resource_name
-        ops1.append(cl4_op)
+        cl4_tmps.append(cl4_tmp)
+        ops.append(cl4_op)
 
         # CL1 OTHERS (unit, negative, under this CL4 subdivision)
-        dim_cl1_others = client.get_type("ListingDimensionInfo")
-        dim_cl1_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-        ops1.append(
+        dim_cl1_others = make_custom_label_dim(client, idx1)
+        ops.append(
             create_listing_group_unit_biddable(
                 client=client,
                 customer_id=customer_id,
@@ -1830,105 +3185,54 @@ def build_listing_tree_with_cl1(
             )
         )
 
-    # Execute MUTATE 1
-    resp1 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops1)
-
-    # Small delay to prevent concurrent modification errors
-    time.sleep(0.5)
-
     # =========================================================================
-    # MUTATE 2: Add positive CL1 targets under each CL4 subdivision
+    # Positive CL1 targets under each CL4 subdivision (same request)
     # =========================================================================
-    # CL4 subdivision actual names are at response indices: 4 + i*2
-    ops2 = []
+    for cl4_tmp in cl4_tmps:
+        dim_cl1 = make_custom_label_dim(client, idx1, str(custom_label_1))
 
-    for i, maincat_id in enumerate(maincat_ids):
-        cl4_actual = resp1.results[4 + i * 2].resource_name
-
-        dim_cl1 = client.get_type("ListingDimensionInfo")
-        dim_cl1.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-        dim_cl1.product_custom_attribute.value = str(custom_label_1)
-
-        ops2.append(
+        ops.append(
             create_listing_group_unit_biddable(
-                client=client,
-                customer_id=customer_id,
-                ad_group_id=ad_group_id,
-                parent_ad_group_criterion_resource_name=cl4_actual,
-                listing_dimension_info=dim_cl1,
-                targeting_negative=False,
-                cpc_bid_micros=10_000  # 1 cent = 10,000 micros
-            )
-        )
-
-    # Execute MUTATE 2
-    agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops2)
-    print(f"      ✅ Tree created: Shop '{shop_name}' → {len(maincat_ids)} maincat(s) → CL1 '{custom_label_1}'")
-
-
-def build_listing_tree_for_uitbreiding(
-    client: GoogleAdsClient,
-    customer_id: str,
-    ad_group_id: str,
-    shop_name: str,
-    maincat_id: str,
-    custom_label_1: str,
-    default_bid_micros: int = DEFAULT_BID_MICROS
-):
-    """
-    Build listing tree for uitbreiding (extension) logic:
-
-    Tree structure:
-    ROOT (subdivision)
-    └─ CL1 = custom_label_1 (subdivision)
-       ├─ CL3 = shop_name (subdivision)
-       │  ├─ CL4 = maincat_id (unit, biddable, positive)
-       │  └─ CL4 OTHERS (unit, negative)
-       └─ CL3 OTHERS (unit, negative)
-    └─ CL1 OTHERS (unit, negative)
-
-    This targets:
-    - Custom Label 1 = a/b/c (variant)
-    - Custom Label 3 = shop_name
-    - Custom Label 4 = maincat_id (category)
+                client=client,
+                customer_id=customer_id,
+                ad_group_id=ad_group_id,
+                parent_ad_group_criterion_resource_name=cl4_tmp,
+                listing_dimension_info=dim_cl1,
+                targeting_negative=False,
+                cpc_bid_micros=10_000  # 1 cent = 10,000 micros
+            )
+        )
 
-    Args:
-        client: Google Ads client
-        customer_id: Customer ID
-        ad_group_id: Ad group ID
-        shop_name: Shop name to target (custom label 3)
-        maincat_id: Category ID to target (custom label 4)
-        custom_label_1: Label value (a/b/c) for custom label 1
-        default_bid_micros: Default bid in micros
-    """
-    print(f"      Building tree: CL1={custom_label_1}, Shop={shop_name}, Maincat={maincat_id}")
+    # Execute the whole tree in a single mutate
+    mutate_ad_group_criteria_with_retry(agc_service, customer_id, ops)
+    print(f"      ✅ Tree created: Shop '{shop_name}' → {len(maincat_ids)} maincat(s) → CL1 '{custom_label_1}'")
 
-    # Check if listing tree already exists - if so, skip to preserve exclusions
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
 
-    check_query = f"""
-        SELECT ad_group_criterion.resource_name
-        FROM ad_group_criterion
-        WHERE ad_group_criterion.ad_group = '{ag_path}'
-            AND ad_group_criterion.type = 'LISTING_GROUP'
-        LIMIT 1
+def uitbreiding_tree_operations(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id: str,
+    shop_name: str,
+    maincat_id: str,
+    custom_label_1: str
+) -> list:
     """
+    Build the AdGroupCriterionOperations for an uitbreiding listing tree
+    (see build_listing_tree_for_uitbreiding for the structure).
 
-    try:
-        existing_tree = list(ga_service.search(customer_id=customer_id, query=check_query))
-        if existing_tree:
-            print(f"      ℹ️  Listing tree already exists - skipping to preserve exclusions")
-            return
-    except Exception:
-        pass  # No existing tree, proceed to create
+    ad_group_id may be a temporary (negative) ID when the ad group is created
+    in the same request.
 
-    agc_service = client.get_service("AdGroupCriterionService")
+    Returns:
+        List of AdGroupCriterionOperation, parents before children
+    """
+    # Resolve the custom label index enums once instead of per node
+    index_enum = client.enums.ProductCustomAttributeIndexEnum
+    idx1, idx3, idx4 = index_enum.INDEX1, index_enum.INDEX3, index_enum.INDEX4
 
-    # MUTATE 1: Create ROOT + CL1 subdivision + CL1 OTHERS
+    # ROOT + CL1 subdivision + CL1 OTHERS + CL3/CL4 levels
     # Also need to add CL3 OTHERS under CL1 subdivision (required for subdivision)
-    ops1 = []
+    ops = []
 
     # 1. ROOT SUBDIVISION
     root_op = create_listing_group_subdivision(
@@ -1939,12 +3243,10 @@ def build_listing_tree_for_uitbreiding(
         listing_dimension_info=None
     )
     root_tmp = root_op.create.resource_name
-    ops1.append(root_op)
+    ops.append(root_op)
 
     # 2. Custom Label 1 subdivision (CL1 = a/b/c)
-    dim_cl1 = client.get_type("ListingDimensionInfo")
-    dim_cl1.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-    dim_cl1.product_custom_attribute.value = str(custom_label_1)
+    dim_cl1 = make_custom_label_dim(client, idx1, str(custom_label_1))
 
     cl1_subdivision_op = create_listing_group_subdivision(
         client=client,
@@ -1954,13 +3256,12 @@ def build_listing_tree_for_uitbreiding(
         listing_dimension_info=dim_cl1
     )
     cl1_subdivision_tmp = cl1_subdivision_op.create.resource_name
-    ops1.append(cl1_subdivision_op)
+    ops.append(cl1_subdivision_op)
 
     # 3. Custom Label 3 OTHERS under CL1 subdivision (required for CL1 subdivision)
-    dim_cl3_others = client.get_type("ListingDimensionInfo")
-    dim_cl3_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
+    dim_cl3_others = make_custom_label_dim(client, idx3)
 
-    ops1.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1973,10 +3274,9 @@ def build_listing_tree_for_uitbreiding(
     )
 
     # 4. Custom Label 1 OTHERS (negative - blocks other variants)
-    dim_cl1_others = client.get_type("ListingDimensionInfo")
-    dim_cl1_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
+    dim_cl1_others = make_custom_label_dim(client, idx1)
 
-    ops1.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -1988,36 +3288,25 @@ def build_listing_tree_for_uitbreiding(
         )
     )
 
-    # Execute first mutate
-    resp1 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops1)
-    cl1_subdivision_actual = resp1.results[1].resource_name  # Second result is CL1 subdivision
-
-    # Wait for API to process before next mutate
-    time.sleep(2)
-
-    # MUTATE 2: Create CL3 subdivision under CL1 + CL4 OTHERS under CL3
-    ops2 = []
+    # CL3 subdivision under CL1 + CL4 OTHERS and maincat_id unit under CL3
 
     # 5. Custom Label 3 subdivision (CL3 = shop_name)
-    dim_cl3 = client.get_type("ListingDimensionInfo")
-    dim_cl3.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-    dim_cl3.product_custom_attribute.value = str(shop_name)
+    dim_cl3 = make_custom_label_dim(client, idx3, str(shop_name))
 
     cl3_subdivision_op = create_listing_group_subdivision(
         client=client,
         customer_id=customer_id,
         ad_group_id=ad_group_id,
-        parent_ad_group_criterion_resource_name=cl1_subdivision_actual,
+        parent_ad_group_criterion_resource_name=cl1_subdivision_tmp,
         listing_dimension_info=dim_cl3
     )
     cl3_subdivision_tmp = cl3_subdivision_op.create.resource_name
-    ops2.append(cl3_subdivision_op)
+    ops.append(cl3_subdivision_op)
 
     # 6. Custom Label 4 OTHERS (negative - blocks other categories)
-    dim_cl4_others = client.get_type("ListingDimensionInfo")
-    dim_cl4_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX4
+    dim_cl4_others = make_custom_label_dim(client, idx4)
 
-    ops2.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
@@ -2029,34 +3318,74 @@ def build_listing_tree_for_uitbreiding(
         )
     )
 
-    # Execute second mutate
-    resp2 = agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops2)
-    cl3_subdivision_actual = resp2.results[0].resource_name  # First result is CL3 subdivision
+    # 7. maincat_id as positive CL4 unit (same request, parent via temp name)
+    dim_cl4 = make_custom_label_dim(client, idx4, str(maincat_id))
 
-    # Wait for API to process before next mutate
-    time.sleep(2)
-
-    # MUTATE 3: Add maincat_id as positive CL4 unit
-    ops3 = []
-
-    dim_cl4 = client.get_type("ListingDimensionInfo")
-    dim_cl4.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX4
-    dim_cl4.product_custom_attribute.value = str(maincat_id)
-
-    ops3.append(
+    ops.append(
         create_listing_group_unit_biddable(
             client=client,
             customer_id=customer_id,
             ad_group_id=ad_group_id,
-            parent_ad_group_criterion_resource_name=cl3_subdivision_actual,
+            parent_ad_group_criterion_resource_name=cl3_subdivision_tmp,
             listing_dimension_info=dim_cl4,
             targeting_negative=False,  # POSITIVE - target this maincat
             cpc_bid_micros=10_000  # 1 cent = €0.01 = 10,000 micros
         )
     )
 
-    # Execute third mutate
-    agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops3)
+    return ops
+
+
+def build_listing_tree_for_uitbreiding(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id: str,
+    shop_name: str,
+    maincat_id: str,
+    custom_label_1: str,
+    default_bid_micros: int = DEFAULT_BID_MICROS,
+    ad_groups_with_trees: set = None
+):
+    """
+    Build listing tree for uitbreiding (extension) logic:
+
+    Tree structure:
+    ROOT (subdivision)
+    └─ CL1 = custom_label_1 (subdivision)
+       ├─ CL3 = shop_name (subdivision)
+       │  ├─ CL4 = maincat_id (unit, biddable, positive)
+       │  └─ CL4 OTHERS (unit, negative)
+       └─ CL3 OTHERS (unit, negative)
+    └─ CL1 OTHERS (unit, negative)
+
+    This targets:
+    - Custom Label 1 = a/b/c (variant)
+    - Custom Label 3 = shop_name
+    - Custom Label 4 = maincat_id (category)
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_id: Ad group ID
+        shop_name: Shop name to target (custom label 3)
+        maincat_id: Category ID to target (custom label 4)
+        custom_label_1: Label value (a/b/c) for custom label 1
+        default_bid_micros: Default bid in micros
+        ad_groups_with_trees: Optional set of ad group IDs that already have a tree,
+            from ad_groups_with_existing_trees. Skips the per-ad-group check query.
+    """
+    print(f"      Building tree: CL1={custom_label_1}, Shop={shop_name}, Maincat={maincat_id}")
+
+    # Check if listing tree already exists - if so, skip to preserve exclusions
+    if _listing_tree_exists(client, customer_id, ad_group_id, ad_groups_with_trees):
+        print(f"      ℹ️  Listing tree already exists - skipping to preserve exclusions")
+        return
+
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ops = uitbreiding_tree_operations(client, customer_id, ad_group_id, shop_name, maincat_id, custom_label_1)
+
+    # Execute the whole tree in a single mutate
+    mutate_ad_group_criteria_with_retry(agc_service, customer_id, ops)
     print(f"      ✅ Tree created: CL1='{custom_label_1}' → CL3='{shop_name}' → CL4='{maincat_id}'")
 
 
@@ -2064,6 +3393,250 @@ def build_listing_tree_for_uitbreiding(
 # EXCEL PROCESSING
 # ============================================================================
 
+@dataclass(slots=True)
+class AdGroupAgg:
+    """Inclusion sheet rows grouped per ad group (shop)."""
+    maincat_ids: set = field(default_factory=set)
+    shop_id: Optional[str] = None
+    rows: list = field(default_factory=list)  # Sheet row numbers
+
+
+@dataclass(slots=True)
+class CampaignAgg:
+    """Inclusion sheet rows grouped per campaign (maincat + cl1)."""
+    maincat: Optional[str] = None
+    cl1: Optional[str] = None
+    budget: Optional[float] = None
+    ad_groups: dict = field(default_factory=dict)  # shop_name -> AdGroupAgg
+    rows: list = field(default_factory=list)  # Sheet row numbers
+
+
+# Result cell values that mean "not processed yet". TRUE/FALSE (bool or text)
+# both count as processed, so False and 0 must not be added here.
+EMPTY_STATUS_VALUES = frozenset({None, ''})
+
+
+def processed_rows(sheet, col_result: int) -> set:
+    """
+    Return the numbers of the rows that already have a result (TRUE/FALSE).
+
+    Reads only the result column, as plain values, so callers can skip those
+    rows without building Cell objects for them.
+
+    Args:
+        sheet: Worksheet to read
+        col_result: 0-based result column index
+
+    Returns:
+        set: Row numbers (from 2) with a non-empty result
+    """
+    return {
+        idx
+        for idx, (value,) in enumerate(
+            sheet.iter_rows(min_row=2, min_col=col_result + 1, max_col=col_result + 1, values_only=True),
+            start=2
+        )
+        if value not in EMPTY_STATUS_VALUES
+    }
+
+
+def budget_to_micros(budget) -> int:
+    """
+    Convert a daily budget in EUR to micros (EUR * 1,000,000).
+
+    Missing or invalid budgets fall back to DEFAULT_BUDGET_MICROS.
+    """
+    if not budget:
+        return DEFAULT_BUDGET_MICROS
+    try:
+        return int(float(budget) * 1_000_000)
+    except (ValueError, TypeError):
+        print(f"   ⚠️  Invalid budget value '{budget}', using default 10 EUR")
+        return DEFAULT_BUDGET_MICROS
+
+
+def first_unprocessed_row(done_rows, min_row: int = 2) -> int:
+    """
+    Return the first row number from min_row on that is not in done_rows.
+
+    Row loops start there, so a mostly processed sheet doesn't read (and skip)
+    its already processed leading rows again.
+    """
+    row = min_row
+    while row in done_rows:
+        row += 1
+    return row
+
+
+def flush_row_results(sheet, results_by_row: dict, col_result: int, col_err: int):
+    """
+    Write buffered row results to the result / error columns in one pass.
+
+    Processing code collects results in a dict instead of writing cells as it
+    goes; call this right before each workbook.save and clear the buffer once
+    the save succeeded. An empty buffer means there is nothing new to save.
+
+    Args:
+        sheet: Worksheet to write to
+        results_by_row: row number -> (result, error message)
+        col_result: 0-based result column index
+        col_err: 0-based error message column index, or None to only write results
+    """
+    for row_num in sorted(results_by_row):
+        result, error_msg = results_by_row[row_num]
+        sheet.cell(row=row_num, column=col_result + 1).value = result
+        if col_err is not None:
+            sheet.cell(row=row_num, column=col_err + 1).value = error_msg
+
+
+class ProgressMeter:
+    """
+    Throttled "processed n/total" progress line for long row loops.
+
+    Per-row details go to log.debug; this logs at INFO at most once per
+    interval (and once at the end), so large sheets don't flood the console.
+
+    Args:
+        label: Prefix of the progress line
+        total: Number of items the loop will process
+        interval: Minimum seconds between two progress lines
+    """
+
+    def __init__(self, label: str, total: int, interval: float = PROGRESS_LOG_INTERVAL_SECONDS):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self._interval = interval
+        self._last_log = time.monotonic()
+
+    def update(self, count: int = 1):
+        """Count processed items and log progress if the interval has passed."""
+        self.done += count
+        now = time.monotonic()
+        if now - self._last_log >= self._interval or self.done >= self.total:
+            self._last_log = now
+            log.info("   %s: processed %s/%s", self.label, self.done, self.total)
+
+
+# Suffix main() adds to the input workbook for each run's working copy
+_WORKING_COPY_SUFFIX = re.compile(r"_working_copy_\d{8}_\d{6}(?=\.xlsx$)")
+
+
+class ProgressJournal:
+    """
+    Append-only row result journal next to the source workbook
+    ({source file}.{sheet_name}.{op}.progress.jsonl).
+
+    Replaces periodic workbook saves: each processed row is appended as one
+    JSON line, so progress survives a crash without re-serialising the whole
+    xlsx. On the next run the journal is replayed into the result buffer;
+    after the one final workbook save it is deleted.
+
+    main() works on a new timestamped working copy every run, so the journal
+    is keyed on the file the copy was made from (the _working_copy_{timestamp}
+    suffix is dropped); the next run's working copy then finds it. Several
+    processors read the same sheet (e.g. 'toevoegen'), so the operation is part
+    of the key - one processor never replays another's results.
+
+    Usage:
+        journal, results_by_row = ProgressJournal.open_and_replay(file_path, sheet_name, "inclusion_v2")
+        journal.append({row_num: (True, "")})
+        ...
+        finish_sheet(sheet, workbook, file_path, journal, results_by_row, col_result, col_err)
+    """
+
+    def __init__(self, file_path: str, sheet_name: str, op: str):
+        source_path = _WORKING_COPY_SUFFIX.sub("", file_path)
+        self.path = f"{source_path}.{sheet_name}.{op}.progress.jsonl"
+        self._file = None
+
+    def replay(self) -> dict:
+        """Return {row number: (result, error message)} from an earlier, unfinished run."""
+        results = {}
+        if not os.path.exists(self.path):
+            return results
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Partially written last line after a crash
+                results[entry["row"]] = (entry["result"], entry["err"])
+        return results
+
+    def append(self, results: dict):
+        """Append row results ({row number: (result, error message)}) to the journal."""
+        if self._file is None:
+            self._file = open(self.path, "a+", encoding="utf-8", buffering=1)
+            # Terminate a partially written last line so new entries start on their own line
+            if self._file.tell() > 0:
+                self._file.seek(self._file.tell() - 1)
+                if self._file.read(1) != "\n":
+                    self._file.write("\n")
+        for row_num, (result, error_msg) in results.items():
+            self._file.write(json.dumps({"row": row_num, "result": result, "err": error_msg}) + "\n")
+
+    def close(self, remove: bool = False):
+        """Close the journal; remove=True deletes it (call after a successful save)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if remove and os.path.exists(self.path):
+            os.remove(self.path)
+
+    @classmethod
+    def open_and_replay(cls, file_path: str, sheet_name: str, op: str) -> tuple:
+        """
+        Journal for one processor run plus the row results it replays.
+
+        Returns:
+            (journal, results_by_row); journal is None without a file_path
+        """
+        if not file_path:
+            return None, {}
+        journal = cls(file_path, sheet_name, op)
+        results_by_row = journal.replay()
+        if results_by_row:
+            print(f"   (Resuming: {len(results_by_row)} row result(s) replayed from {journal.path})")
+        return journal, results_by_row
+
+
+def finish_sheet(
+    sheet,
+    workbook: openpyxl.Workbook,
+    file_path: str,
+    journal: Optional[ProgressJournal],
+    results_by_row: dict,
+    col_result: int,
+    col_err: int
+):
+    """
+    Write buffered row results and save the workbook once at the end of a sheet.
+
+    The journal is only deleted once the save succeeded, so a failed save
+    still resumes from it on the next run.
+
+    Args:
+        sheet: Worksheet to write to
+        workbook: Workbook to save
+        file_path: Path to save to, or None to only write the cells
+        journal: The sheet's ProgressJournal, or None
+        results_by_row: row number -> (result, error message)
+        col_result: 0-based result column index
+        col_err: 0-based error message column index, or None to only write results
+    """
+    flush_row_results(sheet, results_by_row, col_result, col_err)
+    if file_path and results_by_row:
+        print(f"\n💾 Final save...")
+        try:
+            workbook.save(file_path)
+            journal.close(remove=True)
+        except Exception as save_error:
+            print(f"⚠️  Error on final save: {save_error}")
+    if journal:
+        journal.close()
+
+
 def process_inclusion_sheet_v2(
     client: GoogleAdsClient,
     workbook: openpyxl.Workbook,
@@ -2105,9 +3678,9 @@ def process_inclusion_sheet_v2(
         customer_id: Customer ID
         file_path: Path to Excel file (for saving)
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING INCLUSION SHEET (V2): '{SHEET_INCLUSION}'")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
     try:
         sheet = workbook[SHEET_INCLUSION]
@@ -2115,13 +3688,14 @@ def process_inclusion_sheet_v2(
         print(f"❌ Sheet '{SHEET_INCLUSION}' not found in workbook")
         return
 
-    # Load a separate workbook with data_only=True to read calculated values from formulas
-    # This is needed because cells may contain VLOOKUP formulas instead of plain values
+    # Load the file once more in read_only + data_only mode to read calculated
+    # values from formulas (cells may contain VLOOKUP formulas instead of plain
+    # values). read_only streams the rows; `workbook` is only written and saved.
     data_workbook = None
     data_sheet = None
     if file_path:
         try:
-            data_workbook = load_workbook(file_path, data_only=True)
+            data_workbook = load_workbook(file_path, data_only=True, read_only=True)
             data_sheet = data_workbook[SHEET_INCLUSION]
             print("   (Using data_only mode to read formula results)")
         except Exception as e:
@@ -2130,7 +3704,7 @@ def process_inclusion_sheet_v2(
 
     # Column indices for this sheet
     COL_SHOP_NAME = 0      # A: shop_name
-    COL_SHOP_ID = 1        # B: Shop ID (not used)
+    COL_SHOP_ID = 1        # B: Shop ID
     COL_MAINCAT = 2        # C: maincat
     COL_MAINCAT_ID = 3     # D: maincat_id
     COL_CL1 = 4            # E: custom label 1
@@ -2138,79 +3712,85 @@ def process_inclusion_sheet_v2(
     COL_RESULT = 6         # G: result (TRUE/FALSE)
     COL_ERR = 7            # H: error message
 
+    # Row results are buffered until finish_sheet; the journal lets an
+    # interrupted run resume without periodic workbook saves
+    journal, results_by_row = ProgressJournal.open_and_replay(file_path, SHEET_INCLUSION, "inclusion_v2")
+
     # Step 1: Read all rows and group by campaign (maincat + cl1), then by shop_name
-    campaigns = defaultdict(lambda: {
-        'maincat': None,
-        'cl1': None,
-        'ad_groups': defaultdict(lambda: {'maincat_ids': set(), 'shop_id': None, 'rows': []}),
-        'budget': None,
-        'rows': []
-    })
+    campaigns = {}  # campaign_name -> CampaignAgg
 
     print("Step 1: Reading and grouping rows by campaign (maincat + cl1) and ad group (shop_name)...")
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-        # Check if status column is empty (use original sheet for status check)
-        status_value = row[COL_RESULT].value if len(row) > COL_RESULT else None
-
+    # Status comes from the writable sheet (it may already hold results from this
+    # run), values from the data_only sheet if available (to get formula results)
+    done_rows = processed_rows(sheet, COL_RESULT) | results_by_row.keys()
+    start_row = first_unprocessed_row(done_rows)
+    # Only the input columns A-F are read; result/error come from done_rows
+    value_rows = (data_sheet if data_sheet is not None else sheet).iter_rows(min_row=start_row, max_col=COL_RESULT, values_only=True)
+
+    for idx, row in enumerate(value_rows, start=start_row):
         # Skip rows that already have a status (TRUE/FALSE)
-        if status_value is not None and status_value != '':
+        if idx in done_rows:
             continue
 
-        # Read values from data_only sheet if available (to get formula results)
-        # Otherwise fall back to original sheet
-        if data_sheet:
-            shop_name = data_sheet.cell(row=idx, column=COL_SHOP_NAME + 1).value
-            shop_id = data_sheet.cell(row=idx, column=COL_SHOP_ID + 1).value
-            maincat = data_sheet.cell(row=idx, column=COL_MAINCAT + 1).value
-            maincat_id = data_sheet.cell(row=idx, column=COL_MAINCAT_ID + 1).value
-            custom_label_1 = data_sheet.cell(row=idx, column=COL_CL1 + 1).value
-            budget = data_sheet.cell(row=idx, column=COL_BUDGET + 1).value
-        else:
-            shop_name = row[COL_SHOP_NAME].value
-            shop_id = row[COL_SHOP_ID].value
-            maincat = row[COL_MAINCAT].value
-            maincat_id = row[COL_MAINCAT_ID].value
-            custom_label_1 = row[COL_CL1].value
-            budget = row[COL_BUDGET].value
+        # read_only rows can be shorter than the sheet width
+        if len(row) < COL_RESULT:
+            row = tuple(row) + (None,) * (COL_RESULT - len(row))
+        shop_name = row[COL_SHOP_NAME]
+        shop_id = row[COL_SHOP_ID]
+        maincat = row[COL_MAINCAT]
+        maincat_id = row[COL_MAINCAT_ID]
+        custom_label_1 = row[COL_CL1]
+        budget = row[COL_BUDGET]
 
         # Validate required fields
         if not shop_name or not maincat or not maincat_id or not custom_label_1:
             print(f"   ⚠️  [Row {idx}] Missing required fields (shop_name/maincat/maincat_id/cl1), skipping")
-            sheet.cell(row=idx, column=COL_RESULT + 1).value = False
-            sheet.cell(row=idx, column=COL_ERR + 1).value = "Missing required fields"
+            results_by_row[idx] = (False, "Missing required fields")
             continue
 
         # Build campaign name from maincat and cl1
         campaign_name = f"PLA/{maincat} store_{custom_label_1}"
 
         # Store campaign-level data
-        campaigns[campaign_name]['maincat'] = maincat
-        campaigns[campaign_name]['cl1'] = custom_label_1
-        campaigns[campaign_name]['budget'] = budget
-        campaigns[campaign_name]['rows'].append({'idx': idx, 'row': row})
+        campaign = campaigns.setdefault(campaign_name, CampaignAgg())
+        campaign.maincat = maincat
+        campaign.cl1 = custom_label_1
+        campaign.budget = budget
+        campaign.rows.append(idx)
 
         # Store ad group data - collect all maincat_ids for this shop
-        campaigns[campaign_name]['ad_groups'][shop_name]['maincat_ids'].add(maincat_id)
-        campaigns[campaign_name]['ad_groups'][shop_name]['shop_id'] = shop_id
-        campaigns[campaign_name]['ad_groups'][shop_name]['rows'].append({'idx': idx, 'row': row})
+        ad_group = campaign.ad_groups.setdefault(shop_name, AdGroupAgg())
+        ad_group.maincat_ids.add(maincat_id)
+        ad_group.shop_id = shop_id
+        ad_group.rows.append(idx)
 
     print(f"   Found {len(campaigns)} campaign(s) to process")
-    total_ad_groups = sum(len(c['ad_groups']) for c in campaigns.values())
+    total_ad_groups = sum(len(c.ad_groups) for c in campaigns.values())
     print(f"   Total ad groups: {total_ad_groups}\n")
 
+    # Look up all needed bid strategies (from MCC account) in one query
+    needed_strategies = {
+        BID_STRATEGY_MAPPING[c.cl1] for c in campaigns.values() if c.cl1 in BID_STRATEGY_MAPPING
+    }
+    strategy_cache = get_bid_strategies_by_name(client, MCC_ACCOUNT_ID, needed_strategies)
+    # custom label 1 -> bid strategy resource name, so the loop does one lookup
+    bid_strategy_by_cl1 = {
+        cl1: strategy_cache[name] for cl1, name in BID_STRATEGY_MAPPING.items() if name in strategy_cache
+    }
+
     # Step 2: Process each campaign
     total_campaigns = len(campaigns)
     successful_campaigns = 0
 
     for campaign_idx, (campaign_name, campaign_data) in enumerate(campaigns.items(), start=1):
-        print(f"\n{'─'*70}")
+        print(f"\n{SUB_SEPARATOR}")
         print(f"CAMPAIGN {campaign_idx}/{total_campaigns}: {campaign_name}")
-        print(f"{'─'*70}")
+        print(SUB_SEPARATOR)
 
-        budget_value = campaign_data['budget']
-        custom_label_1 = campaign_data['cl1']
-        maincat = campaign_data['maincat']
-        ad_groups = campaign_data['ad_groups']
+        budget_value = campaign_data.budget
+        custom_label_1 = campaign_data.cl1
+        maincat = campaign_data.maincat
+        ad_groups = campaign_data.ad_groups
 
         print(f"   Maincat: {maincat}")
         print(f"   Budget: {budget_value} EUR")
@@ -2218,45 +3798,28 @@ def process_inclusion_sheet_v2(
         print(f"   Ad Groups (shops): {len(ad_groups)}")
 
         try:
-            # Campaign configuration
-            merchant_center_account_id = 140784594  # Merchant Center ID
             budget_name = f"Budget_{campaign_name}"
-            tracking_template = ""
-            country = "NL"
 
             # Convert budget from EUR to micros
-            try:
-                budget_micros = int(float(budget_value) * 1_000_000) if budget_value else 10_000_000
-            except (ValueError, TypeError):
-                print(f"   ⚠️  Invalid budget value '{budget_value}', using default 10 EUR")
-                budget_micros = 10_000_000
-
-            # Get bid strategy based on custom label 1
-            bid_strategy_resource_name = None
-            if custom_label_1 and custom_label_1 in BID_STRATEGY_MAPPING:
-                bid_strategy_name = BID_STRATEGY_MAPPING[custom_label_1]
-                print(f"   Looking up bid strategy: {bid_strategy_name}")
-                bid_strategy_resource_name = get_bid_strategy_by_name(
-                    client=client,
-                    customer_id=MCC_ACCOUNT_ID,
-                    strategy_name=bid_strategy_name
-                )
+            budget_micros = budget_to_micros(budget_value)
+
+            # Bid strategy based on custom label 1 (resolved before the loop)
+            bid_strategy_resource_name = bid_strategy_by_cl1.get(custom_label_1)
 
             # Get first ad group's shop info for campaign metadata
-            first_ag_name = list(ad_groups.keys())[0]
-            first_ag_data = ad_groups[first_ag_name]
+            first_ag_name, first_ag_data = next(iter(ad_groups.items()))
 
             # Create campaign (status: PAUSED - set in add_standard_shopping_campaign)
             print(f"\n   Creating campaign: {campaign_name}")
             campaign_resource_name = add_standard_shopping_campaign(
                 client=client,
                 customer_id=customer_id,
-                merchant_center_account_id=merchant_center_account_id,
+                merchant_center_account_id=MERCHANT_CENTER_ACCOUNT_ID,
                 campaign_name=campaign_name,
                 budget_name=budget_name,
-                tracking_template=tracking_template,
-                country=country,
-                shopid=first_ag_data['shop_id'],
+                tracking_template="",
+                country=CAMPAIGN_COUNTRY,
+                shopid=first_ag_data.shop_id,
                 shopname=first_ag_name,
                 label=custom_label_1,
                 budget=budget_micros,
@@ -2277,92 +3840,90 @@ def process_inclusion_sheet_v2(
                     negative_list_name=NEGATIVE_LIST_NAME
                 )
 
-            # Wait after campaign setup before processing ad groups
-            time.sleep(1.0)
+            # Process the ad groups (shops) of this campaign in parallel. Each
+            # worker creates its own ad group, tree and ad, so they don't conflict.
+            print(f"\n   Processing {len(ad_groups)} ad group(s) ({AD_GROUP_SETUP_WORKERS} in parallel)...")
+            ad_groups_processed = set()
 
-            # Process each ad group (shop) within this campaign
-            print(f"\n   Processing {len(ad_groups)} ad group(s)...")
-            ad_groups_processed = []
-            ad_group_errors = {}
+            # Read existing ad groups (and which have trees) once per campaign,
+            # so new ad groups go out as a single mutate with no reads before it
+            existing_ad_groups = campaign_ad_groups_by_name(client, customer_id, campaign_resource_name)
+            ad_groups_with_trees = ad_groups_with_existing_trees(
+                client, customer_id,
+                [resource_name.split('/')[-1] for resource_name in existing_ad_groups.values()]
+            ) if existing_ad_groups else set()
 
-            for ag_idx, (shop_name, ag_data) in enumerate(ad_groups.items(), start=1):
+            def setup_ad_group(ag_idx, shop_name, ag_data):
                 # Build ad group name: PLA/{shop_name}_{cl1}
                 ad_group_name = f"PLA/{shop_name}_{custom_label_1}"
-                print(f"\n   ──── Ad Group {ag_idx}/{len(ad_groups)}: {ad_group_name} ────")
-                print(f"      (Shop: {shop_name})")
+                # Workers run in parallel: every line names its ad group
+                prefix = f"      [{ad_group_name}]"
+                print(f"\n   ──── Ad Group {ag_idx}/{len(ad_groups)}: {ad_group_name} (Shop: {shop_name}) ────")
 
-                try:
-                    maincat_ids = sorted(ag_data['maincat_ids'])
-                    print(f"      Maincat IDs (CL4): {maincat_ids}")
+                maincat_ids = sorted(ag_data.maincat_ids)
+                print(f"{prefix} Maincat IDs (CL4): {maincat_ids}")
 
-                    # Create ad group (status: ENABLED - set in add_shopping_ad_group)
-                    ad_group_resource_name, _ = add_shopping_ad_group(
-                        client=client,
-                        customer_id=customer_id,
-                        campaign_resource_name=campaign_resource_name,
-                        ad_group_name=ad_group_name,
-                        campaign_name=campaign_name
-                    )
+                # For CL3 targeting, split shop_name at | and use first part
+                # e.g. "Hbm-machines.com|NL" becomes "Hbm-machines.com"
+                shop_name_for_targeting = shop_name.split('|')[0] if '|' in shop_name else shop_name
+                if shop_name_for_targeting != shop_name:
+                    print(f"{prefix} CL3 targeting: '{shop_name_for_targeting}' (split from '{shop_name}')")
 
-                    if not ad_group_resource_name:
-                        raise Exception(f"Failed to create/find ad group")
+                # New ad groups: ad group + tree + ad in a single request
+                ad_group_resource_name, created = create_inclusion_ad_group_with_tree(
+                    client=client,
+                    customer_id=customer_id,
+                    campaign_resource_name=campaign_resource_name,
+                    ad_group_name=ad_group_name,
+                    shop_name=shop_name_for_targeting,  # Use split shop_name for CL3
+                    maincat_ids=maincat_ids,
+                    existing_ad_groups=existing_ad_groups
+                )
 
-                    print(f"      ✅ Ad group ready: {ad_group_resource_name}")
+                if not ad_group_resource_name:
+                    raise Exception(f"Failed to create/find ad group")
 
-                    # Wait after ad group creation before building tree
-                    time.sleep(1.0)
+                print(f"{prefix} ✅ Ad group ready: {ad_group_resource_name}")
 
-                    # Extract ad group ID
+                if not created:
+                    # Existing ad group: fill in whatever is missing (tree / ad)
                     ad_group_id = ad_group_resource_name.split('/')[-1]
-
-                    # For CL3 targeting, split shop_name at | and use first part
-                    # e.g. "Hbm-machines.com|NL" becomes "Hbm-machines.com"
-                    shop_name_for_targeting = shop_name.split('|')[0] if '|' in shop_name else shop_name
-                    if shop_name_for_targeting != shop_name:
-                        print(f"      CL3 targeting: '{shop_name_for_targeting}' (split from '{shop_name}')")
-
-                    # Build listing tree with V2 function
                     build_listing_tree_for_inclusion_v2(
                         client=client,
                         customer_id=customer_id,
                         ad_group_id=ad_group_id,
-                        shop_name=shop_name_for_targeting,  # Use split shop_name for CL3
-                        maincat_ids=maincat_ids
+                        shop_name=shop_name_for_targeting,
+                        maincat_ids=maincat_ids,
+                        ad_groups_with_trees=ad_groups_with_trees
                     )
 
-                    # Wait after tree creation before creating ad
-                    time.sleep(2.0)
-
-                    # Create shopping product ad
-                    print(f"      Creating shopping product ad...")
+                    print(f"{prefix} Creating shopping product ad...")
                     add_shopping_product_ad(
                         client=client,
                         customer_id=customer_id,
                         ad_group_resource_name=ad_group_resource_name
                     )
 
-                    ad_groups_processed.append(shop_name)
-                    print(f"      ✅ Ad group completed: {ad_group_name}")
-
-                    # Wait between ad groups to prevent concurrent modification
-                    time.sleep(1.0)
-
-                except Exception as e:
-                    error_msg = str(e)
-                    print(f"      ❌ Failed: {error_msg}")
-                    ad_group_errors[shop_name] = error_msg
+                print(f"{prefix} ✅ Ad group completed")
 
-            # Mark rows as successful/failed
-            for shop_name, ag_data in ad_groups.items():
-                for row_info in ag_data['rows']:
-                    row_num = row_info['idx']
-                    if shop_name in ad_groups_processed:
-                        sheet.cell(row=row_num, column=COL_RESULT + 1).value = True
-                        sheet.cell(row=row_num, column=COL_ERR + 1).value = ""
-                    else:
-                        sheet.cell(row=row_num, column=COL_RESULT + 1).value = False
-                        error_msg = ad_group_errors.get(shop_name, "Failed to process ad group")
-                        sheet.cell(row=row_num, column=COL_ERR + 1).value = error_msg[:100]
+            with ThreadPoolExecutor(max_workers=AD_GROUP_SETUP_WORKERS) as executor:
+                futures = {
+                    executor.submit(setup_ad_group, ag_idx, shop_name, ag_data): shop_name
+                    for ag_idx, (shop_name, ag_data) in enumerate(ad_groups.items(), start=1)
+                }
+                # Mark each ad group's rows as soon as its worker finishes
+                for future in as_completed(futures):
+                    shop_name = futures[future]
+                    try:
+                        future.result()
+                        ad_groups_processed.add(shop_name)
+                        row_result = (True, "")
+                    except Exception as e:
+                        error_msg = str(e)
+                        print(f"      ❌ Failed ({shop_name}): {error_msg}")
+                        row_result = (False, error_msg[:100])
+                    for row_num in ad_groups[shop_name].rows:
+                        results_by_row[row_num] = row_result
 
             if len(ad_groups_processed) > 0:
                 successful_campaigns += 1
@@ -2372,88 +3933,127 @@ def process_inclusion_sheet_v2(
             error_msg = str(e)
             print(f"\n   ❌ CAMPAIGN FAILED: {error_msg}")
             # Mark all rows for this campaign as failed
-            for row_info in campaign_data['rows']:
-                row_num = row_info['idx']
-                sheet.cell(row=row_num, column=COL_RESULT + 1).value = False
-                sheet.cell(row=row_num, column=COL_ERR + 1).value = f"Campaign failed: {error_msg[:80]}"
-
-        # Save periodically
-        if file_path and campaign_idx % 5 == 0:
-            print(f"\n   💾 Saving progress...")
-            try:
-                workbook.save(file_path)
-            except Exception as save_error:
-                print(f"   ⚠️  Error saving: {save_error}")
+            for row_num in campaign_data.rows:
+                results_by_row[row_num] = (False, f"Campaign failed: {error_msg[:80]}")
 
-        # Wait between campaigns to prevent concurrent modification
-        time.sleep(2.0)
+        # Record this campaign's results in the journal instead of saving the workbook
+        if journal:
+            journal.append({row_num: results_by_row[row_num] for row_num in campaign_data.rows})
 
-    # Final save
-    if file_path:
-        print(f"\n💾 Final save...")
-        try:
-            workbook.save(file_path)
-        except Exception as save_error:
-            print(f"⚠️  Error on final save: {save_error}")
+    finish_sheet(sheet, workbook, file_path, journal, results_by_row, COL_RESULT, COL_ERR)
 
     # Close data_only workbook if it was opened
     if data_workbook:
         data_workbook.close()
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"INCLUSION SHEET (V2) SUMMARY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total campaigns: {total_campaigns}")
     print(f"✅ Successful: {successful_campaigns}")
     print(f"❌ Failed: {total_campaigns - successful_campaigns}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
-def pause_ad_group(
+# Only the status field is sent for status updates
+_STATUS_FIELD_MASK = field_mask_pb2.FieldMask(paths=["status"])
+
+
+@with_quota_retry()
+@with_concurrent_modification_retry()
+def _mutate_ad_group_statuses(
     client: GoogleAdsClient,
     customer_id: str,
-    ad_group_resource_name: str
-) -> bool:
+    updates: list
+) -> Dict[str, str]:
     """
-    Pause an ad group by setting its status to PAUSED.
+    Apply (resource_name, status) updates in one mutate_ad_groups request with
+    partial_failure=True. REMOVED uses the remove operation, other statuses an
+    update with a status-only field mask.
+
+    Returns:
+        dict: {resource_name: error message} for the ad groups that failed
+    """
+    if not updates:
+        return {}
+
+    status_enum = client.enums.AdGroupStatusEnum
+    request = client.get_type("MutateAdGroupsRequest")
+    request.customer_id = customer_id
+    ad_group_operation_type = get_cached_type(client, "AdGroupOperation")
+    for resource_name, status in updates:
+        ad_group_operation = ad_group_operation_type()
+        if status == "REMOVED":
+            ad_group_operation.remove = resource_name
+        else:
+            ad_group = ad_group_operation.update
+            ad_group.resource_name = resource_name
+            ad_group.status = status_enum[status]
+            ad_group_operation.update_mask.CopyFrom(_STATUS_FIELD_MASK)
+        request.operations.append(ad_group_operation)
+    request.partial_failure = True
+
+    response = get_cached_service(client, "AdGroupService").mutate_ad_groups(request=request)
+
+    failed = {}
+    if response.partial_failure_error and response.partial_failure_error.code != 0:
+        failure_type = type(client.get_type("GoogleAdsFailure"))
+        for detail in response.partial_failure_error.details:
+            failure = failure_type.deserialize(detail.value)
+            for index, error_msg in failure_errors_by_index(failure, len(updates)).items():
+                failed.setdefault(updates[index][0], error_msg)
+    return failed
+
+
+def set_ad_group_statuses(
+    client: GoogleAdsClient,
+    customer_id: str,
+    updates: list
+) -> Dict[str, bool]:
+    """
+    Set the status of several ad groups in one request.
 
     Args:
         client: Google Ads client
         customer_id: Customer ID
-        ad_group_resource_name: Resource name of the ad group to pause
+        updates: List of (resource_name, "PAUSED" | "ENABLED" | "REMOVED") tuples
 
     Returns:
-        bool: True if successful, False otherwise
+        dict: {resource_name: True if successful, False otherwise}
     """
     try:
-        from google.protobuf import field_mask_pb2
-
-        ad_group_service = client.get_service("AdGroupService")
-        ad_group_operation = client.get_type("AdGroupOperation")
-
-        ad_group = ad_group_operation.update
-        ad_group.resource_name = ad_group_resource_name
-        ad_group.status = client.enums.AdGroupStatusEnum.PAUSED
-
-        # Set the field mask to only update the status field
-        ad_group_operation.update_mask.CopyFrom(
-            field_mask_pb2.FieldMask(paths=["status"])
-        )
-
-        ad_group_service.mutate_ad_groups(
-            customer_id=customer_id,
-            operations=[ad_group_operation]
-        )
-
-        return True
+        failed = _mutate_ad_group_statuses(client, customer_id, updates)
     except GoogleAdsException as ex:
         print(f"      ❌ Google Ads API error: {ex.error.code().name}")
         for error in ex.failure.errors:
             print(f"         {error.message}")
-        return False
+        return {resource_name: False for resource_name, _ in updates}
     except Exception as e:
-        print(f"      ❌ Error pausing ad group: {str(e)}")
-        return False
+        print(f"      ❌ Error updating ad group status: {str(e)}")
+        return {resource_name: False for resource_name, _ in updates}
+
+    for resource_name, error_msg in failed.items():
+        print(f"      ❌ {resource_name}: {error_msg}")
+    return {resource_name: resource_name not in failed for resource_name, _ in updates}
+
+
+def pause_ad_group(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_resource_name: str
+) -> bool:
+    """
+    Pause an ad group by setting its status to PAUSED.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_resource_name: Resource name of the ad group to pause
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return set_ad_group_statuses(client, customer_id, [(ad_group_resource_name, "PAUSED")])[ad_group_resource_name]
 
 
 def enable_ad_group(
@@ -2472,35 +4072,7 @@ def enable_ad_group(
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        from google.protobuf import field_mask_pb2
-
-        ad_group_service = client.get_service("AdGroupService")
-        ad_group_operation = client.get_type("AdGroupOperation")
-
-        ad_group = ad_group_operation.update
-        ad_group.resource_name = ad_group_resource_name
-        ad_group.status = client.enums.AdGroupStatusEnum.ENABLED
-
-        # Set the field mask to only update the status field
-        ad_group_operation.update_mask.CopyFrom(
-            field_mask_pb2.FieldMask(paths=["status"])
-        )
-
-        ad_group_service.mutate_ad_groups(
-            customer_id=customer_id,
-            operations=[ad_group_operation]
-        )
-
-        return True
-    except GoogleAdsException as ex:
-        print(f"      ❌ Google Ads API error: {ex.error.code().name}")
-        for error in ex.failure.errors:
-            print(f"         {error.message}")
-        return False
-    except Exception as e:
-        print(f"      ❌ Error enabling ad group: {str(e)}")
-        return False
+    return set_ad_group_statuses(client, customer_id, [(ad_group_resource_name, "ENABLED")])[ad_group_resource_name]
 
 
 def remove_ad_group(
@@ -2519,27 +4091,68 @@ def remove_ad_group(
     Returns:
         bool: True if successful, False otherwise
     """
-    try:
-        ad_group_service = client.get_service("AdGroupService")
-        ad_group_operation = client.get_type("AdGroupOperation")
+    return set_ad_group_statuses(client, customer_id, [(ad_group_resource_name, "REMOVED")])[ad_group_resource_name]
 
-        # Use the remove operation instead of update with REMOVED status
-        ad_group_operation.remove = ad_group_resource_name
 
-        ad_group_service.mutate_ad_groups(
-            customer_id=customer_id,
-            operations=[ad_group_operation]
-        )
+def remove_ad_groups(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_resource_names: list
+) -> Dict[str, str]:
+    """
+    Remove (delete) several ad groups in one mutate_ad_groups request.
+
+    Sent with partial_failure=True, so one failing ad group does not block the
+    removal of the others.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_resource_names: Resource names of the ad groups to remove
+
+    Returns:
+        dict: {resource_name: error message} for the ad groups that failed
+    """
+    return _mutate_ad_group_statuses(
+        client, customer_id, [(resource_name, "REMOVED") for resource_name in ad_group_resource_names]
+    )
 
-        return True
-    except GoogleAdsException as ex:
-        print(f"      ❌ Google Ads API error: {ex.error.code().name}")
-        for error in ex.failure.errors:
-            print(f"         {error.message}")
-        return False
-    except Exception as e:
-        print(f"      ❌ Error removing ad group: {str(e)}")
-        return False
+
+def enable_ad_groups(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_resource_names: list
+) -> Dict[str, str]:
+    """
+    Enable several ad groups in one mutate_ad_groups request.
+
+    Sent with partial_failure=True, so one failing ad group does not block the
+    others.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_resource_names: Resource names of the ad groups to enable
+
+    Returns:
+        dict: {resource_name: error message} for the ad groups that failed
+    """
+    return _mutate_ad_group_statuses(
+        client, customer_id, [(resource_name, "ENABLED") for resource_name in ad_group_resource_names]
+    )
+
+
+# One ad group by campaign name and ad group name (escape both with escape_gaql_string)
+_AD_GROUP_LOOKUP_QUERY = (
+    "SELECT ad_group.id, ad_group.resource_name, ad_group.name, ad_group.status, "
+    "campaign.id, campaign.name, campaign.resource_name, campaign.status "
+    "FROM ad_group "
+    "WHERE campaign.name = '{campaign_name}' "
+    "AND ad_group.name = '{ad_group_name}' "
+    "AND ad_group.status IN ('ENABLED', 'PAUSED') "
+    "AND campaign.status != 'REMOVED' "
+    "LIMIT 1"
+)
 
 
 def find_ad_group_in_campaign(
@@ -2560,33 +4173,11 @@ def find_ad_group_in_campaign(
     Returns:
         dict with ad_group info or None if not found
     """
-    google_ads_service = client.get_service("GoogleAdsService")
-
-    # Escape special characters for GAQL (only single quotes need escaping)
-    def escape_gaql_string(s):
-        s = s.replace("'", "\\'")
-        return s
-
-    escaped_campaign_name = escape_gaql_string(campaign_name)
-    escaped_ad_group_name = escape_gaql_string(ad_group_name)
-
-    query = f"""
-        SELECT
-            ad_group.id,
-            ad_group.resource_name,
-            ad_group.name,
-            ad_group.status,
-            campaign.id,
-            campaign.name,
-            campaign.resource_name,
-            campaign.status
-        FROM ad_group
-        WHERE campaign.name = '{escaped_campaign_name}'
-        AND ad_group.name = '{escaped_ad_group_name}'
-        AND ad_group.status IN ('ENABLED', 'PAUSED')
-        AND campaign.status != 'REMOVED'
-        LIMIT 1
-    """
+    google_ads_service = get_cached_service(client, "GoogleAdsService")
+    query = _AD_GROUP_LOOKUP_QUERY.format(
+        campaign_name=escape_gaql_string(campaign_name),
+        ad_group_name=escape_gaql_string(ad_group_name)
+    )
 
     try:
         response = google_ads_service.search(customer_id=customer_id, query=query)
@@ -2606,6 +4197,81 @@ def find_ad_group_in_campaign(
     return None
 
 
+def find_ad_groups_in_campaigns(
+    client: GoogleAdsClient,
+    customer_id: str,
+    names: list
+) -> Dict[tuple, Dict[str, Any]]:
+    """
+    Find many ad groups by (campaign name, ad group name) at once.
+
+    Same filters and result dicts as find_ad_group_in_campaign, but one query
+    per 1000 pairs (campaign.name IN (...) AND ad_group.name IN (...)) with
+    the exact pairs matched in Python. Several queries run in parallel (up to
+    AD_GROUP_LOOKUP_WORKERS).
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        names: List of (campaign_name, ad_group_name) tuples
+
+    Returns:
+        dict keyed by (campaign_name, ad_group_name) with ad_group info;
+        pairs that were not found are missing
+    """
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    wanted = sorted(set(names))
+
+    def search_chunk(chunk):
+        query = f"""
+            SELECT
+                ad_group.id,
+                ad_group.resource_name,
+                ad_group.name,
+                ad_group.status,
+                campaign.id,
+                campaign.name,
+                campaign.resource_name,
+                campaign.status
+            FROM ad_group
+            WHERE campaign.name IN ({gaql_string_list(c for c, _ in chunk)})
+            AND ad_group.name IN ({gaql_string_list(a for _, a in chunk)})
+            AND ad_group.status IN ('ENABLED', 'PAUSED')
+            AND campaign.status != 'REMOVED'
+        """
+        try:
+            return search_stream_rows(ga_service, customer_id, query)
+        except GoogleAdsException as ex:
+            print(f"      ❌ Error searching for ad groups: {ex}")
+            return []
+
+    chunks = [wanted[start:start + 1000] for start in range(0, len(wanted), 1000)]
+    if len(chunks) > 1:
+        # Overlap the round trips of the chunk queries (read-only, so safe in parallel)
+        with ThreadPoolExecutor(max_workers=min(AD_GROUP_LOOKUP_WORKERS, len(chunks))) as executor:
+            chunk_rows = list(executor.map(search_chunk, chunks))
+    else:
+        chunk_rows = [search_chunk(chunk) for chunk in chunks]
+
+    ad_groups = {}
+    for chunk, rows in zip(chunks, chunk_rows):
+        chunk_keys = set(chunk)
+        for row in rows:
+            key = (row.campaign.name, row.ad_group.name)
+            if key in chunk_keys and key not in ad_groups:
+                ad_groups[key] = {
+                    'ad_group_id': row.ad_group.id,
+                    'ad_group_resource_name': row.ad_group.resource_name,
+                    'ad_group_name': row.ad_group.name,
+                    'ad_group_status': row.ad_group.status.name,
+                    'campaign_id': row.campaign.id,
+                    'campaign_name': row.campaign.name,
+                    'campaign_resource_name': row.campaign.resource_name
+                }
+
+    return ad_groups
+
+
 def process_reverse_inclusion_sheet_v2(
     client: GoogleAdsClient,
     workbook: openpyxl.Workbook,
@@ -2641,10 +4307,10 @@ def process_reverse_inclusion_sheet_v2(
         customer_id: Customer ID
         file_path: Path to Excel file (for saving)
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING REVERSE INCLUSION SHEET (V2): '{SHEET_REVERSE_INCLUSION}'")
     print(f"(REMOVING AD GROUPS)")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
     try:
         sheet = workbook[SHEET_REVERSE_INCLUSION]
@@ -2662,150 +4328,137 @@ def process_reverse_inclusion_sheet_v2(
     COL_RESULT = 6         # G: result (TRUE/FALSE)
     COL_ERR = 7            # H: Error message
 
+    # Row results are buffered until finish_sheet; the journal lets an
+    # interrupted run resume without periodic workbook saves
+    journal, results_by_row = ProgressJournal.open_and_replay(file_path, SHEET_REVERSE_INCLUSION, "reverse_inclusion")
+
     # Step 1: Read all rows and group by campaign (derived from maincat + cl1)
     # Each shop_name is an ad group within that campaign
-    campaigns_to_process = defaultdict(lambda: {
-        'maincat': None,
-        'cl1': None,
-        'ad_groups': defaultdict(lambda: {'rows': []})  # shop_name -> rows
-    })
+    campaigns_to_process = {}  # campaign_name -> {'maincat', 'cl1', 'ad_groups': {shop_name: {'rows'}}}
 
     print("Step 1: Reading and grouping rows by campaign (maincat + cl1) and ad group (shop_name)...")
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-        # Check if status column is empty
-        status_value = row[COL_RESULT].value if len(row) > COL_RESULT else None
-
+    done_rows = processed_rows(sheet, COL_RESULT)
+    start_row = first_unprocessed_row(done_rows)
+    for idx, row in enumerate(sheet.iter_rows(min_row=start_row, max_col=COL_ERR + 1, values_only=True), start=start_row):
         # Skip rows that already have a status (TRUE/FALSE)
-        if status_value is not None and status_value != '':
+        if idx in done_rows or idx in results_by_row:
             continue
 
-        shop_name = row[COL_SHOP_NAME].value  # This is the ad group name
-        maincat = row[COL_MAINCAT].value
-        cl1 = row[COL_CL1].value
+        shop_name = row[COL_SHOP_NAME]  # This is the ad group name
+        maincat = row[COL_MAINCAT]
+        cl1 = row[COL_CL1]
 
         # Validate required fields
         if not shop_name or not maincat or not cl1:
             print(f"   ⚠️  [Row {idx}] Missing required fields (shop_name/maincat/cl1), skipping")
-            sheet.cell(row=idx, column=COL_RESULT + 1).value = False
-            sheet.cell(row=idx, column=COL_ERR + 1).value = "Missing required fields"
+            results_by_row[idx] = (False, "Missing required fields")
             continue
 
         # Build campaign name from maincat and cl1
         campaign_name = f"PLA/{maincat} store_{cl1}"
 
         # Group by campaign, then by ad group (shop_name)
-        campaigns_to_process[campaign_name]['maincat'] = maincat
-        campaigns_to_process[campaign_name]['cl1'] = cl1
-        campaigns_to_process[campaign_name]['ad_groups'][shop_name]['rows'].append({'idx': idx, 'row': row})
+        campaign = campaigns_to_process.setdefault(campaign_name, {'maincat': maincat, 'cl1': cl1, 'ad_groups': {}})
+        campaign['maincat'] = maincat
+        campaign['cl1'] = cl1
+        campaign['ad_groups'].setdefault(shop_name, {'rows': []})['rows'].append({'idx': idx, 'row': row})
 
     total_campaigns = len(campaigns_to_process)
     total_ad_groups = sum(len(c['ad_groups']) for c in campaigns_to_process.values())
     print(f"   Found {total_campaigns} campaign(s) with {total_ad_groups} unique ad group(s) to remove")
 
+    # Look up all ad groups to remove in one query instead of one per shop
+    print(f"   Searching for {total_ad_groups} ad group(s)...")
+    ag_lookup = find_ad_groups_in_campaigns(client, customer_id, [
+        (campaign_name, f"PLA/{shop_name}_{campaign_data['cl1']}")
+        for campaign_name, campaign_data in campaigns_to_process.items()
+        for shop_name in campaign_data['ad_groups']
+    ])
+
     # Step 2: Process each campaign and its ad groups
     successful_removals = 0
     failed_removals = 0
-    processed_ag_count = 0
 
     for camp_idx, (campaign_name, campaign_data) in enumerate(campaigns_to_process.items(), start=1):
-        print(f"\n{'─'*70}")
+        print(f"\n{SUB_SEPARATOR}")
         print(f"CAMPAIGN {camp_idx}/{total_campaigns}: {campaign_name}")
-        print(f"{'─'*70}")
+        print(SUB_SEPARATOR)
         print(f"   Maincat: {campaign_data['maincat']}")
         print(f"   Custom Label 1: {campaign_data['cl1']}")
         print(f"   Ad Groups to remove: {len(campaign_data['ad_groups'])}")
 
-        # Process each ad group (shop_name) in this campaign
+        # Resolve each ad group (shop_name) of this campaign, then remove them all
+        # in one request
+        to_remove = []  # (shop_name, ag_data, ad_group_resource_name)
         for shop_name, ag_data in campaign_data['ad_groups'].items():
-            processed_ag_count += 1
-
             # Build ad group name: PLA/{shop_name}_{cl1}
             ad_group_name = f"PLA/{shop_name}_{campaign_data['cl1']}"
             print(f"\n   ──── Ad Group: {ad_group_name} ────")
             print(f"      (Shop: {shop_name})")
 
-            try:
-                # Find the ad group
-                print(f"      Searching for ad group...")
-                ad_group_info = find_ad_group_in_campaign(
-                    client=client,
-                    customer_id=customer_id,
-                    campaign_name=campaign_name,
-                    ad_group_name=ad_group_name
-                )
+            # Look up the ad group (prefetched before the loop)
+            ad_group_info = ag_lookup.get((campaign_name, ad_group_name))
 
-                if not ad_group_info:
-                    raise Exception(f"Ad group not found in campaign")
+            if not ad_group_info:
+                print(f"      ❌ Failed: Ad group not found in campaign")
+                failed_removals += 1
+                for row_info in ag_data['rows']:
+                    results_by_row[row_info['idx']] = (False, "Ad group not found in campaign")
+                continue
 
-                print(f"      ✅ Found ad group (ID: {ad_group_info['ad_group_id']})")
-                print(f"         Current status: {ad_group_info['ad_group_status']}")
+            print(f"      ✅ Found ad group (ID: {ad_group_info['ad_group_id']})")
+            print(f"         Current status: {ad_group_info['ad_group_status']}")
 
-                # Check if already removed
-                if ad_group_info['ad_group_status'] == 'REMOVED':
-                    print(f"      ℹ️  Ad group is already REMOVED")
-                    # Mark as successful anyway
-                    for row_info in ag_data['rows']:
-                        row_num = row_info['idx']
-                        sheet.cell(row=row_num, column=COL_RESULT + 1).value = True
-                        sheet.cell(row=row_num, column=COL_ERR + 1).value = "Already removed"
-                    successful_removals += 1
-                    continue
+            # Check if already removed
+            if ad_group_info['ad_group_status'] == 'REMOVED':
+                print(f"      ℹ️  Ad group is already REMOVED")
+                # Mark as successful anyway
+                for row_info in ag_data['rows']:
+                    results_by_row[row_info['idx']] = (True, "Already removed")
+                successful_removals += 1
+                continue
 
-                # Remove the ad group
-                print(f"      Removing ad group...")
-                success = remove_ad_group(
-                    client=client,
-                    customer_id=customer_id,
-                    ad_group_resource_name=ad_group_info['ad_group_resource_name']
-                )
+            to_remove.append((shop_name, ag_data, ad_group_info['ad_group_resource_name']))
+
+        if to_remove:
+            print(f"\n   Removing {len(to_remove)} ad group(s)...")
+            try:
+                failed = remove_ad_groups(client, customer_id, [rn for _, _, rn in to_remove])
+            except Exception as e:
+                # Whole request failed - mark every ad group of this campaign
+                failed = {rn: str(e) for _, _, rn in to_remove}
 
-                if success:
-                    print(f"      ✅ Ad group removed successfully")
+            for shop_name, ag_data, resource_name in to_remove:
+                error_msg = failed.get(resource_name)
+                if error_msg is None:
                     successful_removals += 1
-                    # Mark all rows for this ad group as successful
                     for row_info in ag_data['rows']:
-                        row_num = row_info['idx']
-                        sheet.cell(row=row_num, column=COL_RESULT + 1).value = True
-                        sheet.cell(row=row_num, column=COL_ERR + 1).value = ""
+                        results_by_row[row_info['idx']] = (True, "")
                 else:
-                    raise Exception("Failed to remove ad group")
-
-                time.sleep(0.3)  # Small delay between API calls
-
-            except Exception as e:
-                error_msg = str(e)
-                print(f"      ❌ Failed: {error_msg}")
-                failed_removals += 1
-                # Mark all rows for this ad group as failed
-                for row_info in ag_data['rows']:
-                    row_num = row_info['idx']
-                    sheet.cell(row=row_num, column=COL_RESULT + 1).value = False
-                    sheet.cell(row=row_num, column=COL_ERR + 1).value = error_msg[:100]
+                    print(f"      ❌ Failed ({shop_name}): {error_msg}")
+                    failed_removals += 1
+                    for row_info in ag_data['rows']:
+                        results_by_row[row_info['idx']] = (False, error_msg[:100])
+            print(f"   ✅ Removed {len(to_remove) - len(failed)}/{len(to_remove)} ad group(s)")
 
-            # Save periodically
-            if file_path and processed_ag_count % 10 == 0:
-                print(f"\n   💾 Saving progress...")
-                try:
-                    workbook.save(file_path)
-                except Exception as save_error:
-                    print(f"   ⚠️  Error saving: {save_error}")
+        # Record this campaign's results in the journal instead of saving the workbook
+        if journal:
+            journal.append({
+                row_info['idx']: results_by_row[row_info['idx']]
+                for ag_data in campaign_data['ad_groups'].values()
+                for row_info in ag_data['rows']
+            })
 
-    # Final save
-    if file_path:
-        print(f"\n💾 Final save...")
-        try:
-            workbook.save(file_path)
-        except Exception as save_error:
-            print(f"⚠️  Error on final save: {save_error}")
+    finish_sheet(sheet, workbook, file_path, journal, results_by_row, COL_RESULT, COL_ERR)
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"REVERSE INCLUSION SHEET (V2) SUMMARY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total campaigns: {total_campaigns}")
     print(f"Total ad groups: {total_ad_groups}")
     print(f"✅ Removed: {successful_removals}")
     print(f"❌ Failed: {failed_removals}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
 def process_enable_inclusion_sheet_v2(
@@ -2844,9 +4497,9 @@ def process_enable_inclusion_sheet_v2(
         file_path: Path to Excel file (for saving)
         sheet_name: Name of sheet to process (default: 'hervatten')
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING ENABLE INCLUSION SHEET (V2): '{sheet_name}'")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
     try:
         sheet = workbook[sheet_name]
@@ -2864,150 +4517,144 @@ def process_enable_inclusion_sheet_v2(
     COL_RESULT = 6         # G: result (TRUE/FALSE)
     COL_ERR = 7            # H: Error message
 
-    # Step 1: Read all rows and group by campaign (derived from maincat + cl1)
-    # Each shop_name is an ad group within that campaign
-    campaigns_to_process = defaultdict(lambda: {
-        'maincat': None,
-        'cl1': None,
-        'ad_groups': defaultdict(lambda: {'rows': []})  # shop_name -> rows
-    })
+    # Row results are buffered until finish_sheet; the journal lets an
+    # interrupted run resume without periodic workbook saves
+    journal, results_by_row = ProgressJournal.open_and_replay(file_path, sheet_name, "enable_inclusion")
 
-    print("Step 1: Reading and grouping rows by campaign (maincat + cl1) and ad group (shop_name)...")
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-        # Check if status column is empty
-        status_value = row[COL_RESULT].value if len(row) > COL_RESULT else None
+    # Step 1: Read all rows and group their row numbers per ad group. The campaign
+    # is derived from maincat + cl1, each shop_name is an ad group within it
+    camp_meta = {}  # campaign_name -> (maincat, cl1)
+    rows_by_ag = defaultdict(list)  # (campaign_name, shop_name) -> row numbers
 
+    print("Step 1: Reading and grouping rows by campaign (maincat + cl1) and ad group (shop_name)...")
+    done_rows = processed_rows(sheet, COL_RESULT) | results_by_row.keys()
+    start_row = first_unprocessed_row(done_rows)
+    for idx, row in enumerate(sheet.iter_rows(min_row=start_row, max_col=COL_CL1 + 1, values_only=True), start=start_row):
         # Skip rows that already have a status (TRUE/FALSE)
-        if status_value is not None and status_value != '':
+        if idx in done_rows:
             continue
 
-        shop_name = row[COL_SHOP_NAME].value  # This is the ad group name
-        maincat = row[COL_MAINCAT].value
-        cl1 = row[COL_CL1].value
+        shop_name = row[COL_SHOP_NAME]  # This is the ad group name
+        maincat = row[COL_MAINCAT]
+        cl1 = row[COL_CL1]
 
         # Validate required fields
         if not shop_name or not maincat or not cl1:
             print(f"   ⚠️  [Row {idx}] Missing required fields (shop_name/maincat/cl1), skipping")
-            sheet.cell(row=idx, column=COL_RESULT + 1).value = False
-            sheet.cell(row=idx, column=COL_ERR + 1).value = "Missing required fields"
+            results_by_row[idx] = (False, "Missing required fields")
             continue
 
         # Build campaign name from maincat and cl1
         campaign_name = f"PLA/{maincat} store_{cl1}"
 
-        # Group by campaign, then by ad group (shop_name)
-        campaigns_to_process[campaign_name]['maincat'] = maincat
-        campaigns_to_process[campaign_name]['cl1'] = cl1
-        campaigns_to_process[campaign_name]['ad_groups'][shop_name]['rows'].append({'idx': idx, 'row': row})
+        camp_meta.setdefault(campaign_name, (maincat, cl1))
+        rows_by_ag[(campaign_name, shop_name)].append(idx)
 
-    total_campaigns = len(campaigns_to_process)
-    total_ad_groups = sum(len(c['ad_groups']) for c in campaigns_to_process.values())
+    # Ad groups per campaign, in sheet order
+    shops_by_campaign = {campaign_name: [] for campaign_name in camp_meta}
+    for campaign_name, shop_name in rows_by_ag:
+        shops_by_campaign[campaign_name].append(shop_name)
+
+    total_campaigns = len(camp_meta)
+    total_ad_groups = len(rows_by_ag)
     print(f"   Found {total_campaigns} campaign(s) with {total_ad_groups} unique ad group(s) to enable")
 
+    # Look up all ad groups to enable in one query instead of one per shop
+    print(f"   Searching for {total_ad_groups} ad group(s)...")
+    ag_lookup = find_ad_groups_in_campaigns(client, customer_id, [
+        (campaign_name, f"PLA/{shop_name}_{camp_meta[campaign_name][1]}")
+        for campaign_name, shop_name in rows_by_ag
+    ])
+
     # Step 2: Process each campaign and its ad groups
     successful_enables = 0
     failed_enables = 0
     processed_ag_count = 0
 
-    for camp_idx, (campaign_name, campaign_data) in enumerate(campaigns_to_process.items(), start=1):
-        print(f"\n{'─'*70}")
+    for camp_idx, (campaign_name, shop_names) in enumerate(shops_by_campaign.items(), start=1):
+        maincat, cl1 = camp_meta[campaign_name]
+        print(f"\n{SUB_SEPARATOR}")
         print(f"CAMPAIGN {camp_idx}/{total_campaigns}: {campaign_name}")
-        print(f"{'─'*70}")
-        print(f"   Maincat: {campaign_data['maincat']}")
-        print(f"   Custom Label 1: {campaign_data['cl1']}")
-        print(f"   Ad Groups to enable: {len(campaign_data['ad_groups'])}")
+        print(SUB_SEPARATOR)
+        print(f"   Maincat: {maincat}")
+        print(f"   Custom Label 1: {cl1}")
+        print(f"   Ad Groups to enable: {len(shop_names)}")
 
-        # Process each ad group (shop_name) in this campaign
-        for shop_name, ag_data in campaign_data['ad_groups'].items():
+        # Resolve each ad group (shop_name) of this campaign, then enable them all
+        # in one request
+        to_enable = []  # (shop_name, row_nums, ad_group_resource_name)
+        for shop_name in shop_names:
             processed_ag_count += 1
+            row_nums = rows_by_ag[(campaign_name, shop_name)]
 
             # Build ad group name: PLA/{shop_name}_{cl1}
-            ad_group_name = f"PLA/{shop_name}_{campaign_data['cl1']}"
+            ad_group_name = f"PLA/{shop_name}_{cl1}"
             print(f"\n   ──── Ad Group: {ad_group_name} ────")
             print(f"      (Shop: {shop_name})")
 
-            try:
-                # Find the ad group
-                print(f"      Searching for ad group...")
-                ad_group_info = find_ad_group_in_campaign(
-                    client=client,
-                    customer_id=customer_id,
-                    campaign_name=campaign_name,
-                    ad_group_name=ad_group_name
-                )
-
-                if not ad_group_info:
-                    raise Exception(f"Ad group not found in campaign")
+            # Look up the ad group (prefetched before the loop)
+            ad_group_info = ag_lookup.get((campaign_name, ad_group_name))
 
-                print(f"      ✅ Found ad group (ID: {ad_group_info['ad_group_id']})")
-                print(f"         Current status: {ad_group_info['ad_group_status']}")
-
-                # Check if already enabled
-                if ad_group_info['ad_group_status'] == 'ENABLED':
-                    print(f"      ℹ️  Ad group is already ENABLED")
-                    # Mark as successful anyway
-                    for row_info in ag_data['rows']:
-                        row_num = row_info['idx']
-                        sheet.cell(row=row_num, column=COL_RESULT + 1).value = True
-                        sheet.cell(row=row_num, column=COL_ERR + 1).value = "Already enabled"
-                    successful_enables += 1
-                    continue
+            if not ad_group_info:
+                print(f"      ❌ Failed: Ad group not found in campaign")
+                failed_enables += 1
+                for row_num in row_nums:
+                    results_by_row[row_num] = (False, "Ad group not found in campaign")
+                continue
 
-                # Enable the ad group
-                print(f"      Enabling ad group...")
-                success = enable_ad_group(
-                    client=client,
-                    customer_id=customer_id,
-                    ad_group_resource_name=ad_group_info['ad_group_resource_name']
-                )
+            print(f"      ✅ Found ad group (ID: {ad_group_info['ad_group_id']})")
+            print(f"         Current status: {ad_group_info['ad_group_status']}")
 
-                if success:
-                    print(f"      ✅ Ad group enabled successfully")
-                    successful_enables += 1
-                    # Mark all rows for this ad group as successful
-                    for row_info in ag_data['rows']:
-                        row_num = row_info['idx']
-                        sheet.cell(row=row_num, column=COL_RESULT + 1).value = True
-                        sheet.cell(row=row_num, column=COL_ERR + 1).value = ""
-                else:
-                    raise Exception("Failed to enable ad group")
+            # Check if already enabled
+            if ad_group_info['ad_group_status'] == 'ENABLED':
+                print(f"      ℹ️  Ad group is already ENABLED")
+                # Mark as successful anyway
+                for row_num in row_nums:
+                    results_by_row[row_num] = (True, "Already enabled")
+                successful_enables += 1
+                continue
 
-                time.sleep(0.3)  # Small delay between API calls
+            to_enable.append((shop_name, row_nums, ad_group_info['ad_group_resource_name']))
 
+        if to_enable:
+            print(f"\n   Enabling {len(to_enable)} ad group(s)...")
+            try:
+                failed = enable_ad_groups(client, customer_id, [rn for _, _, rn in to_enable])
             except Exception as e:
-                error_msg = str(e)
-                print(f"      ❌ Failed: {error_msg}")
-                failed_enables += 1
-                # Mark all rows for this ad group as failed
-                for row_info in ag_data['rows']:
-                    row_num = row_info['idx']
-                    sheet.cell(row=row_num, column=COL_RESULT + 1).value = False
-                    sheet.cell(row=row_num, column=COL_ERR + 1).value = error_msg[:100]
-
-            # Save periodically
-            if file_path and processed_ag_count % 10 == 0:
-                print(f"\n   💾 Saving progress...")
-                try:
-                    workbook.save(file_path)
-                except Exception as save_error:
-                    print(f"   ⚠️  Error saving: {save_error}")
-
-    # Final save
-    if file_path:
-        print(f"\n💾 Final save...")
-        try:
-            workbook.save(file_path)
-        except Exception as save_error:
-            print(f"⚠️  Error on final save: {save_error}")
+                # Whole request failed - mark every ad group of this campaign
+                failed = {rn: str(e) for _, _, rn in to_enable}
 
-    print(f"\n{'='*70}")
+            for shop_name, row_nums, resource_name in to_enable:
+                error_msg = failed.get(resource_name)
+                if error_msg is None:
+                    successful_enables += 1
+                    for row_num in row_nums:
+                        results_by_row[row_num] = (True, "")
+                else:
+                    print(f"      ❌ Failed ({shop_name}): {error_msg}")
+                    failed_enables += 1
+                    for row_num in row_nums:
+                        results_by_row[row_num] = (False, error_msg[:100])
+            print(f"   ✅ Enabled {len(to_enable) - len(failed)}/{len(to_enable)} ad group(s)")
+
+        # Record this campaign's results in the journal instead of saving the workbook
+        if journal:
+            journal.append({
+                row_num: results_by_row[row_num]
+                for shop_name in shop_names
+                for row_num in rows_by_ag[(campaign_name, shop_name)]
+            })
+
+    finish_sheet(sheet, workbook, file_path, journal, results_by_row, COL_RESULT, COL_ERR)
+
+    print(f"\n{SEPARATOR}")
     print(f"ENABLE INCLUSION SHEET (V2) SUMMARY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total campaigns: {total_campaigns}")
     print(f"Total ad groups: {total_ad_groups}")
     print(f"✅ Enabled: {successful_enables}")
     print(f"❌ Failed: {failed_enables}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
 def process_inclusion_sheet_legacy(
@@ -3048,9 +4695,9 @@ def process_inclusion_sheet_legacy(
         customer_id: Customer ID
         file_path: Path to Excel file (for saving progress)
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING INCLUSION SHEET (LEGACY): '{SHEET_INCLUSION}'")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
     try:
         sheet = workbook[SHEET_INCLUSION]
@@ -3058,41 +4705,43 @@ def process_inclusion_sheet_legacy(
         print(f"❌ Sheet '{SHEET_INCLUSION}' not found in workbook")
         return
 
+    # Row results are buffered until finish_sheet; the journal lets an
+    # interrupted run resume without periodic workbook saves
+    journal, results_by_row = ProgressJournal.open_and_replay(file_path, SHEET_INCLUSION, "inclusion_legacy")
+
     # Step 1: Read all rows and group by (maincat, custom_label_1) only
     groups = defaultdict(list)  # key: (maincat, custom_label_1), value: list of row data
+    unique_shops_by_group = defaultdict(dict)  # key: (maincat, custom_label_1), value: shop_name -> shop_id
+    budget_micros_by_group = {}  # key: (maincat, custom_label_1), value: first row's budget in micros
 
     print("Step 1: Reading and grouping rows...")
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
-        # Check if status column (G) is empty - if so, this is where we start processing
-        status_value = row[COL_LEGACY_STATUS].value
-
+    # Plain values only - rows keep their row number, not their Cell objects
+    done_rows = processed_rows(sheet, COL_LEGACY_STATUS) | results_by_row.keys()
+    start_row = first_unprocessed_row(done_rows)
+    # Only write error messages if the sheet has an error column
+    col_err = COL_LEGACY_ERROR if sheet.max_column > COL_LEGACY_ERROR else None
+    for idx, row in enumerate(sheet.iter_rows(min_row=start_row, max_col=COL_LEGACY_BUDGET + 1, values_only=True), start=start_row):
         # Skip rows that already have a status (TRUE/FALSE)
-        if status_value is not None and status_value != '':
+        if idx in done_rows:
             continue
 
-        shop_name = row[COL_LEGACY_SHOP_NAME].value
-        shop_id = row[COL_LEGACY_SHOP_ID].value
-        maincat = row[COL_LEGACY_MAINCAT].value
-        maincat_id = row[COL_LEGACY_MAINCAT_ID].value
-        custom_label_1 = row[COL_LEGACY_CUSTOM_LABEL_1].value
-        budget = row[COL_LEGACY_BUDGET].value
+        shop_name, shop_id, maincat, maincat_id, custom_label_1, budget = row
 
         # Validate required fields
         if not shop_name or not maincat or not maincat_id or not custom_label_1:
             print(f"   ⚠️  [Row {idx}] Missing required fields (shop_name/maincat/maincat_id/custom_label_1), skipping")
-            row[COL_LEGACY_STATUS].value = False
-            # Only write to error column if it exists
-            if len(row) > COL_LEGACY_ERROR:
-                row[COL_LEGACY_ERROR].value = "Missing required fields (shop_name/maincat/maincat_id/custom_label_1)"
+            results_by_row[idx] = (False, "Missing required fields (shop_name/maincat/maincat_id/custom_label_1)")
             continue
 
         # Group by (maincat, custom_label_1) only - multiple shops per campaign
         group_key = (maincat, custom_label_1)
+        unique_shops_by_group[group_key].setdefault(shop_name, shop_id)
+        if group_key not in budget_micros_by_group:
+            budget_micros_by_group[group_key] = budget_to_micros(budget)
 
         # Store row data
         groups[group_key].append({
             'row_idx': idx,
-            'row_obj': row,
             'shop_name': shop_name,
             'shop_id': shop_id,
             'maincat': maincat,
@@ -3103,215 +4752,214 @@ def process_inclusion_sheet_legacy(
 
     print(f"   Found {len(groups)} unique group(s) to process\n")
 
+    # Look up all needed bid strategies (from MCC account) in one query
+    needed_strategies = {
+        BID_STRATEGY_MAPPING[cl1] for (_, cl1) in groups if cl1 in BID_STRATEGY_MAPPING
+    }
+    strategy_cache = get_bid_strategies_by_name(client, MCC_ACCOUNT_ID, needed_strategies)
+    # custom label 1 -> bid strategy resource name, so the loop does one lookup
+    bid_strategy_by_cl1 = {
+        cl1: strategy_cache[name] for cl1, name in BID_STRATEGY_MAPPING.items() if name in strategy_cache
+    }
+
+    # Look up existing campaigns in one query and create the missing ones up
+    # front in batched requests; any that fail there are created in the loop
+    campaign_names = {group_key: f"PLA/{group_key[0]} store_{group_key[1]}" for group_key in groups}
+    known_campaigns = campaigns_by_name(client, customer_id, campaign_names.values())
+    known_campaigns.update(create_shopping_campaigns(client, customer_id, {
+        name: (budget_micros_by_group[group_key], bid_strategy_by_cl1.get(group_key[1]))
+        for group_key, name in campaign_names.items()
+        if name not in known_campaigns
+    }))
+
     # Step 2: Process each group
     total_groups = len(groups)
     successful_groups = 0
+    progress = ProgressMeter("Shops", sum(len(shops) for shops in unique_shops_by_group.values()))
 
     for group_idx, (group_key, rows_in_group) in enumerate(groups.items(), start=1):
-        # Delay between groups to prevent concurrent modification errors
-        if group_idx > 1:
-            time.sleep(2)
-
         maincat, custom_label_1 = group_key
 
-        print(f"\n{'─'*70}")
+        print(f"\n{SUB_SEPARATOR}")
         print(f"GROUP {group_idx}/{total_groups}: {maincat} | {custom_label_1}")
         print(f"   Rows in group: {len(rows_in_group)}")
-        print(f"{'─'*70}")
+        print(SUB_SEPARATOR)
 
         # Get metadata from first row (all rows in group share same maincat, maincat_id, budget)
         first_row = rows_in_group[0]
         maincat_id = first_row['maincat_id']
         budget_value = first_row['budget']
 
-        # Get unique shops in this group
-        unique_shops = {}  # shop_name -> shop_id mapping
-        for row_data in rows_in_group:
-            unique_shops[row_data['shop_name']] = row_data['shop_id']
+        # Unique shops in this group (shop_name -> shop_id), collected while grouping
+        unique_shops = unique_shops_by_group[group_key]
 
         print(f"   Maincat ID: {maincat_id}")
         print(f"   Budget: {budget_value} EUR")
         print(f"   Unique shops in group: {len(unique_shops)}")
 
         try:
-            # Build campaign name: PLA/{maincat} store_{custom_label_1}
-            campaign_name = f"PLA/{maincat} store_{custom_label_1}"
+            # Campaign name: PLA/{maincat} store_{custom_label_1} (built before the loop)
+            campaign_name = campaign_names[group_key]
             print(f"\n   Step 1: Checking for existing campaign or creating new: {campaign_name}")
 
-            # Campaign configuration
-            merchant_center_account_id = 140784594  # Merchant Center ID
-            budget_name = f"Budget_{campaign_name}"
-            tracking_template = ""  # Not needed
-            country = "NL"  # Always Netherlands
+            # Found or batch-created before the loop
+            campaign_resource_name = known_campaigns.get(campaign_name)
+            if not campaign_resource_name:
+                budget_name = f"Budget_{campaign_name}"
 
-            # Convert budget from EUR to micros (EUR * 1,000,000)
-            # Default to 10 EUR if budget is missing or invalid
-            try:
-                budget_micros = int(float(budget_value) * 1_000_000) if budget_value else 10_000_000
-            except (ValueError, TypeError):
-                print(f"   ⚠️  Invalid budget value '{budget_value}', using default 10 EUR")
-                budget_micros = 10_000_000
-
-            # Get bid strategy based on custom label 1 (from MCC account)
-            bid_strategy_resource_name = None
-            if custom_label_1 in BID_STRATEGY_MAPPING:
-                bid_strategy_name = BID_STRATEGY_MAPPING[custom_label_1]
-                print(f"   Looking up bid strategy: {bid_strategy_name} (in MCC account)")
-                bid_strategy_resource_name = get_bid_strategy_by_name(
-                    client=client,
-                    customer_id=MCC_ACCOUNT_ID,  # Search in MCC account
-                    strategy_name=bid_strategy_name
-                )
+                # Budget in micros, converted once while grouping (default 10 EUR)
+                budget_micros = budget_micros_by_group[group_key]
 
-            # Use first shop's ID for campaign metadata
-            first_shop_id = list(unique_shops.values())[0]
-            first_shop_name = list(unique_shops.keys())[0]
+                # Bid strategy based on custom label 1 (resolved before the loop)
+                bid_strategy_resource_name = bid_strategy_by_cl1.get(custom_label_1)
 
-            campaign_resource_name = add_standard_shopping_campaign(
-                client=client,
-                customer_id=customer_id,
-                merchant_center_account_id=merchant_center_account_id,
-                campaign_name=campaign_name,
-                budget_name=budget_name,
-                tracking_template=tracking_template,
-                country=country,
-                shopid=first_shop_id,
-                shopname=first_shop_name,
-                label=custom_label_1,
-                budget=budget_micros,
-                bidding_strategy_resource_name=bid_strategy_resource_name
-            )
+                # Use first shop's ID for campaign metadata
+                first_shop_name, first_shop_id = next(iter(unique_shops.items()))
+
+                api_rate_limiter.acquire()
+
+                campaign_resource_name = add_standard_shopping_campaign(
+                    client=client,
+                    customer_id=customer_id,
+                    merchant_center_account_id=MERCHANT_CENTER_ACCOUNT_ID,
+                    campaign_name=campaign_name,
+                    budget_name=budget_name,
+                    tracking_template="",
+                    country=CAMPAIGN_COUNTRY,
+                    shopid=first_shop_id,
+                    shopname=first_shop_name,
+                    label=custom_label_1,
+                    budget=budget_micros,
+                    bidding_strategy_resource_name=bid_strategy_resource_name
+                )
 
             if not campaign_resource_name:
                 raise Exception("Failed to create/find campaign")
 
             print(f"   Campaign resource: {campaign_resource_name}")
 
-            # Check/create multiple ad groups - one for each unique shop
-            print(f"\n   Step 2: Processing ad groups for {len(unique_shops)} shop(s)...")
-            shops_processed_successfully = []
+            # All ad groups of the campaign (and which have trees) in one query
+            # each, instead of existence searches per shop
+            existing_ad_groups = campaign_ad_groups_by_name(client, customer_id, campaign_resource_name)
+            ad_groups_with_trees = ad_groups_with_existing_trees(
+                client, customer_id,
+                [resource_name.split('/')[-1] for resource_name in existing_ad_groups.values()]
+            ) if existing_ad_groups else set()
+
+            # Check/create multiple ad groups - one for each unique shop. Shops
+            # are independent, so their ad groups are set up in parallel; the
+            # shared api_rate_limiter keeps the workers under the QPS cap.
+            print(f"\n   Step 2: Processing ad groups for {len(unique_shops)} shop(s) ({AD_GROUP_SETUP_WORKERS} in parallel)...")
+            shops_processed_successfully = set()
             shop_errors = {}  # Track errors per shop
 
-            for shop_idx, (shop_name, shop_id) in enumerate(unique_shops.items(), start=1):
-                # Delay between shops to prevent concurrent modification errors
-                if shop_idx > 1:
-                    time.sleep(1.5)
-
-                print(f"\n   ──── Shop {shop_idx}/{len(unique_shops)}: {shop_name} ────")
+            def setup_shop(shop_idx, shop_name):
+                print(f"   ──── Shop {shop_idx}/{len(unique_shops)}: {shop_name} ────")
+                api_rate_limiter.acquire()
 
-                try:
-                    # Build ad group name: PLA/{shop_name}_{custom_label_1}
-                    ad_group_name = f"PLA/{shop_name}_{custom_label_1}"
-                    print(f"      Checking/creating ad group: {ad_group_name}")
-
-                    ad_group_resource_name, _ = add_shopping_ad_group(
-                        client=client,
-                        customer_id=customer_id,
-                        campaign_resource_name=campaign_resource_name,
-                        ad_group_name=ad_group_name,
-                        campaign_name=campaign_name
+                # Build ad group name: PLA/{shop_name}_{custom_label_1}
+                ad_group_name = f"PLA/{shop_name}_{custom_label_1}"
+                print(f"      [{shop_name}] Checking/creating ad group: {ad_group_name}")
+
+                ad_group_resource_name = existing_ad_groups.get(ad_group_name)
+                if not ad_group_resource_name:
+                    # New ad group: ad group + tree + ad in a single request
+                    ad_group_resource_name, _ = create_ad_group_with_tree(
+                        client, customer_id, campaign_resource_name, ad_group_name,
+                        lambda ad_group_id: inclusion_tree_operations(
+                            client, customer_id, ad_group_id, custom_label_1, maincat_id, shop_name
+                        ),
+                        existing_ad_groups
                     )
+                    print(f"      [{shop_name}] ✅ Ad group, tree and ad created: {ad_group_resource_name}")
+                    return
 
-                    if not ad_group_resource_name:
-                        raise Exception(f"Failed to create/find ad group for {shop_name}")
-
-                    print(f"      ✅ Ad group ready: {ad_group_resource_name}")
-
-                    # Extract ad group ID from resource name
-                    ad_group_id = ad_group_resource_name.split('/')[-1]
-
-                    # Build listing tree for this shop
-                    print(f"      Building listing tree...")
-                    build_listing_tree_for_inclusion(
-                        client=client,
-                        customer_id=customer_id,
-                        ad_group_id=ad_group_id,
-                        custom_label_1=custom_label_1,
-                        maincat_id=maincat_id,
-                        shop_name=shop_name,
-                        default_bid_micros=DEFAULT_BID_MICROS
-                    )
+                print(f"      [{shop_name}] ✅ Ad group ready: {ad_group_resource_name}")
 
-                    print(f"      ✅ Listing tree created for {shop_name}")
+                # Extract ad group ID from resource name
+                ad_group_id = ad_group_resource_name.split('/')[-1]
 
-                    # Create shopping product ad in the ad group
-                    print(f"      Creating shopping product ad...")
-                    ad_resource_name = add_shopping_product_ad(
-                        client=client,
-                        customer_id=customer_id,
-                        ad_group_resource_name=ad_group_resource_name
-                    )
+                # Build listing tree for this shop
+                print(f"      [{shop_name}] Building listing tree...")
+                build_listing_tree_for_inclusion(
+                    client=client,
+                    customer_id=customer_id,
+                    ad_group_id=ad_group_id,
+                    custom_label_1=custom_label_1,
+                    maincat_id=maincat_id,
+                    shop_name=shop_name,
+                    default_bid_micros=DEFAULT_BID_MICROS,
+                    ad_groups_with_trees=ad_groups_with_trees
+                )
 
-                    if not ad_resource_name:
-                        print(f"      ⚠️  Warning: Failed to create shopping ad for {shop_name}")
+                print(f"      ✅ Listing tree ready for {shop_name}")
 
-                    shops_processed_successfully.append(shop_name)
+                # Create shopping product ad in the ad group
+                print(f"      [{shop_name}] Creating shopping product ad...")
+                ad_resource_name = add_shopping_product_ad(
+                    client=client,
+                    customer_id=customer_id,
+                    ad_group_resource_name=ad_group_resource_name
+                )
 
-                    # Small delay to avoid concurrent modification issues
-                    time.sleep(1)
+                if not ad_resource_name:
+                    print(f"      ⚠️  Warning: Failed to create shopping ad for {shop_name}")
 
-                except Exception as e:
-                    error_msg = str(e)
-                    print(f"      ❌ Failed to process shop {shop_name}: {error_msg}")
-                    shop_errors[shop_name] = error_msg
-                    # Continue with next shop instead of failing entire group
+            with ThreadPoolExecutor(max_workers=AD_GROUP_SETUP_WORKERS) as executor:
+                futures = {
+                    executor.submit(setup_shop, shop_idx, shop_name): shop_name
+                    for shop_idx, shop_name in enumerate(unique_shops, start=1)
+                }
+                # Results are collected here, on the main thread only
+                for future in as_completed(futures):
+                    shop_name = futures[future]
+                    try:
+                        future.result()
+                        shops_processed_successfully.add(shop_name)
+                    except Exception as e:
+                        error_msg = str(e)
+                        print(f"      ❌ Failed to process shop {shop_name}: {error_msg}")
+                        shop_errors[shop_name] = error_msg
+                        # Continue with next shop instead of failing entire group
+                    progress.update()
 
             # Mark rows as successful/failed based on their shop
             for row_data in rows_in_group:
                 if row_data['shop_name'] in shops_processed_successfully:
-                    row_data['row_obj'][COL_LEGACY_STATUS].value = True
-                    # Clear error message on success (only if column exists)
-                    if len(row_data['row_obj']) > COL_LEGACY_ERROR:
-                        row_data['row_obj'][COL_LEGACY_ERROR].value = ""
+                    results_by_row[row_data['row_idx']] = (True, "")
                 else:
-                    row_data['row_obj'][COL_LEGACY_STATUS].value = False
-                    # Add error message if available (only if column exists)
-                    if len(row_data['row_obj']) > COL_LEGACY_ERROR:
-                        if row_data['shop_name'] in shop_errors:
-                            row_data['row_obj'][COL_LEGACY_ERROR].value = shop_errors[row_data['shop_name']]
-                        else:
-                            row_data['row_obj'][COL_LEGACY_ERROR].value = "Failed to process shop"
+                    results_by_row[row_data['row_idx']] = (
+                        False, shop_errors.get(row_data['shop_name'], "Failed to process shop")
+                    )
 
             if len(shops_processed_successfully) > 0:
                 successful_groups += 1
                 print(f"\n   ✅ GROUP {group_idx} COMPLETED: {len(shops_processed_successfully)}/{len(unique_shops)} shops processed")
 
-            # Save progress periodically
-            if file_path and group_idx % 5 == 0:
-                print(f"\n   💾 Saving progress...")
-                try:
-                    workbook.save(file_path)
-                except Exception as save_error:
-                    print(f"   ⚠️  Failed to save progress: {save_error}")
-
         except Exception as e:
             error_msg = str(e)
             print(f"\n   ❌ GROUP {group_idx} FAILED: {error_msg}")
             # Mark all rows in this group as failed
             for row_data in rows_in_group:
-                row_data['row_obj'][COL_LEGACY_STATUS].value = False
-                # Only write error message if column exists
-                if len(row_data['row_obj']) > COL_LEGACY_ERROR:
-                    row_data['row_obj'][COL_LEGACY_ERROR].value = f"Group failed: {error_msg}"
+                results_by_row[row_data['row_idx']] = (False, f"Group failed: {error_msg}")
 
-    # Final save
-    if file_path:
-        print(f"\n💾 Final save...")
-        try:
-            workbook.save(file_path)
-        except Exception as save_error:
-            print(f"⚠️  Failed to save: {save_error}")
+        # Record this group's results in the journal instead of saving the workbook
+        if journal:
+            journal.append({
+                row_data['row_idx']: results_by_row[row_data['row_idx']] for row_data in rows_in_group
+            })
 
-    print(f"\n{'='*70}")
+    finish_sheet(sheet, workbook, file_path, journal, results_by_row, COL_LEGACY_STATUS, col_err)
+
+    print(f"\n{SEPARATOR}")
     print(f"INCLUSION SHEET (LEGACY) SUMMARY: {successful_groups}/{total_groups} groups processed successfully")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
 def _process_single_exclusion_row(
     row_data: dict,
     client: GoogleAdsClient,
-    customer_id: str,
-    rate_limit_seconds: float
+    customer_id: str
 ) -> dict:
     """
     Process a single exclusion row (worker function for parallel processing).
@@ -3320,7 +4968,6 @@ def _process_single_exclusion_row(
         row_data: Dict containing row information
         client: Google Ads client
         customer_id: Customer ID
-        rate_limit_seconds: Rate limit delay
 
     Returns:
         Dict with results: {'success': bool, 'error': str or None}
@@ -3354,6 +5001,7 @@ def _process_single_exclusion_row(
 
     # Rebuild tree with shop name exclusion
     try:
+        api_rate_limiter.acquire()
         rebuild_tree_with_custom_label_3_exclusion(
             client=client,
             customer_id=customer_id,
@@ -3362,11 +5010,6 @@ def _process_single_exclusion_row(
             default_bid_micros=DEFAULT_BID_MICROS
         )
         print(f"   ✅ SUCCESS - Row {idx} completed")
-
-        # Rate limiting ONLY after successful processing
-        if rate_limit_seconds > 0:
-            time.sleep(rate_limit_seconds)
-
         return {'success': True, 'error': None}
 
     except Exception as e:
@@ -3382,8 +5025,7 @@ def process_uitbreiding_sheet(
     client: GoogleAdsClient,
     workbook: openpyxl.Workbook,
     customer_id: str,
-    file_path: str = None,
-    save_interval: int = 5
+    file_path: str = None
 ):
     """
     Process the uitbreiding (extension) sheet - adds shops to existing category campaigns.
@@ -3414,12 +5056,11 @@ def process_uitbreiding_sheet(
         workbook: Excel workbook
         customer_id: Customer ID
         file_path: Path to Excel file (for saving)
-        save_interval: Save progress every N groups
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING UITBREIDING SHEET: '{SHEET_UITBREIDING}'")
     print(f"(OPTIMIZED: Grouping shops by maincat + cl1)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
 
     try:
         sheet = workbook[SHEET_UITBREIDING]
@@ -3427,28 +5068,30 @@ def process_uitbreiding_sheet(
         print(f"❌ Sheet '{SHEET_UITBREIDING}' not found in workbook")
         return
 
-    ga_service = client.get_service("GoogleAdsService")
-
     # =========================================================================
     # STEP 1: Group all rows by (maincat, cl1) for efficient batch processing
     # =========================================================================
     print("\nGrouping rows by (maincat, cl1)...")
 
+    # Row results are buffered until finish_sheet; the journal lets an
+    # interrupted run resume without periodic workbook saves
+    journal, results_by_row = ProgressJournal.open_and_replay(file_path, SHEET_UITBREIDING, "uitbreiding")
+
     # Structure: {(maincat, cl1): [row_data_dict, ...]}
     groups = defaultdict(list)
+    campaign_names = {}  # (maincat, cl1) -> campaign name, formatted once per group
+    budget_micros_by_group = {}  # (maincat, cl1) -> first row's budget in micros
     rows_with_missing_fields = []
 
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
+    # Plain values only - rows keep their row number, not their Cell objects
+    done_rows = processed_rows(sheet, COL_UIT_STATUS) | results_by_row.keys()
+    start_row = first_unprocessed_row(done_rows)
+    for idx, row in enumerate(sheet.iter_rows(min_row=start_row, max_col=COL_UIT_BUDGET + 1, values_only=True), start=start_row):
         # Check if already processed
-        status_value = row[COL_UIT_STATUS].value if len(row) > COL_UIT_STATUS else None
-        if status_value is not None and status_value != '':
+        if idx in done_rows:
             continue
 
-        shop_name = row[COL_UIT_SHOP_NAME].value
-        maincat = row[COL_UIT_MAINCAT].value
-        maincat_id = row[COL_UIT_MAINCAT_ID].value
-        custom_label_1 = row[COL_UIT_CUSTOM_LABEL_1].value
-        budget = row[COL_UIT_BUDGET].value
+        shop_name, _, maincat, maincat_id, custom_label_1, budget = row
 
         # Skip empty rows
         if not shop_name:
@@ -3459,12 +5102,18 @@ def process_uitbreiding_sheet(
             rows_with_missing_fields.append(idx)
             continue
 
-        group_key = (str(maincat), str(custom_label_1))
+        # String conversions and names are done once here, not in the API loop
+        cl1 = str(custom_label_1)
+        group_key = (str(maincat), cl1)
+        if group_key not in campaign_names:
+            campaign_names[group_key] = f"PLA/{group_key[0]} store_{cl1}"
+            budget_micros_by_group[group_key] = budget_to_micros(budget)
         groups[group_key].append({
             'row_idx': idx,
             'shop_name': shop_name,
+            'ad_group_name': f"PLA/{shop_name}_{cl1}",
             'maincat': maincat,
-            'maincat_id': maincat_id,
+            'maincat_id': str(maincat_id),
             'custom_label_1': custom_label_1,
             'budget': budget
         })
@@ -3472,8 +5121,7 @@ def process_uitbreiding_sheet(
     # Mark rows with missing fields as errors
     for idx in rows_with_missing_fields:
         print(f"[Row {idx}] ⚠️  Missing required fields, skipping")
-        sheet.cell(row=idx, column=COL_UIT_STATUS + 1).value = False
-        sheet.cell(row=idx, column=COL_UIT_ERROR + 1).value = "Missing required fields"
+        results_by_row[idx] = (False, "Missing required fields")
 
     total_groups = len(groups)
     total_rows = sum(len(rows) for rows in groups.values())
@@ -3482,14 +5130,43 @@ def process_uitbreiding_sheet(
 
     if total_groups == 0:
         print("No rows to process.")
+        flush_row_results(sheet, results_by_row, COL_UIT_STATUS, COL_UIT_ERROR)
+        if journal:
+            journal.close()
         return
 
+    # Look up the existing campaigns of all groups in one query
+    existing_campaigns = campaigns_by_name(client, customer_id, campaign_names.values())
+    print(f"Existing campaigns found: {len(existing_campaigns)}")
+
+    # Bid strategies (from MCC account) of the groups whose campaign still has
+    # to be created, in one query
+    needed_strategies = {
+        BID_STRATEGY_MAPPING[cl1]
+        for (_, cl1), name in campaign_names.items()
+        if cl1 in BID_STRATEGY_MAPPING and name not in existing_campaigns
+    }
+    strategy_cache = get_bid_strategies_by_name(client, MCC_ACCOUNT_ID, needed_strategies)
+    # custom label 1 -> bid strategy resource name, so the loop does one lookup
+    bid_strategy_by_cl1 = {
+        cl1: strategy_cache[name] for cl1, name in BID_STRATEGY_MAPPING.items() if name in strategy_cache
+    }
+
+    # Create the missing campaigns up front in batched requests; any that
+    # fail there are created one by one in the loop below
+    created_campaigns = create_shopping_campaigns(client, customer_id, {
+        name: (budget_micros_by_group[group_key], bid_strategy_by_cl1.get(group_key[1]))
+        for group_key, name in campaign_names.items()
+        if name not in existing_campaigns
+    })
+
     # =========================================================================
     # STEP 2: Process each group - find/create campaign ONCE per group
     # =========================================================================
     success_count = 0
     error_count = 0
     groups_processed = 0
+    progress = ProgressMeter("Rows", total_rows)
 
     for (maincat, cl1), rows_in_group in groups.items():
         groups_processed += 1
@@ -3502,76 +5179,55 @@ def process_uitbreiding_sheet(
         # Get metadata from first row
         first_row = rows_in_group[0]
         maincat_id = first_row['maincat_id']
-        budget = first_row['budget']
 
-        # Build campaign name - ONCE for entire group
-        campaign_name = f"PLA/{maincat} store_{cl1}"
+        campaign_name = campaign_names[(maincat, cl1)]
         print(f"\n  Campaign: {campaign_name}")
 
         try:
-            # Step 1: Find or create campaign ONCE for entire group
-            escaped_campaign_name = campaign_name.replace("'", "\\'")
-            campaign_query = f"""
-                SELECT campaign.id, campaign.resource_name, campaign.status
-                FROM campaign
-                WHERE campaign.name = '{escaped_campaign_name}'
-            """
+            # Step 1: Find (prefetched before the loop) or create campaign ONCE for entire group
+            campaign_resource_name = existing_campaigns.get(campaign_name)
+            if campaign_resource_name:
+                print(f"  ✅ Found existing campaign")
+                # All ad groups of the campaign in one query instead of one per shop
+                existing_ad_groups = campaign_ad_groups_by_name(client, customer_id, campaign_resource_name)
+            else:
+                # New campaign (which has no ad groups yet)
+                existing_ad_groups = {}
+                campaign_resource_name = created_campaigns.get(campaign_name)
+                if campaign_resource_name:
+                    print(f"  ✅ Campaign created (batched)")
+                else:
+                    print(f"  📦 Creating new campaign...")
 
-            campaign_results = list(ga_service.search(customer_id=customer_id, query=campaign_query))
-            campaign_resource_name = None
+                    # Budget in micros, converted once while grouping (default 10 EUR)
+                    budget_micros = budget_micros_by_group[(maincat, cl1)]
 
-            for result in campaign_results:
-                if result.campaign.status != client.enums.CampaignStatusEnum.REMOVED:
-                    campaign_resource_name = result.campaign.resource_name
-                    print(f"  ✅ Found existing campaign")
-                    break
+                    # Bid strategy based on custom label 1 (resolved before the loop)
+                    bid_strategy_resource_name = bid_strategy_by_cl1.get(cl1)
 
-            if not campaign_resource_name:
-                # Create new campaign
-                print(f"  📦 Creating new campaign...")
+                    # Create campaign
+                    budget_name = f"Budget_{campaign_name}"
+                    first_shop = rows_in_group[0]['shop_name']
 
-                # Convert budget from EUR to micros
-                try:
-                    budget_micros = int(float(budget) * 1_000_000) if budget else 10_000_000
-                except (ValueError, TypeError):
-                    print(f"     ⚠️  Invalid budget '{budget}', using default 10 EUR")
-                    budget_micros = 10_000_000
-
-                # Get bid strategy based on custom label 1
-                bid_strategy_resource_name = None
-                if cl1 and cl1 in BID_STRATEGY_MAPPING:
-                    bid_strategy_name = BID_STRATEGY_MAPPING[cl1]
-                    print(f"     Looking up bid strategy: {bid_strategy_name}")
-                    bid_strategy_resource_name = get_bid_strategy_by_name(
+                    campaign_resource_name = add_standard_shopping_campaign(
                         client=client,
-                        customer_id=MCC_ACCOUNT_ID,
-                        strategy_name=bid_strategy_name
+                        customer_id=customer_id,
+                        merchant_center_account_id=MERCHANT_CENTER_ACCOUNT_ID,
+                        campaign_name=campaign_name,
+                        budget_name=budget_name,
+                        tracking_template="",
+                        country=CAMPAIGN_COUNTRY,
+                        shopid=None,
+                        shopname=first_shop,
+                        label=cl1,
+                        budget=budget_micros,
+                        bidding_strategy_resource_name=bid_strategy_resource_name
                     )
 
-                # Create campaign
-                merchant_center_account_id = 140784594
-                budget_name = f"Budget_{campaign_name}"
-                first_shop = rows_in_group[0]['shop_name']
-
-                campaign_resource_name = add_standard_shopping_campaign(
-                    client=client,
-                    customer_id=customer_id,
-                    merchant_center_account_id=merchant_center_account_id,
-                    campaign_name=campaign_name,
-                    budget_name=budget_name,
-                    tracking_template="",
-                    country="NL",
-                    shopid=None,
-                    shopname=first_shop,
-                    label=cl1,
-                    budget=budget_micros,
-                    bidding_strategy_resource_name=bid_strategy_resource_name
-                )
-
-                if not campaign_resource_name:
-                    raise Exception("Failed to create campaign")
+                    if not campaign_resource_name:
+                        raise Exception("Failed to create campaign")
 
-                print(f"  ✅ Campaign created")
+                    print(f"  ✅ Campaign created")
 
                 # Add negative keyword list to new campaign
                 if NEGATIVE_LIST_NAME:
@@ -3583,98 +5239,78 @@ def process_uitbreiding_sheet(
                         negative_list_name=NEGATIVE_LIST_NAME
                     )
 
-            # Step 2: Process each shop in the group
-            print(f"\n  Processing {len(rows_in_group)} shop(s)...")
+            # Step 2: Process the shops' ad groups in parallel, like inclusion v2.
+            # New ad groups go out as ONE request each (ad group + tree + ad);
+            # rows that share an ad group are handled by a single worker.
+            rows_by_ad_group = defaultdict(list)
+            for row_data in rows_in_group:
+                rows_by_ad_group[row_data['ad_group_name']].append(row_data)
+            print(f"\n  Processing {len(rows_in_group)} shop(s) ({AD_GROUP_SETUP_WORKERS} in parallel)...")
+
+            # Which existing ad groups already have a tree, read once per campaign
+            ad_groups_with_trees = ad_groups_with_existing_trees(
+                client, customer_id,
+                [resource_name.split('/')[-1] for resource_name in existing_ad_groups.values()]
+            ) if existing_ad_groups else set()
 
-            for shop_idx, row_data in enumerate(rows_in_group, start=1):
-                idx = row_data['row_idx']
+            def setup_ad_group(ad_group_name, row_data):
                 shop_name = row_data['shop_name']
                 shop_maincat_id = row_data['maincat_id']
-
-                print(f"\n    [{shop_idx}/{len(rows_in_group)}] {shop_name}")
-
-                try:
-                    ad_group_name = f"PLA/{shop_name}_{cl1}"
-
-                    # Look for existing ad group
-                    escaped_ad_group_name = ad_group_name.replace("'", "\\'")
-                    ad_group_query = f"""
-                        SELECT ad_group.id, ad_group.resource_name
-                        FROM ad_group
-                        WHERE ad_group.campaign = '{campaign_resource_name}'
-                        AND ad_group.name = '{escaped_ad_group_name}'
-                        AND ad_group.status != 'REMOVED'
-                    """
-
-                    ad_group_results = list(ga_service.search(customer_id=customer_id, query=ad_group_query))
-                    ad_group_resource_name = None
-
-                    for result in ad_group_results:
-                        ad_group_resource_name = result.ad_group.resource_name
-                        print(f"      ✅ Found existing ad group")
-                        break
-
-                    if not ad_group_resource_name:
-                        # Create new ad group
-                        print(f"      📦 Creating ad group: {ad_group_name}")
-                        ad_group_resource_name, _ = add_shopping_ad_group(
-                            client=client,
-                            customer_id=customer_id,
-                            campaign_resource_name=campaign_resource_name,
-                            ad_group_name=ad_group_name,
-                            campaign_name=campaign_name
-                        )
-
-                        if not ad_group_resource_name:
-                            raise Exception("Failed to create ad group")
-
-                        print(f"      ✅ Ad group created")
-
-                    # Build listing tree
-                    ad_group_id = ad_group_resource_name.split('/')[-1]
-
-                    build_listing_tree_for_uitbreiding(
-                        client=client,
-                        customer_id=customer_id,
-                        ad_group_id=ad_group_id,
-                        shop_name=shop_name,
-                        maincat_id=str(shop_maincat_id),
-                        custom_label_1=str(cl1)
-                    )
-
-                    # Create shopping product ad
-                    add_shopping_product_ad(
-                        client=client,
-                        customer_id=customer_id,
-                        ad_group_resource_name=ad_group_resource_name
+                print(f"    [Row {row_data['row_idx']}] {shop_name}")
+
+                api_rate_limiter.acquire()
+
+                # Look up existing ad group (prefetched per campaign)
+                ad_group_resource_name = existing_ad_groups.get(ad_group_name)
+                if not ad_group_resource_name:
+                    print(f"      [Row {row_data['row_idx']}] 📦 Creating ad group, tree and ad: {ad_group_name}")
+                    create_ad_group_with_tree(
+                        client, customer_id, campaign_resource_name, ad_group_name,
+                        lambda ad_group_id: uitbreiding_tree_operations(
+                            client, customer_id, ad_group_id, shop_name, shop_maincat_id, cl1
+                        ),
+                        existing_ad_groups
                     )
+                    return
 
-                    # Mark success
-                    sheet.cell(row=idx, column=COL_UIT_STATUS + 1).value = True
-                    sheet.cell(row=idx, column=COL_UIT_ERROR + 1).value = ""
-                    success_count += 1
-                    print(f"      ✅ Row {idx} completed")
-
-                    # Rate limiting between shops
-                    time.sleep(1.5)
-
-                except Exception as shop_e:
-                    error_msg = str(shop_e)
-                    print(f"      ❌ Error: {error_msg[:60]}")
-
-                    # Categorize errors
-                    if "CONCURRENT_MODIFICATION" in error_msg:
-                        friendly_error = "Concurrent modification (retry needed)"
-                    elif "NOT_FOUND" in error_msg.upper():
-                        friendly_error = "Resource not found"
-                    elif "SUBDIVISION_REQUIRES_OTHERS_CASE" in error_msg:
-                        friendly_error = "Tree structure error"
-                    else:
-                        friendly_error = error_msg[:80]
+                # Existing ad group: fill in whatever is missing (tree / ad)
+                print(f"      [Row {row_data['row_idx']}] ✅ Found existing ad group")
+                build_listing_tree_for_uitbreiding(
+                    client=client,
+                    customer_id=customer_id,
+                    ad_group_id=ad_group_resource_name.split('/')[-1],
+                    shop_name=shop_name,
+                    maincat_id=shop_maincat_id,
+                    custom_label_1=cl1,
+                    ad_groups_with_trees=ad_groups_with_trees
+                )
+                add_shopping_product_ad(
+                    client=client,
+                    customer_id=customer_id,
+                    ad_group_resource_name=ad_group_resource_name
+                )
 
-                    sheet.cell(row=idx, column=COL_UIT_STATUS + 1).value = False
-                    sheet.cell(row=idx, column=COL_UIT_ERROR + 1).value = friendly_error
-                    error_count += 1
+            with ThreadPoolExecutor(max_workers=AD_GROUP_SETUP_WORKERS) as executor:
+                futures = {
+                    executor.submit(setup_ad_group, ad_group_name, ad_group_rows[0]): ad_group_name
+                    for ad_group_name, ad_group_rows in rows_by_ad_group.items()
+                }
+                # Mark each ad group's rows as soon as its worker finishes
+                for future in as_completed(futures):
+                    ad_group_rows = rows_by_ad_group[futures[future]]
+                    try:
+                        future.result()
+                        row_result = (True, "")
+                        success_count += len(ad_group_rows)
+                    except Exception as shop_e:
+                        error_msg = str(shop_e)
+                        print(f"      ❌ [Row {ad_group_rows[0]['row_idx']}] Error: {error_msg[:60]}")
+
+                        row_result = (False, friendly_error_message(error_msg))
+                        error_count += len(ad_group_rows)
+                    for row_data in ad_group_rows:
+                        results_by_row[row_data['row_idx']] = row_result
+                    progress.update(len(ad_group_rows))
 
         except Exception as group_e:
             # Campaign-level error - mark all rows in group as failed
@@ -3682,141 +5318,283 @@ def process_uitbreiding_sheet(
             print(f"\n  ❌ GROUP FAILED: {error_msg[:80]}")
 
             for row_data in rows_in_group:
-                idx = row_data['row_idx']
-                sheet.cell(row=idx, column=COL_UIT_STATUS + 1).value = False
-                sheet.cell(row=idx, column=COL_UIT_ERROR + 1).value = f"Campaign error: {error_msg[:60]}"
+                results_by_row[row_data['row_idx']] = (False, f"Campaign error: {error_msg[:60]}")
                 error_count += 1
 
-        # Save periodically (every N groups)
-        if file_path and groups_processed % save_interval == 0:
-            print(f"\n💾 Saving progress ({groups_processed} groups processed)...")
-            try:
-                workbook.save(file_path)
-            except Exception as save_error:
-                print(f"⚠️  Error saving: {save_error}")
-
-        # Delay between groups to avoid concurrent modification
-        if groups_processed < total_groups:
-            time.sleep(2)
+        # Record this group's results in the journal instead of saving the workbook
+        if journal:
+            journal.append({
+                row_data['row_idx']: results_by_row[row_data['row_idx']] for row_data in rows_in_group
+            })
 
-    # Final save
-    if file_path:
-        print(f"\n💾 Final save...")
-        try:
-            workbook.save(file_path)
-        except Exception as save_error:
-            print(f"⚠️  Error on final save: {save_error}")
+    finish_sheet(sheet, workbook, file_path, journal, results_by_row, COL_UIT_STATUS, COL_UIT_ERROR)
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"UITBREIDING SHEET SUMMARY (OPTIMIZED)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total groups processed: {groups_processed}")
     print(f"Total rows processed: {success_count + error_count}")
     print(f"Rows with missing fields: {len(rows_with_missing_fields)}")
     print(f"✅ Successful: {success_count}")
     print(f"❌ Failed: {error_count + len(rows_with_missing_fields)}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
-def load_cat_ids_mapping(workbook: openpyxl.Workbook) -> dict:
+def load_cat_ids_mapping(workbook: openpyxl.Workbook, file_path: str = None) -> dict:
     """
     Load the cat_ids sheet and create a mapping of maincat_id -> list of deepest_cat values.
 
+    With file_path the sheet is read from the file in read_only + data_only
+    mode instead (streamed, formula results instead of formulas); `workbook`
+    is only used if that fails.
+
     Args:
         workbook: Excel workbook containing cat_ids sheet
+        file_path: Optional path of the Excel file `workbook` was loaded from
 
     Returns:
         dict: {maincat_id: [deepest_cat1, deepest_cat2, ...]}
     """
+    if file_path:
+        try:
+            data_workbook = load_workbook(file_path, data_only=True, read_only=True)
+        except Exception as e:
+            print(f"   ⚠️  Could not load read-only workbook, using the loaded one: {e}")
+        else:
+            try:
+                return load_cat_ids_mapping(data_workbook)
+            finally:
+                data_workbook.close()
+
     try:
         sheet = workbook[SHEET_CAT_IDS]
     except KeyError:
         print(f"❌ Sheet '{SHEET_CAT_IDS}' not found in workbook")
         return {}
 
-    mapping = {}
-
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        maincat_id = row[COL_CAT_MAINCAT_ID]
-        deepest_cat = row[COL_CAT_DEEPEST_CAT]
+    mapping = defaultdict(set)
 
+    # Only read the two mapped columns (maincat_id, deepest_cat), unpacked per row
+    for maincat_id, deepest_cat in sheet.iter_rows(
+        min_row=2, min_col=COL_CAT_MAINCAT_ID + 1, max_col=COL_CAT_DEEPEST_CAT + 1, values_only=True
+    ):
         if maincat_id and deepest_cat:
-            maincat_id_str = str(maincat_id)
-            if maincat_id_str not in mapping:
-                mapping[maincat_id_str] = set()
-            mapping[maincat_id_str].add(str(deepest_cat))
+            mapping[str(maincat_id)].add(str(deepest_cat))
 
     # Convert sets to sorted lists
-    for key in mapping:
-        mapping[key] = sorted(mapping[key])
+    mapping = {key: sorted(values) for key, values in mapping.items()}
 
     print(f"   Loaded {len(mapping)} maincat_id mappings from '{SHEET_CAT_IDS}' sheet")
     return mapping
 
 
-def add_shop_exclusion_to_ad_group(
-    client: GoogleAdsClient,
-    customer_id: str,
-    ad_group_id: str,
-    shop_name: str
-):
+# CL3 exclusion point of already read listing trees, keyed by (customer_id, ad_group_id)
+# Value: (parent_for_cl3, frozenset of lowercased excluded shops) - see _read_cl3_tree_meta
+_cl3_tree_meta_cache = {}
+
+
+def _forget_cl3_tree_meta(customer_id: str, ad_group_id):
+    """Drop the cached CL3 tree meta of an ad group whose tree is changing."""
+    _cl3_tree_meta_cache.pop((str(customer_id), str(ad_group_id)), None)
+
+
+def _remove_listing_tree(client: GoogleAdsClient, customer_id: str, ad_group_id):
+    """safe_remove_entire_listing_tree that also drops the ad group's cached CL3 tree meta."""
+    _forget_cl3_tree_meta(customer_id, ad_group_id)
+    safe_remove_entire_listing_tree(client, customer_id, str(ad_group_id))
+
+
+def _read_cl3_tree_meta(client: GoogleAdsClient, customer_id: str, ad_group_id) -> Optional[tuple]:
     """
-    Add a shop name as CL3 exclusion to an ad group's listing tree.
-    Preserves existing tree structure and adds the shop as a negative CL3 unit.
+    Read where new CL3 exclusions go in an ad group's listing tree.
 
-    Args:
-        client: Google Ads client
-        customer_id: Customer ID
-        ad_group_id: Ad group ID
-        shop_name: Shop name to exclude (CL3 value)
+    Results are cached per ad group. Adding or removing exclusions drops the
+    entry again, as does every tree removal (_remove_listing_tree, batch
+    rebuilds), and clear_gaql_caches() drops them all. Query errors propagate.
+
+    Returns:
+        Tuple of (parent_for_cl3, frozenset of lowercased excluded shop names),
+        or None if the ad group has no listing tree. parent_for_cl3 is None if
+        the tree has no CL3 level.
     """
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    agc_service = client.get_service("AdGroupCriterionService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    cache_key = (str(customer_id), str(ad_group_id))
+    if cache_key in _cl3_tree_meta_cache:
+        return _cl3_tree_meta_cache[cache_key]
 
-    # Step 1: Read existing tree structure
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    ag_path = f"customers/{customer_id}/adGroups/{ad_group_id}"
     query = f"""
         SELECT
-            ad_group_criterion.resource_name,
-            ad_group_criterion.listing_group.type,
             ad_group_criterion.listing_group.parent_ad_group_criterion,
             ad_group_criterion.listing_group.case_value.product_custom_attribute.index,
             ad_group_criterion.listing_group.case_value.product_custom_attribute.value,
-            ad_group_criterion.negative,
-            ad_group_criterion.cpc_bid_micros
+            ad_group_criterion.negative
         FROM ad_group_criterion
         WHERE ad_group_criterion.ad_group = '{ag_path}'
             AND ad_group_criterion.type = 'LISTING_GROUP'
     """
-
-    results = list(ga_service.search(customer_id=customer_id, query=query))
-
+    results = search_stream_rows(ga_service, customer_id, query)
     if not results:
-        print(f"      ⚠️  No listing tree found in ad group {ad_group_id}")
-        return False
+        return None
 
-    # Find parent for CL3 nodes (by looking at existing CL3 nodes including CL3 OTHERS)
     parent_for_cl3 = None
     existing_cl3_exclusions = set()
-
     for row in results:
+        # Bind the nested fields once per row
         criterion = row.ad_group_criterion
         lg = criterion.listing_group
+        index_name, value = _custom_attribute_fields(lg.case_value.product_custom_attribute)
 
-        # Check for CL3 nodes (INDEX3) - get parent from any CL3 node
-        if lg.case_value.product_custom_attribute.index.name == 'INDEX3':
-            value = lg.case_value.product_custom_attribute.value
-
-            if value:
-                # This is a specific CL3 value (shop name)
-                if criterion.negative:
-                    existing_cl3_exclusions.add(value.lower())
-
-            # Get the parent of any CL3 node - this is where we add new CL3 exclusions
+        # CL3 nodes (INDEX3): collect excluded shops, and take the parent of
+        # any CL3 node - this is where new CL3 exclusions are added
+        if index_name == 'INDEX3':
+            if value and criterion.negative:
+                existing_cl3_exclusions.add(value.lower())
             if lg.parent_ad_group_criterion:
                 parent_for_cl3 = lg.parent_ad_group_criterion
 
+    meta = (parent_for_cl3, frozenset(existing_cl3_exclusions))
+    _cl3_tree_meta_cache[cache_key] = meta
+    return meta
+
+
+_CL3_TREES_QUERY = (
+    "SELECT ad_group.id, ad_group_criterion.resource_name, "
+    "ad_group_criterion.listing_group.parent_ad_group_criterion, "
+    "ad_group_criterion.listing_group.case_value.product_custom_attribute.index, "
+    "ad_group_criterion.listing_group.case_value.product_custom_attribute.value, "
+    "ad_group_criterion.negative "
+    "FROM ad_group_criterion "
+    "WHERE ad_group_criterion.type = 'LISTING_GROUP' AND ad_group.id IN ({})"
+)
+
+
+def bulk_fetch_cl3_trees(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_ids: list,
+    populate_cache: bool = True
+) -> dict:
+    """
+    Read the CL3 exclusion point of many ad groups' listing trees at once.
+
+    One GAQL query per 1000 ad groups instead of one per ad group; rows are
+    bucketed by ad group client-side. Also fills the _read_cl3_tree_meta
+    cache, unless populate_cache is False. Query errors propagate.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_ids: Ad group IDs to read
+        populate_cache: Store the results in the _read_cl3_tree_meta cache
+
+    Returns:
+        dict: ad_group_id (str) -> {
+            'parent_for_cl3': parent criterion resource name, or None without a CL3 level,
+            'cl3_exclusions': {lowercased excluded shop name: criterion resource name}
+        }, or None for ad groups without a listing tree
+    """
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    ids = list(dict.fromkeys(str(ad_group_id) for ad_group_id in ad_group_ids))
+    trees = dict.fromkeys(ids)
+
+    for start in range(0, len(ids), 1000):
+        query = _CL3_TREES_QUERY.format(', '.join(ids[start:start + 1000]))
+        for row in search_stream_rows(ga_service, customer_id, query):
+            tree = trees[str(row.ad_group.id)]
+            if tree is None:
+                tree = trees[str(row.ad_group.id)] = {'parent_for_cl3': None, 'cl3_exclusions': {}}
+            criterion = row.ad_group_criterion
+            lg = criterion.listing_group
+            index_name, value = _custom_attribute_fields(lg.case_value.product_custom_attribute)
+
+            # Same rules as _read_cl3_tree_meta
+            if index_name == 'INDEX3':
+                if value and criterion.negative:
+                    tree['cl3_exclusions'][value.lower()] = criterion.resource_name
+                if lg.parent_ad_group_criterion:
+                    tree['parent_for_cl3'] = lg.parent_ad_group_criterion
+
+    if not populate_cache:
+        return trees
+    for ad_group_id, tree in trees.items():
+        if tree is not None:
+            _cl3_tree_meta_cache[(str(customer_id), ad_group_id)] = (
+                tree['parent_for_cl3'], frozenset(tree['cl3_exclusions'])
+            )
+    return trees
+
+
+def pipelined_cl3_tree_reads(client: GoogleAdsClient, customer_id: str, ad_group_id_lists: list):
+    """
+    Yield bulk_fetch_cl3_trees results for a sequence of groups, one per group.
+
+    The next group's trees are read in a background thread while the caller
+    mutates the current group, so a group costs max(read, write) instead of
+    read + write. Entries for ad groups the previous group also covered are
+    dropped (they may have changed after the read was started); the batch
+    helpers re-read those on their own. For the same reason the background
+    reads never fill the _read_cl3_tree_meta cache: a read finishing after a
+    mutate's _forget_cl3_tree_meta would put the old tree back.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_id_lists: Per group, the IDs of the ad groups it will change
+
+    Yields:
+        dict (see bulk_fetch_cl3_trees) per group, or None for a group without
+        ad groups or whose read failed (callers then read per ad group)
+    """
+    id_lists = [[str(ad_group_id) for ad_group_id in ids] for ids in ad_group_id_lists]
+
+    def read(ids):
+        return bulk_fetch_cl3_trees(client, customer_id, ids, populate_cache=False) if ids else None
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_read = executor.submit(read, id_lists[0]) if id_lists else None
+        for index, ids in enumerate(id_lists):
+            current_read = next_read
+            if index + 1 < len(id_lists):
+                next_read = executor.submit(read, id_lists[index + 1])
+            try:
+                trees = current_read.result()
+            except Exception as e:
+                print(f"  ⚠️  Bulk tree read failed, reading per ad group: {str(e)[:50]}")
+                trees = None
+            if trees and index > 0:
+                for ad_group_id in id_lists[index - 1]:
+                    trees.pop(ad_group_id, None)
+            yield trees
+
+
+def add_shop_exclusion_to_ad_group(
+    client: GoogleAdsClient,
+    customer_id: str,
+    ad_group_id: str,
+    shop_name: str
+):
+    """
+    Add a shop name as CL3 exclusion to an ad group's listing tree.
+    Preserves existing tree structure and adds the shop as a negative CL3 unit.
+
+    Args:
+        client: Google Ads client
+        customer_id: Customer ID
+        ad_group_id: Ad group ID
+        shop_name: Shop name to exclude (CL3 value)
+    """
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+
+    # Step 1: Read existing tree structure (cached per ad group)
+    meta = _read_cl3_tree_meta(client, customer_id, ad_group_id)
+
+    if meta is None:
+        print(f"      ⚠️  No listing tree found in ad group {ad_group_id}")
+        return False
+
+    parent_for_cl3, existing_cl3_exclusions = meta
+
     if not parent_for_cl3:
         print(f"      ⚠️  No parent for CL3 found in ad group {ad_group_id}")
         return False
@@ -3827,9 +5605,7 @@ def add_shop_exclusion_to_ad_group(
         return True
 
     # Step 2: Add the shop exclusion as a new CL3 negative unit
-    dim_cl3_shop = client.get_type("ListingDimensionInfo")
-    dim_cl3_shop.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-    dim_cl3_shop.product_custom_attribute.value = shop_name
+    dim_cl3_shop = make_custom_label_dim(client, client.enums.ProductCustomAttributeIndexEnum.INDEX3, shop_name)
 
     op = create_listing_group_unit_biddable(
         client=client,
@@ -3841,18 +5617,20 @@ def add_shop_exclusion_to_ad_group(
         cpc_bid_micros=None
     )
 
+    _forget_cl3_tree_meta(customer_id, ad_group_id)
     try:
-        agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=[op])
+        mutate_ad_group_criteria_with_retry(agc_service, customer_id, [op])
         print(f"      ✅ Added exclusion: CL3='{shop_name}'")
         return True
-    except Exception as e:
-        error_msg = str(e)
-        if "LISTING_GROUP_ALREADY_EXISTS" in error_msg:
+    except GoogleAdsException as gae:
+        if "LISTING_GROUP_ALREADY_EXISTS" in google_ads_error_codes(gae):
             print(f"      ℹ️  Shop '{shop_name}' already excluded (duplicate)")
             return True
-        else:
-            print(f"      ❌ Error adding exclusion: {error_msg[:100]}")
-            return False
+        print(f"      ❌ Error adding exclusion: {str(gae)[:100]}")
+        return False
+    except Exception as e:
+        print(f"      ❌ Error adding exclusion: {str(e)[:100]}")
+        return False
 
 
 def reverse_exclusion(
@@ -3876,10 +5654,9 @@ def reverse_exclusion(
     Returns:
         bool: True if exclusion was removed or didn't exist, False on error
     """
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    agc_service = client.get_service("AdGroupCriterionService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ag_path = f"customers/{customer_id}/adGroups/{ad_group_id}"
 
     # Step 1: Read existing tree structure to find the CL3 exclusion
     query = f"""
@@ -3895,7 +5672,7 @@ def reverse_exclusion(
     """
 
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
+        results = search_stream_rows(ga_service, customer_id, query)
     except Exception as e:
         print(f"      ❌ Error reading tree: {e}")
         return False
@@ -3910,12 +5687,10 @@ def reverse_exclusion(
 
     for row in results:
         criterion = row.ad_group_criterion
-        lg = criterion.listing_group
+        index_name, value = _custom_attribute_fields(criterion.listing_group.case_value.product_custom_attribute)
 
         # Check for CL3 nodes (INDEX3)
-        if lg.case_value.product_custom_attribute.index.name == 'INDEX3':
-            value = lg.case_value.product_custom_attribute.value
-
+        if index_name == 'INDEX3':
             # Check if this is the shop we want to un-exclude
             if value and value.lower() == shop_name_lower and criterion.negative:
                 criterion_to_remove = criterion.resource_name
@@ -3926,11 +5701,12 @@ def reverse_exclusion(
         return True  # Not an error - shop wasn't excluded
 
     # Step 2: Remove the exclusion criterion
-    op = client.get_type("AdGroupCriterionOperation")
+    op = get_cached_type(client, "AdGroupCriterionOperation")()
     op.remove = criterion_to_remove
 
+    _forget_cl3_tree_meta(customer_id, ad_group_id)
     try:
-        agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=[op])
+        mutate_ad_group_criteria_with_retry(agc_service, customer_id, [op])
         #print(f"      ✅ Removed exclusion: CL3='{shop_name}' from {ad_group_name}")
         return True
     except Exception as e:
@@ -3944,7 +5720,8 @@ def reverse_exclusion_batch(
     customer_id: str,
     ad_group_id: str,
     ad_group_name: str,
-    shop_names: list
+    shop_names: list,
+    tree_cache: dict = None
 ) -> dict:
     """
     Remove multiple shop exclusions from an ad group's listing tree in one batch.
@@ -3958,6 +5735,8 @@ def reverse_exclusion_batch(
         ad_group_id: Ad group ID
         ad_group_name: Ad group name (for logging)
         shop_names: List of shop names to un-exclude
+        tree_cache: Optional bulk_fetch_cl3_trees result covering this ad group;
+            the entry is dropped once the tree changes
 
     Returns:
         dict: {
@@ -3966,10 +5745,8 @@ def reverse_exclusion_batch(
             'errors': list of (shop_name, error_msg) tuples
         }
     """
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    agc_service = client.get_service("AdGroupCriterionService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ad_group_id = str(ad_group_id)
 
     result = {
         'success': [],
@@ -3980,55 +5757,34 @@ def reverse_exclusion_batch(
     # Normalize shop names for case-insensitive matching
     shop_names_lower = {name.lower(): name for name in shop_names}
 
-    # Step 1: Read existing tree structure ONCE
-    query = f"""
-        SELECT
-            ad_group_criterion.resource_name,
-            ad_group_criterion.listing_group.type,
-            ad_group_criterion.listing_group.case_value.product_custom_attribute.index,
-            ad_group_criterion.listing_group.case_value.product_custom_attribute.value,
-            ad_group_criterion.negative
-        FROM ad_group_criterion
-        WHERE ad_group_criterion.ad_group = '{ag_path}'
-            AND ad_group_criterion.type = 'LISTING_GROUP'
-    """
-
+    # Step 1: Read existing tree structure ONCE (unless bulk-prefetched by the caller)
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
+        if tree_cache is None or ad_group_id not in tree_cache:
+            tree_cache = bulk_fetch_cl3_trees(client, customer_id, [ad_group_id])
+        tree = tree_cache[ad_group_id]
     except Exception as e:
         # All shops failed due to read error
         for shop_name in shop_names:
             result['errors'].append((shop_name, f"Error reading tree: {str(e)[:50]}"))
         return result
 
-    if not results:
+    if tree is None:
         # No listing tree - all shops count as "not found"
         result['not_found'] = list(shop_names)
         return result
 
-    # Step 2: Find ALL CL3 exclusion criteria matching any of our shops
-    criteria_to_remove = []  # List of (resource_name, shop_name)
-    found_shops = set()
-
-    for row in results:
-        criterion = row.ad_group_criterion
-        lg = criterion.listing_group
-
-        # Check for CL3 nodes (INDEX3)
-        if lg.case_value.product_custom_attribute.index.name == 'INDEX3':
-            value = lg.case_value.product_custom_attribute.value
-
-            if value and criterion.negative:
-                value_lower = value.lower()
-                if value_lower in shop_names_lower:
-                    original_shop_name = shop_names_lower[value_lower]
-                    criteria_to_remove.append((criterion.resource_name, original_shop_name))
-                    found_shops.add(value_lower)
+    # Step 2: Find ALL CL3 exclusion criteria matching any of our shops (one set
+    # intersection of the wanted and the excluded names)
+    cl3_exclusions = tree['cl3_exclusions']
+    found_shops = shop_names_lower.keys() & cl3_exclusions.keys()
+    criteria_to_remove = [  # List of (resource_name, shop_name)
+        (cl3_exclusions[shop_lower], shop_names_lower[shop_lower]) for shop_lower in found_shops
+    ]
 
     # Track shops that weren't excluded
-    for shop_lower, shop_name in shop_names_lower.items():
-        if shop_lower not in found_shops:
-            result['not_found'].append(shop_name)
+    result['not_found'] = [
+        shop_name for shop_lower, shop_name in shop_names_lower.items() if shop_lower not in found_shops
+    ]
 
     if not criteria_to_remove:
         # No exclusions to remove
@@ -4036,29 +5792,37 @@ def reverse_exclusion_batch(
 
     # Step 3: Remove all exclusion criteria in ONE batch operation
     operations = []
+    op_type = get_cached_type(client, "AdGroupCriterionOperation")
     for resource_name, shop_name in criteria_to_remove:
-        op = client.get_type("AdGroupCriterionOperation")
+        op = op_type()
         op.remove = resource_name
         operations.append((op, shop_name))
 
+    # Partial failure: removals are independent, so valid ones apply and only
+    # the bad ones come back
+    _forget_cl3_tree_meta(customer_id, ad_group_id)
+    tree_cache.pop(ad_group_id, None)
     try:
-        # Execute batch removal
-        agc_service.mutate_ad_group_criteria(
-            customer_id=customer_id,
-            operations=[op for op, _ in operations]
+        failed = mutate_ad_group_criteria_partial(
+            client, agc_service, customer_id, [op for op, _ in operations]
         )
-        # All successful
-        for _, shop_name in operations:
-            result['success'].append(shop_name)
-    except GoogleAdsException as gae:
-        # Try to identify which operations failed
-        error_msg = str(gae)[:100]
-        for _, shop_name in operations:
-            result['errors'].append((shop_name, error_msg))
     except Exception as e:
+        # Request-level failure - nothing was removed
         error_msg = str(e)[:100]
         for _, shop_name in operations:
             result['errors'].append((shop_name, error_msg))
+        return result
+
+    for index, (_, shop_name) in enumerate(operations):
+        if index not in failed:
+            result['success'].append(shop_name)
+            continue
+        error_code, error_msg = failed[index]
+        if error_code.endswith("NOT_FOUND"):
+            # Removed in the meantime - same as not excluded
+            result['not_found'].append(shop_name)
+        else:
+            result['errors'].append((shop_name, error_msg[:100]))
 
     return result
 
@@ -4086,58 +5850,21 @@ def prepare_shop_exclusion_operation(
         - status: 'ready', 'skip', or 'error'
         - message: Description of result
     """
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
-
-    # Use cache if provided, otherwise query
+    # Use cache if provided, otherwise read the tree (cached per ad group)
     if listing_group_cache and ad_group_id in listing_group_cache:
         cache_entry = listing_group_cache[ad_group_id]
         parent_for_cl3 = cache_entry.get('parent_for_cl3')
         existing_cl3_exclusions = cache_entry.get('cl3_exclusions', set())
     else:
-        # Query listing group structure
-        query = f"""
-            SELECT
-                ad_group_criterion.resource_name,
-                ad_group_criterion.listing_group.type,
-                ad_group_criterion.listing_group.parent_ad_group_criterion,
-                ad_group_criterion.listing_group.case_value.product_custom_attribute.index,
-                ad_group_criterion.listing_group.case_value.product_custom_attribute.value,
-                ad_group_criterion.negative
-            FROM ad_group_criterion
-            WHERE ad_group_criterion.ad_group = '{ag_path}'
-                AND ad_group_criterion.type = 'LISTING_GROUP'
-        """
-
         try:
-            results = list(ga_service.search(customer_id=customer_id, query=query))
+            meta = _read_cl3_tree_meta(client, customer_id, ad_group_id)
         except Exception as e:
             return (None, 'error', f"Query error: {str(e)[:50]}")
 
-        if not results:
+        if meta is None:
             return (None, 'error', "No listing tree found")
 
-        parent_for_cl3 = None
-        existing_cl3_exclusions = set()
-
-        for row in results:
-            criterion = row.ad_group_criterion
-            lg = criterion.listing_group
-
-            # Safely get index name
-            try:
-                index_name = lg.case_value.product_custom_attribute.index.name
-            except (AttributeError, TypeError):
-                index_name = None
-
-            # Check for CL3 nodes (INDEX3) - get parent from any CL3 node
-            if index_name == 'INDEX3':
-                value_str = lg.case_value.product_custom_attribute.value
-                if value_str and criterion.negative:
-                    existing_cl3_exclusions.add(value_str.lower())
-                if lg.parent_ad_group_criterion:
-                    parent_for_cl3 = lg.parent_ad_group_criterion
+        parent_for_cl3, existing_cl3_exclusions = meta
 
     if not parent_for_cl3:
         return (None, 'error', "No parent for CL3 found")
@@ -4147,9 +5874,7 @@ def prepare_shop_exclusion_operation(
         return (None, 'skip', f"Already excluded")
 
     # Create the operation
-    dim_cl3_shop = client.get_type("ListingDimensionInfo")
-    dim_cl3_shop.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-    dim_cl3_shop.product_custom_attribute.value = shop_name
+    dim_cl3_shop = make_custom_label_dim(client, client.enums.ProductCustomAttributeIndexEnum.INDEX3, shop_name)
 
     op = create_listing_group_unit_biddable(
         client=client,
@@ -4185,7 +5910,7 @@ def execute_exclusion_batch(
     if not operations:
         return (0, 0, [])
 
-    agc_service = client.get_service("AdGroupCriterionService")
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
     success_count = 0
     error_count = 0
     errors = []
@@ -4194,40 +5919,34 @@ def execute_exclusion_batch(
     for i in range(0, len(operations), batch_size):
         batch = operations[i:i + batch_size]
         ops = [item[0] for item in batch]
+        for op in ops:
+            _forget_cl3_tree_meta(customer_id, op.create.ad_group.split('/')[-1])
 
+        # Partial failure: valid exclusions apply, only the bad ones come back
         try:
-            agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops)
-            success_count += len(batch)
-            for _, ag_name, shop_name in batch:
-                print(f"      ✅ {ag_name}: excluded '{shop_name}'")
+            failed = mutate_ad_group_criteria_partial(client, agc_service, customer_id, ops)
         except Exception as e:
+            # Request-level failure - nothing in this batch was applied
             error_msg = str(e)
-            if "LISTING_GROUP_ALREADY_EXISTS" in error_msg:
-                # Some might already exist, count as success
-                success_count += len(batch)
-                print(f"      ℹ️  Batch contained duplicates (already excluded)")
-            else:
-                # Batch failed - try individual operations
-                print(f"      ⚠️  Batch failed, retrying individually...")
-                for op, ag_name, shop_name in batch:
-                    try:
-                        agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=[op])
-                        success_count += 1
-                        print(f"      ✅ {ag_name}: excluded '{shop_name}'")
-                    except Exception as ind_e:
-                        ind_error = str(ind_e)
-                        if "LISTING_GROUP_ALREADY_EXISTS" in ind_error:
-                            success_count += 1
-                            print(f"      ℹ️  {ag_name}: already excluded")
-                        else:
-                            error_count += 1
-                            errors.append(f"{ag_name}: {ind_error[:50]}")
-                            print(f"      ❌ {ag_name}: {ind_error[:50]}")
-                    time.sleep(0.1)
+            for _, ag_name, shop_name in batch:
+                error_count += 1
+                errors.append(f"{ag_name}: {error_msg[:50]}")
+                log.warning("      ❌ %s: %s", ag_name, error_msg[:50])
+            continue
 
-        # Small delay between batches
-        if i + batch_size < len(operations):
-            time.sleep(0.2)
+        for index, (_, ag_name, shop_name) in enumerate(batch):
+            error_code, error_msg = failed.get(index, (None, None))
+            if error_code is None:
+                success_count += 1
+                log.debug("      ✅ %s: excluded '%s'", ag_name, shop_name)
+            elif error_code == "LISTING_GROUP_ALREADY_EXISTS":
+                # Already excluded, count as success
+                success_count += 1
+                log.debug("      ℹ️  %s: already excluded", ag_name)
+            else:
+                error_count += 1
+                errors.append(f"{ag_name}: {error_msg[:50]}")
+                log.warning("      ❌ %s: %s", ag_name, error_msg[:50])
 
     return (success_count, error_count, errors)
 
@@ -4237,7 +5956,8 @@ def add_shop_exclusions_batch(
     customer_id: str,
     ad_group_id: str,
     ad_group_name: str,
-    shop_names: list
+    shop_names: list,
+    tree_cache: dict = None
 ) -> dict:
     """
     Add multiple shop exclusions to an ad group's listing tree in one batch.
@@ -4251,6 +5971,8 @@ def add_shop_exclusions_batch(
         ad_group_id: Ad group ID
         ad_group_name: Ad group name (for logging)
         shop_names: List of shop names to exclude
+        tree_cache: Optional bulk_fetch_cl3_trees result covering this ad group;
+            the entry is dropped once the tree changes
 
     Returns:
         dict: {
@@ -4259,10 +5981,8 @@ def add_shop_exclusions_batch(
             'errors': list of (shop_name, error_msg) tuples
         }
     """
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    agc_service = client.get_service("AdGroupCriterionService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ad_group_id = str(ad_group_id)
 
     result = {
         'success': [],
@@ -4273,120 +5993,63 @@ def add_shop_exclusions_batch(
     # Normalize shop names for case-insensitive matching
     shop_names_lower = {name.lower(): name for name in shop_names}
 
-    # Step 1: Read existing tree structure ONCE
-    query = f"""
-        SELECT
-            ad_group_criterion.resource_name,
-            ad_group_criterion.listing_group.type,
-            ad_group_criterion.listing_group.parent_ad_group_criterion,
-            ad_group_criterion.listing_group.case_value.product_custom_attribute.index,
-            ad_group_criterion.listing_group.case_value.product_custom_attribute.value,
-            ad_group_criterion.negative
-        FROM ad_group_criterion
-        WHERE ad_group_criterion.ad_group = '{ag_path}'
-            AND ad_group_criterion.type = 'LISTING_GROUP'
-    """
-
+    # Step 1: Read existing tree structure ONCE (unless bulk-prefetched by the caller)
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
+        if tree_cache is None or ad_group_id not in tree_cache:
+            tree_cache = bulk_fetch_cl3_trees(client, customer_id, [ad_group_id])
+        tree = tree_cache[ad_group_id]
     except Exception as e:
         # All shops failed due to read error
         for shop_name in shop_names:
             result['errors'].append((shop_name, f"Error reading tree: {str(e)[:50]}"))
         return result
 
-    if not results:
+    if tree is None:
         for shop_name in shop_names:
             result['errors'].append((shop_name, "No listing tree found"))
         return result
 
     # Step 2: Find parent for CL3 and existing exclusions
-    parent_for_cl3 = None
-    existing_cl3_exclusions = set()
-
-    for row in results:
-        criterion = row.ad_group_criterion
-        lg = criterion.listing_group
-
-        try:
-            index_name = lg.case_value.product_custom_attribute.index.name
-        except (AttributeError, TypeError):
-            index_name = None
-
-        if index_name == 'INDEX3':
-            value_str = lg.case_value.product_custom_attribute.value
-            if value_str and criterion.negative:
-                existing_cl3_exclusions.add(value_str.lower())
-            if lg.parent_ad_group_criterion:
-                parent_for_cl3 = lg.parent_ad_group_criterion
+    parent_for_cl3 = tree['parent_for_cl3']
+    existing_cl3_exclusions = tree['cl3_exclusions']
 
     if not parent_for_cl3:
         for shop_name in shop_names:
             result['errors'].append((shop_name, "No parent for CL3 found"))
         return result
 
-    # Step 3: Determine which shops to add vs skip
-    operations = []
-    for shop_lower, shop_name in shop_names_lower.items():
-        if shop_lower in existing_cl3_exclusions:
-            result['already_excluded'].append(shop_name)
-        else:
-            # Create operation for this shop
-            dim_cl3_shop = client.get_type("ListingDimensionInfo")
-            dim_cl3_shop.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-            dim_cl3_shop.product_custom_attribute.value = shop_name
-
-            op = create_listing_group_unit_biddable(
-                client=client,
-                customer_id=customer_id,
-                ad_group_id=ad_group_id,
-                parent_ad_group_criterion_resource_name=parent_for_cl3,
-                listing_dimension_info=dim_cl3_shop,
-                targeting_negative=True,
-                cpc_bid_micros=None
-            )
-            operations.append((op, shop_name))
+    # Step 3: Determine which shops to add vs skip (one set intersection)
+    already_lower = shop_names_lower.keys() & existing_cl3_exclusions.keys()
+    result['already_excluded'] = [shop_names_lower[shop_lower] for shop_lower in already_lower]
+    to_add = [shop_name for shop_lower, shop_name in shop_names_lower.items() if shop_lower not in already_lower]
+    operations = list(zip(
+        cl3_exclusion_operations(client, customer_id, ad_group_id, parent_for_cl3, to_add), to_add
+    ))
 
     if not operations:
         # All shops were already excluded
         return result
 
-    # Step 4: Execute batch
+    # Step 4: Execute batch (partial failure: only bad exclusions come back)
+    _forget_cl3_tree_meta(customer_id, ad_group_id)
+    tree_cache.pop(ad_group_id, None)
     try:
         ops = [op for op, _ in operations]
-        agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops)
-        for _, shop_name in operations:
-            result['success'].append(shop_name)
-    except GoogleAdsException as gae:
-        error_str = str(gae)
-        if "LISTING_GROUP_ALREADY_EXISTS" in error_str:
-            # Some were duplicates - try individually
-            for op, shop_name in operations:
-                try:
-                    agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=[op])
-                    result['success'].append(shop_name)
-                except Exception as ind_e:
-                    ind_error = str(ind_e)
-                    if "LISTING_GROUP_ALREADY_EXISTS" in ind_error:
-                        result['already_excluded'].append(shop_name)
-                    else:
-                        result['errors'].append((shop_name, ind_error[:50]))
-        else:
-            # Batch failed - try individually
-            for op, shop_name in operations:
-                try:
-                    agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=[op])
-                    result['success'].append(shop_name)
-                except Exception as ind_e:
-                    ind_error = str(ind_e)
-                    if "LISTING_GROUP_ALREADY_EXISTS" in ind_error:
-                        result['already_excluded'].append(shop_name)
-                    else:
-                        result['errors'].append((shop_name, ind_error[:50]))
+        failed = mutate_ad_group_criteria_partial(client, agc_service, customer_id, ops)
     except Exception as e:
         error_msg = str(e)[:100]
         for _, shop_name in operations:
             result['errors'].append((shop_name, error_msg))
+        return result
+
+    for index, (_, shop_name) in enumerate(operations):
+        error_code, error_msg = failed.get(index, (None, None))
+        if error_code is None:
+            result['success'].append(shop_name)
+        elif error_code == "LISTING_GROUP_ALREADY_EXISTS":
+            result['already_excluded'].append(shop_name)
+        else:
+            result['errors'].append((shop_name, error_msg[:50]))
 
     return result
 
@@ -4420,10 +6083,9 @@ def replace_shop_exclusions_batch(
             'errors': list of (old_name, error_msg) tuples
         }
     """
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    agc_service = client.get_service("AdGroupCriterionService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ag_path = f"customers/{customer_id}/adGroups/{ad_group_id}"
 
     result = {
         'success': [],
@@ -4452,7 +6114,7 @@ def replace_shop_exclusions_batch(
     """
 
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
+        results = search_stream_rows(ga_service, customer_id, query)
     except Exception as e:
         for old_name in replacements:
             result['errors'].append((old_name, f"Error reading tree: {str(e)[:50]}"))
@@ -4468,16 +6130,12 @@ def replace_shop_exclusions_batch(
     existing_clean = set()  # lowercase values of existing negative CL3 nodes
 
     for row in results:
+        # Bind the nested fields once per row
         criterion = row.ad_group_criterion
         lg = criterion.listing_group
-
-        try:
-            index_name = lg.case_value.product_custom_attribute.index.name
-        except (AttributeError, TypeError):
-            index_name = None
+        index_name, value = _custom_attribute_fields(lg.case_value.product_custom_attribute)
 
         if index_name == 'INDEX3':
-            value = lg.case_value.product_custom_attribute.value
             if lg.parent_ad_group_criterion:
                 parent_for_cl3 = lg.parent_ad_group_criterion
 
@@ -4492,6 +6150,8 @@ def replace_shop_exclusions_batch(
 
     # Step 3: Build operations
     operations = []  # List of (op, old_name, action_type)
+    idx3 = client.enums.ProductCustomAttributeIndexEnum.INDEX3  # Resolved once for the loop
+    op_type = get_cached_type(client, "AdGroupCriterionOperation")
     # action_type: 'replace' or 'remove_only' (when clean already exists)
 
     for old_lower, (old_name, new_name) in old_names_lower.items():
@@ -4503,7 +6163,7 @@ def replace_shop_exclusions_batch(
         new_lower = new_name.lower()
 
         # REMOVE operation for the old pipe-version
-        remove_op = client.get_type("AdGroupCriterionOperation")
+        remove_op = op_type()
         remove_op.remove = resource_name
         operations.append((remove_op, old_name, 'remove'))
 
@@ -4518,9 +6178,7 @@ def replace_shop_exclusions_batch(
                 continue
 
             # CREATE operation for the new clean version
-            dim_cl3_shop = client.get_type("ListingDimensionInfo")
-            dim_cl3_shop.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX3
-            dim_cl3_shop.product_custom_attribute.value = new_name
+            dim_cl3_shop = make_custom_label_dim(client, idx3, new_name)
 
             create_op = create_listing_group_unit_biddable(
                 client=client,
@@ -4544,9 +6202,8 @@ def replace_shop_exclusions_batch(
 
     if real_ops:
         try:
-            agc_service.mutate_ad_group_criteria(
-                customer_id=customer_id,
-                operations=[op for op, _, _ in real_ops]
+            mutate_ad_group_criteria_with_retry(
+                agc_service, customer_id, [op for op, _, _ in real_ops]
             )
             # Batch succeeded - categorize results
             replaced_names = set()
@@ -4597,10 +6254,7 @@ def _replace_individual_fallback(client, customer_id, agc_service, operations, r
         if not ops:
             continue
         try:
-            agc_service.mutate_ad_group_criteria(
-                customer_id=customer_id,
-                operations=ops
-            )
+            mutate_ad_group_criteria_with_retry(agc_service, customer_id, ops)
             new_name = replacements[old_name]
             if old_name in marker_names:
                 result['already_clean'].append((old_name, new_name))
@@ -4632,9 +6286,9 @@ def prefetch_pla_campaigns_and_ad_groups(
     """
     print(f"\n📥 Pre-fetching campaigns and ad groups (prefix: {campaign_prefix})...")
 
-    ga_service = client.get_service("GoogleAdsService")
+    ga_service = get_cached_service(client, "GoogleAdsService")
 
-    escaped_prefix = campaign_prefix.replace("'", "\\'")
+    escaped_prefix = escape_gaql_string(campaign_prefix)
     query = f"""
         SELECT
             campaign.id,
@@ -4651,7 +6305,7 @@ def prefetch_pla_campaigns_and_ad_groups(
     """
 
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
+        results = search_stream_rows(ga_service, customer_id, query)
     except Exception as e:
         print(f"❌ Error pre-fetching: {e}")
         return {}
@@ -4682,8 +6336,7 @@ def process_exclusion_sheet_v2(
     client: GoogleAdsClient,
     workbook: openpyxl.Workbook,
     customer_id: str,
-    file_path: str = None,
-    save_interval: int = 10
+    file_path: str = None
 ):
     """
     Process the 'uitsluiten' (exclusion) sheet - V2 with cat_ids mapping.
@@ -4714,16 +6367,15 @@ def process_exclusion_sheet_v2(
         workbook: Excel workbook
         customer_id: Customer ID
         file_path: Path to Excel file (for saving)
-        save_interval: Save progress every N groups
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING EXCLUSION SHEET V2: '{SHEET_EXCLUSION}'")
     print(f"(OPTIMIZED: Grouping shops by maincat_id + cl1)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
 
     # Load cat_ids mapping
     print("\nLoading cat_ids mapping...")
-    cat_ids_mapping = load_cat_ids_mapping(workbook)
+    cat_ids_mapping = load_cat_ids_mapping(workbook, file_path)
     if not cat_ids_mapping:
         print("❌ No cat_ids mapping loaded, cannot process exclusions")
         return
@@ -4738,6 +6390,10 @@ def process_exclusion_sheet_v2(
     print("\nPre-fetching PLA campaigns and ad groups...")
     campaign_cache = prefetch_pla_campaigns_and_ad_groups(client, customer_id, "PLA/")
 
+    # Row results are buffered until finish_sheet; the journal lets an
+    # interrupted run resume without periodic workbook saves
+    journal, results_by_row = ProgressJournal.open_and_replay(file_path, SHEET_EXCLUSION, "exclusion_v2")
+
     # =========================================================================
     # STEP 1: Group all rows by (maincat_id, cl1) for efficient batch processing
     # =========================================================================
@@ -4747,16 +6403,17 @@ def process_exclusion_sheet_v2(
     groups = defaultdict(list)
     rows_with_missing_fields = []
 
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
+    # Plain value tuples (columns A up to the result column)
+    for idx, row in enumerate(sheet.iter_rows(min_row=2, max_col=COL_EX_STATUS + 1, values_only=True), start=2):
+        shop_name = row[COL_EX_SHOP_NAME]
+        maincat_id = row[COL_EX_MAINCAT_ID]
+        custom_label_1 = row[COL_EX_CUSTOM_LABEL_1]
+        status_value = row[COL_EX_STATUS]
+
         # Check if already processed
-        status_value = row[COL_EX_STATUS].value if len(row) > COL_EX_STATUS else None
-        if status_value is not None and status_value != '':
+        if status_value not in EMPTY_STATUS_VALUES or idx in results_by_row:
             continue
 
-        shop_name = row[COL_EX_SHOP_NAME].value
-        maincat_id = row[COL_EX_MAINCAT_ID].value
-        custom_label_1 = row[COL_EX_CUSTOM_LABEL_1].value
-
         # Skip empty rows
         if not shop_name:
             continue
@@ -4773,8 +6430,7 @@ def process_exclusion_sheet_v2(
     # Mark rows with missing fields as errors
     for idx in rows_with_missing_fields:
         print(f"[Row {idx}] ⚠️  Missing required fields, skipping")
-        sheet.cell(row=idx, column=COL_EX_STATUS + 1).value = False
-        sheet.cell(row=idx, column=COL_EX_ERROR + 1).value = "Missing required fields"
+        results_by_row[idx] = (False, "Missing required fields")
 
     total_groups = len(groups)
     total_rows = sum(len(rows) for rows in groups.values())
@@ -4783,6 +6439,9 @@ def process_exclusion_sheet_v2(
 
     if total_groups == 0:
         print("No rows to process.")
+        flush_row_results(sheet, results_by_row, COL_EX_STATUS, COL_EX_ERROR)
+        if journal:
+            journal.close()
         return
 
     # =========================================================================
@@ -4792,7 +6451,18 @@ def process_exclusion_sheet_v2(
     error_count = 0
     groups_processed = 0
 
-    for (maincat_id_str, cl1_str), rows in groups.items():
+    # Listing trees of all ad groups of each group's campaigns, one bulk query
+    # per group; the next group is read while the current one is mutated
+    group_trees = pipelined_cl3_tree_reads(client, customer_id, [
+        [
+            ag['id']
+            for deepest_cat in cat_ids_mapping.get(maincat_id_str, [])
+            for ag in campaign_cache.get(f"PLA/{deepest_cat}_{cl1_str}", {}).get('ad_groups', [])
+        ]
+        for maincat_id_str, cl1_str in groups
+    ])
+
+    for ((maincat_id_str, cl1_str), rows), tree_cache in zip(groups.items(), group_trees):
         groups_processed += 1
         shop_names = [shop_name for _, shop_name in rows]
         row_indices = [idx for idx, _ in rows]
@@ -4800,6 +6470,8 @@ def process_exclusion_sheet_v2(
         # For CL3 targeting, split shop_name at | and use first part
         # e.g. "Hbm-machines.com|NL" becomes "Hbm-machines.com"
         shop_names_for_targeting = [name.split('|')[0] if '|' in name else name for name in shop_names]
+        # Unique targeting names (in sheet order), sent to every ad group of the group
+        unique_targeting_names = list(dict.fromkeys(shop_names_for_targeting))
         # Create mapping from targeting name back to original name(s)
         targeting_to_original = {}
         for orig, tgt in zip(shop_names, shop_names_for_targeting):
@@ -4822,9 +6494,10 @@ def process_exclusion_sheet_v2(
             print(f"  ⚠️  No deepest_cats found for maincat_id={maincat_id_str}")
             # Mark all rows in this group as failed
             for idx in row_indices:
-                sheet.cell(row=idx, column=COL_EX_STATUS + 1).value = False
-                sheet.cell(row=idx, column=COL_EX_ERROR + 1).value = f"No deepest_cats for maincat_id={maincat_id_str}"
+                results_by_row[idx] = (False, f"No deepest_cats for maincat_id={maincat_id_str}")
                 error_count += 1
+            if journal:
+                journal.append({idx: results_by_row[idx] for idx in row_indices})
             continue
 
         print(f"  Found {len(deepest_cats)} deepest_cat(s)")
@@ -4834,6 +6507,29 @@ def process_exclusion_sheet_v2(
         campaigns_found = 0
         total_exclusions_added = 0
 
+        def exclude_shops_in_ad_group(ag_id, ag_name):
+            # Retry logic for connection errors
+            max_retries = 3
+            for attempt in range(max_retries):
+                api_rate_limiter.acquire()
+                try:
+                    return add_shop_exclusions_batch(
+                        client=client,
+                        customer_id=customer_id,
+                        ad_group_id=ag_id,
+                        ad_group_name=ag_name,
+                        shop_names=unique_targeting_names,
+                        tree_cache=tree_cache
+                    )
+                except Exception as e:
+                    error_str = str(e).lower()
+                    if ("failed to connect" in error_str or "unavailable" in error_str) and attempt < max_retries - 1:
+                        retry_delay = _backoff_delay(attempt)
+                        print(f"    ⚠️  Connection error, retrying in {retry_delay:.1f}s...")
+                        time.sleep(retry_delay)
+                        continue
+                    raise
+
         # Process each deepest_cat ONCE for all shops in this group
         for deepest_cat in deepest_cats:
             campaign_name = f"PLA/{deepest_cat}_{cl1_str}"
@@ -4844,75 +6540,55 @@ def process_exclusion_sheet_v2(
                 ad_groups = campaign_data['ad_groups']
                 print(f"    📁 Campaign: {campaign_name} ({len(ad_groups)} ad group(s))")
 
-                for ag in ad_groups:
-                    ag_id = str(ag['id'])
-                    ag_name = ag['name']
-
-                    # Retry logic for connection errors
-                    max_retries = 3
-                    retry_delay = 2
-
-                    for attempt in range(max_retries):
+                # Ad groups are independent: exclude in parallel, paced by the
+                # shared api_rate_limiter
+                with ThreadPoolExecutor(max_workers=AD_GROUP_SETUP_WORKERS) as executor:
+                    futures = {
+                        executor.submit(exclude_shops_in_ad_group, str(ag['id']), ag['name']): ag['name']
+                        for ag in ad_groups
+                    }
+                    # Merge each ad group's results as soon as its worker finishes
+                    for future in as_completed(futures):
+                        ag_name = futures[future]
                         try:
-                            # Call batch function with targeting names (split at |)
-                            # Use unique targeting names to avoid duplicates
-                            unique_targeting_names = list(set(shop_names_for_targeting))
-                            result = add_shop_exclusions_batch(
-                                client=client,
-                                customer_id=customer_id,
-                                ad_group_id=ag_id,
-                                ad_group_name=ag_name,
-                                shop_names=unique_targeting_names
-                            )
-
-                            # Log results per ad group
-                            success_count = len(result['success'])
-                            already_count = len(result['already_excluded'])
-                            error_count = len(result['errors'])
-                            if error_count > 0:
-                                print(f"      ❌ {ag_name}: {error_count} error(s), {success_count} added, {already_count} already excluded")
-                                for shop, err in result['errors'][:3]:  # Show first 3 errors
-                                    print(f"         - {shop}: {err[:60]}")
-                            elif success_count > 0:
-                                print(f"      ✅ {ag_name}: {success_count} added, {already_count} already excluded")
-                            else:
-                                print(f"      ⏭️  {ag_name}: all {already_count} already excluded")
-
-                            # Aggregate results - map targeting names back to original names
-                            for targeting_name in result['success']:
-                                # Update all original names that map to this targeting name
-                                for orig_name in targeting_to_original.get(targeting_name, [targeting_name]):
-                                    if orig_name in shop_results:
-                                        shop_results[orig_name]['success'] += 1
-                                        total_exclusions_added += 1
-                            for targeting_name in result['already_excluded']:
-                                for orig_name in targeting_to_original.get(targeting_name, [targeting_name]):
-                                    if orig_name in shop_results:
-                                        shop_results[orig_name]['already_excluded'] += 1
-                            for targeting_name, error in result['errors']:
-                                for orig_name in targeting_to_original.get(targeting_name, [targeting_name]):
-                                    if orig_name in shop_results:
-                                        shop_results[orig_name]['errors'].append(f"{ag_name}: {error}")
-
-                            break  # Success, exit retry loop
-
+                            result = future.result()
                         except Exception as e:
-                            error_str = str(e)
-                            if "failed to connect" in error_str.lower() or "unavailable" in error_str.lower():
-                                if attempt < max_retries - 1:
-                                    print(f"    ⚠️  Connection error, retrying in {retry_delay}s...")
-                                    time.sleep(retry_delay)
-                                    retry_delay *= 2
-                                    continue
                             # Non-retryable error or max retries reached
                             error_msg = str(e)[:50]
                             print(f"      ❌ {ag_name}: {error_msg}")
                             for shop in shop_names:
                                 shop_results[shop]['errors'].append(f"{ag_name}: {error_msg}")
-                            break
+                            continue
 
-                    # Rate limiting delay after each ad group (not each shop!)
-                    time.sleep(0.3)
+                        # Log results per ad group
+                        added_count = len(result['success'])
+                        already_count = len(result['already_excluded'])
+                        failed_count = len(result['errors'])
+                        if failed_count > 0:
+                            log.warning("      ❌ %s: %s error(s), %s added, %s already excluded",
+                                        ag_name, failed_count, added_count, already_count)
+                            for shop, err in result['errors'][:3]:  # Show first 3 errors
+                                log.warning("         - %s: %s", shop, err[:60])
+                        elif added_count > 0:
+                            log.debug("      ✅ %s: %s added, %s already excluded", ag_name, added_count, already_count)
+                        else:
+                            log.debug("      ⏭️  %s: all %s already excluded", ag_name, already_count)
+
+                        # Aggregate results - map targeting names back to original names
+                        for targeting_name in result['success']:
+                            # Update all original names that map to this targeting name
+                            for orig_name in targeting_to_original.get(targeting_name, [targeting_name]):
+                                if orig_name in shop_results:
+                                    shop_results[orig_name]['success'] += 1
+                                    total_exclusions_added += 1
+                        for targeting_name in result['already_excluded']:
+                            for orig_name in targeting_to_original.get(targeting_name, [targeting_name]):
+                                if orig_name in shop_results:
+                                    shop_results[orig_name]['already_excluded'] += 1
+                        for targeting_name, error in result['errors']:
+                            for orig_name in targeting_to_original.get(targeting_name, [targeting_name]):
+                                if orig_name in shop_results:
+                                    shop_results[orig_name]['errors'].append(f"{ag_name}: {error}")
 
         print(f"  Summary: {campaigns_found} campaign(s), {total_exclusions_added} exclusion(s) added")
 
@@ -4929,55 +6605,41 @@ def process_exclusion_sheet_v2(
 
             if campaigns_found == 0:
                 # No campaigns found at all - this is an error
-                sheet.cell(row=idx, column=COL_EX_STATUS + 1).value = False
-                sheet.cell(row=idx, column=COL_EX_ERROR + 1).value = f"No campaigns found for maincat_id={maincat_id_str}"
+                results_by_row[idx] = (False, f"No campaigns found for maincat_id={maincat_id_str}")
                 error_count += 1
-                print(f"    Row {idx} ({shop_name}): ❌ No campaigns")
+                log.warning("    Row %s (%s): ❌ No campaigns", idx, shop_name)
             elif has_errors:
-                sheet.cell(row=idx, column=COL_EX_STATUS + 1).value = False
                 error_summary = "; ".join(result['errors'][:3])
-                sheet.cell(row=idx, column=COL_EX_ERROR + 1).value = error_summary[:100]
+                results_by_row[idx] = (False, error_summary[:100])
                 error_count += 1
-                print(f"    Row {idx} ({shop_name}): ❌ {len(result['errors'])} error(s)")
+                log.warning("    Row %s (%s): ❌ %s error(s)", idx, shop_name, len(result['errors']))
             else:
-                sheet.cell(row=idx, column=COL_EX_STATUS + 1).value = True
-                sheet.cell(row=idx, column=COL_EX_ERROR + 1).value = ""
+                results_by_row[idx] = (True, "")
                 success_count += 1
-                print(f"    Row {idx} ({shop_name}): ✅ added={result['success']}, already={result['already_excluded']}")
+                log.debug("    Row %s (%s): ✅ added=%s, already=%s", idx, shop_name, result['success'], result['already_excluded'])
 
-        # Save periodically (every N groups)
-        if file_path and groups_processed % save_interval == 0:
-            print(f"\n💾 Saving progress ({groups_processed} groups processed)...")
-            try:
-                workbook.save(file_path)
-            except Exception as save_error:
-                print(f"⚠️  Error saving: {save_error}")
+        # Record this group's results in the journal instead of saving the workbook
+        if journal:
+            journal.append({idx: results_by_row[idx] for idx in row_indices})
 
-    # Final save
-    if file_path:
-        print(f"\n💾 Final save...")
-        try:
-            workbook.save(file_path)
-        except Exception as save_error:
-            print(f"⚠️  Error on final save: {save_error}")
+    finish_sheet(sheet, workbook, file_path, journal, results_by_row, COL_EX_STATUS, COL_EX_ERROR)
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"EXCLUSION SHEET V2 SUMMARY (OPTIMIZED)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total groups processed: {groups_processed}")
     print(f"Total rows processed: {success_count + error_count}")
     print(f"Rows with missing fields: {len(rows_with_missing_fields)}")
     print(f"✅ Successful: {success_count}")
     print(f"❌ Failed: {error_count + len(rows_with_missing_fields)}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
 def process_check_sheet(
     client: GoogleAdsClient,
     workbook: openpyxl.Workbook,
     customer_id: str,
-    file_path: str = None,
-    save_interval: int = 10
+    file_path: str = None
 ):
     """
     Process the 'check' sheet - replace pipe-version shop exclusions with clean lowercase versions.
@@ -5002,16 +6664,15 @@ def process_check_sheet(
         workbook: Excel workbook
         customer_id: Customer ID
         file_path: Path to Excel file (for saving)
-        save_interval: Save progress every N groups
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING CHECK SHEET: '{SHEET_CHECK}'")
     print(f"(Replace pipe-version exclusions with clean lowercase versions)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
 
     # Load cat_ids mapping
     print("\nLoading cat_ids mapping...")
-    cat_ids_mapping = load_cat_ids_mapping(workbook)
+    cat_ids_mapping = load_cat_ids_mapping(workbook, file_path)
     if not cat_ids_mapping:
         print("No cat_ids mapping loaded, cannot process check sheet")
         return
@@ -5026,6 +6687,10 @@ def process_check_sheet(
     print("\nPre-fetching PLA campaigns and ad groups...")
     campaign_cache = prefetch_pla_campaigns_and_ad_groups(client, customer_id, "PLA/")
 
+    # Row results are buffered until finish_sheet; the journal lets an
+    # interrupted run resume without periodic workbook saves
+    journal, results_by_row = ProgressJournal.open_and_replay(file_path, SHEET_CHECK, "check")
+
     # =========================================================================
     # STEP 1: Group all rows by (maincat_id, cl1)
     # =========================================================================
@@ -5035,16 +6700,17 @@ def process_check_sheet(
     groups = defaultdict(list)
     rows_with_missing_fields = []
 
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
+    # Plain value tuples (columns A up to the result column)
+    for idx, row in enumerate(sheet.iter_rows(min_row=2, max_col=COL_CHK_STATUS + 1, values_only=True), start=2):
+        shop_name = row[COL_CHK_SHOP_NAME]
+        maincat_id = row[COL_CHK_MAINCAT_ID]
+        custom_label_1 = row[COL_CHK_CUSTOM_LABEL_1]
+        status_value = row[COL_CHK_STATUS]
+
         # Check if already processed
-        status_value = row[COL_CHK_STATUS].value if len(row) > COL_CHK_STATUS else None
-        if status_value is not None and status_value != '':
+        if status_value not in EMPTY_STATUS_VALUES or idx in results_by_row:
             continue
 
-        shop_name = row[COL_CHK_SHOP_NAME].value
-        maincat_id = row[COL_CHK_MAINCAT_ID].value
-        custom_label_1 = row[COL_CHK_CUSTOM_LABEL_1].value
-
         # Skip empty rows
         if not shop_name:
             continue
@@ -5052,8 +6718,7 @@ def process_check_sheet(
         # Validate that shop_name contains '|'
         if '|' not in str(shop_name):
             print(f"[Row {idx}] Skipping '{shop_name}' - no pipe character found")
-            sheet.cell(row=idx, column=COL_CHK_STATUS + 1).value = False
-            sheet.cell(row=idx, column=COL_CHK_ERROR + 1).value = "No pipe character in shop name"
+            results_by_row[idx] = (False, "No pipe character in shop name")
             continue
 
         # Track rows with missing required fields
@@ -5068,8 +6733,7 @@ def process_check_sheet(
     # Mark rows with missing fields as errors
     for idx in rows_with_missing_fields:
         print(f"[Row {idx}] Missing required fields, skipping")
-        sheet.cell(row=idx, column=COL_CHK_STATUS + 1).value = False
-        sheet.cell(row=idx, column=COL_CHK_ERROR + 1).value = "Missing required fields"
+        results_by_row[idx] = (False, "Missing required fields")
 
     total_groups = len(groups)
     total_rows = sum(len(rows) for rows in groups.values())
@@ -5078,6 +6742,9 @@ def process_check_sheet(
 
     if total_groups == 0:
         print("No rows to process.")
+        flush_row_results(sheet, results_by_row, COL_CHK_STATUS, COL_CHK_ERROR)
+        if journal:
+            journal.close()
         return
 
     # =========================================================================
@@ -5111,9 +6778,10 @@ def process_check_sheet(
         if not deepest_cats:
             print(f"  No deepest_cats found for maincat_id={maincat_id_str}")
             for idx in row_indices:
-                sheet.cell(row=idx, column=COL_CHK_STATUS + 1).value = False
-                sheet.cell(row=idx, column=COL_CHK_ERROR + 1).value = f"No deepest_cats for maincat_id={maincat_id_str}"
+                results_by_row[idx] = (False, f"No deepest_cats for maincat_id={maincat_id_str}")
                 error_count += 1
+            if journal:
+                journal.append({idx: results_by_row[idx] for idx in row_indices})
             continue
 
         print(f"  Found {len(deepest_cats)} deepest_cat(s)")
@@ -5139,7 +6807,6 @@ def process_check_sheet(
 
                     # Retry logic for connection errors
                     max_retries = 3
-                    retry_delay = 2
 
                     for attempt in range(max_retries):
                         try:
@@ -5192,9 +6859,9 @@ def process_check_sheet(
                             error_str = str(e)
                             if "failed to connect" in error_str.lower() or "unavailable" in error_str.lower():
                                 if attempt < max_retries - 1:
-                                    print(f"    Connection error, retrying in {retry_delay}s...")
+                                    retry_delay = _backoff_delay(attempt)
+                                    print(f"    Connection error, retrying in {retry_delay:.1f}s...")
                                     time.sleep(retry_delay)
-                                    retry_delay *= 2
                                     continue
                             # Non-retryable error or max retries reached
                             error_msg = str(e)[:50]
@@ -5203,9 +6870,6 @@ def process_check_sheet(
                                 shop_results[shop]['errors'].append(f"{ag_name}: {error_msg}")
                             break
 
-                    # Rate limiting delay
-                    time.sleep(0.3)
-
         print(f"  Summary: {campaigns_found} campaign(s), {total_replacements} replacement(s)")
 
         # =========================================================================
@@ -5218,53 +6882,39 @@ def process_check_sheet(
             has_activity = res['success'] > 0 or res['already_clean'] > 0
 
             if campaigns_found == 0:
-                sheet.cell(row=idx, column=COL_CHK_STATUS + 1).value = False
-                sheet.cell(row=idx, column=COL_CHK_ERROR + 1).value = f"No campaigns found for maincat_id={maincat_id_str}"
+                results_by_row[idx] = (False, f"No campaigns found for maincat_id={maincat_id_str}")
                 error_count += 1
-                print(f"    Row {idx} ({shop_name}): No campaigns")
+                log.warning("    Row %s (%s): No campaigns", idx, shop_name)
             elif has_errors:
-                sheet.cell(row=idx, column=COL_CHK_STATUS + 1).value = False
                 error_summary = "; ".join(res['errors'][:3])
-                sheet.cell(row=idx, column=COL_CHK_ERROR + 1).value = error_summary[:100]
+                results_by_row[idx] = (False, error_summary[:100])
                 error_count += 1
-                print(f"    Row {idx} ({shop_name}): {len(res['errors'])} error(s)")
+                log.warning("    Row %s (%s): %s error(s)", idx, shop_name, len(res['errors']))
             elif has_activity:
-                sheet.cell(row=idx, column=COL_CHK_STATUS + 1).value = True
-                sheet.cell(row=idx, column=COL_CHK_ERROR + 1).value = ""
+                results_by_row[idx] = (True, "")
                 success_count += 1
-                print(f"    Row {idx} ({shop_name}): replaced={res['success']}, already_clean={res['already_clean']}")
+                log.debug("    Row %s (%s): replaced=%s, already_clean=%s", idx, shop_name, res['success'], res['already_clean'])
             else:
                 # Not found in any ad group - mark as success (nothing to replace)
-                sheet.cell(row=idx, column=COL_CHK_STATUS + 1).value = True
-                sheet.cell(row=idx, column=COL_CHK_ERROR + 1).value = "Not found in any ad group (no action needed)"
+                results_by_row[idx] = (True, "Not found in any ad group (no action needed)")
                 success_count += 1
-                print(f"    Row {idx} ({shop_name}): not found in any ad group")
+                log.debug("    Row %s (%s): not found in any ad group", idx, shop_name)
 
-        # Save periodically
-        if file_path and groups_processed % save_interval == 0:
-            print(f"\nSaving progress ({groups_processed} groups processed)...")
-            try:
-                workbook.save(file_path)
-            except Exception as save_error:
-                print(f"Error saving: {save_error}")
+        # Record this group's results in the journal instead of saving the workbook
+        if journal:
+            journal.append({idx: results_by_row[idx] for idx in row_indices})
 
-    # Final save
-    if file_path:
-        print(f"\nFinal save...")
-        try:
-            workbook.save(file_path)
-        except Exception as save_error:
-            print(f"Error on final save: {save_error}")
+    finish_sheet(sheet, workbook, file_path, journal, results_by_row, COL_CHK_STATUS, COL_CHK_ERROR)
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"CHECK SHEET SUMMARY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total groups processed: {groups_processed}")
     print(f"Total rows processed: {success_count + error_count}")
     print(f"Rows with missing fields: {len(rows_with_missing_fields)}")
     print(f"Successful: {success_count}")
     print(f"Failed: {error_count + len(rows_with_missing_fields)}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
 def process_check_cl1_sheet(
@@ -5299,10 +6949,10 @@ def process_check_cl1_sheet(
         file_path: Path to Excel file (for saving)
         save_interval: Save progress every N campaigns
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"CHECKING CL1 TARGETING: '{SHEET_INCLUSION}'")
     print(f"(Check and rebuild trees missing CL1 targeting)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
 
     try:
         sheet = workbook[SHEET_INCLUSION]
@@ -5315,19 +6965,18 @@ def process_check_cl1_sheet(
     data_sheet = None
     if file_path:
         try:
-            data_workbook = load_workbook(file_path, data_only=True)
+            data_workbook = load_workbook(file_path, data_only=True, read_only=True)
             data_sheet = data_workbook[SHEET_INCLUSION]
             print("   (Using data_only mode to read formula results)")
         except Exception as e:
             print(f"   Could not load data_only workbook: {e}")
 
-    # Local column constants (same as process_inclusion_sheet_v2)
+    # Local column constants (same as process_inclusion_sheet_v2; B shop ID and
+    # F budget are not used here)
     COL_SHOP_NAME = 0      # A: shop_name
-    COL_SHOP_ID = 1        # B: Shop ID (not used)
     COL_MAINCAT = 2        # C: maincat
     COL_MAINCAT_ID = 3     # D: maincat_id
     COL_CL1 = 4            # E: custom label 1
-    COL_BUDGET = 5         # F: budget (not used here)
     COL_RESULT = 6         # G: result (TRUE/FALSE)
     COL_ERR = 7            # H: error message
 
@@ -5343,23 +6992,24 @@ def process_check_cl1_sheet(
         'rows': []
     })
 
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
+    # Status from the writable sheet, values from the data_only sheet if available;
+    # the source is chosen once and rows are read as plain value tuples
+    done_rows = processed_rows(sheet, COL_RESULT)
+    start_row = first_unprocessed_row(done_rows)
+    value_rows = (data_sheet if data_sheet is not None else sheet).iter_rows(min_row=start_row, max_col=COL_CL1 + 1, values_only=True)
+
+    for idx, row in enumerate(value_rows, start=start_row):
         # Check if already processed
-        status_value = row[COL_RESULT].value if len(row) > COL_RESULT else None
-        if status_value is not None and status_value != '':
+        if idx in done_rows:
             continue
 
-        # Read values from data_only sheet if available
-        if data_sheet:
-            shop_name = data_sheet.cell(row=idx, column=COL_SHOP_NAME + 1).value
-            maincat = data_sheet.cell(row=idx, column=COL_MAINCAT + 1).value
-            maincat_id = data_sheet.cell(row=idx, column=COL_MAINCAT_ID + 1).value
-            custom_label_1 = data_sheet.cell(row=idx, column=COL_CL1 + 1).value
-        else:
-            shop_name = row[COL_SHOP_NAME].value
-            maincat = row[COL_MAINCAT].value
-            maincat_id = row[COL_MAINCAT_ID].value
-            custom_label_1 = row[COL_CL1].value
+        # read_only rows can be shorter than the sheet width
+        if len(row) <= COL_CL1:
+            row = tuple(row) + (None,) * (COL_CL1 + 1 - len(row))
+        shop_name = row[COL_SHOP_NAME]
+        maincat = row[COL_MAINCAT]
+        maincat_id = row[COL_MAINCAT_ID]
+        custom_label_1 = row[COL_CL1]
 
         # Validate required fields
         if not shop_name or not maincat or not maincat_id or not custom_label_1:
@@ -5378,6 +7028,9 @@ def process_check_cl1_sheet(
         campaigns[campaign_name]['ad_groups'][shop_name]['maincat_ids'].add(maincat_id)
         campaigns[campaign_name]['ad_groups'][shop_name]['rows'].append({'idx': idx, 'row': row})
 
+    if data_workbook:
+        data_workbook.close()
+
     total_campaigns = len(campaigns)
     total_ad_groups = sum(len(c['ad_groups']) for c in campaigns.values())
     print(f"   Found {total_campaigns} campaign(s), {total_ad_groups} ad group(s) to check\n")
@@ -5392,8 +7045,7 @@ def process_check_cl1_sheet(
     print("Step 2: Pre-fetching PLA campaigns and ad groups...")
     campaign_cache = prefetch_pla_campaigns_and_ad_groups(client, customer_id, "PLA/")
 
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
+    ga_service = get_cached_service(client, "GoogleAdsService")
 
     # =========================================================================
     # STEP 3: Process each campaign
@@ -5446,7 +7098,7 @@ def process_check_cl1_sheet(
                 continue
 
             ad_group_id = str(cached_ag['id'])
-            ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+            ag_path = f"customers/{customer_id}/adGroups/{ad_group_id}"
 
             # Read existing tree
             query = f"""
@@ -5463,7 +7115,7 @@ def process_check_cl1_sheet(
             """
 
             try:
-                tree_rows = list(ga_service.search(customer_id=customer_id, query=query))
+                tree_rows = search_stream_rows(ga_service, customer_id, query)
             except Exception as e:
                 error_msg = f"Error reading tree: {str(e)[:50]}"
                 print(f"      {error_msg}")
@@ -5487,22 +7139,16 @@ def process_check_cl1_sheet(
             shop_name_for_targeting = shop_name.split('|')[0] if '|' in shop_name else shop_name
 
             for tree_row in tree_rows:
+                # Bind the nested fields once per row
                 criterion = tree_row.ad_group_criterion
-                lg = criterion.listing_group
-
-                try:
-                    index_name = lg.case_value.product_custom_attribute.index.name
-                except (AttributeError, TypeError):
-                    index_name = None
+                index_name, value = _custom_attribute_fields(criterion.listing_group.case_value.product_custom_attribute)
 
                 if index_name == 'INDEX1':
-                    value = lg.case_value.product_custom_attribute.value
                     if value and not criterion.negative and value.lower() == cl1.lower():
                         has_correct_cl1 = True
 
                 # Collect CL3 negative exclusions (shop exclusions to preserve)
                 if index_name == 'INDEX3' and criterion.negative:
-                    value = lg.case_value.product_custom_attribute.value
                     if value and value.lower() != shop_name_for_targeting.lower():
                         existing_cl3_exclusions.append(value)
 
@@ -5521,14 +7167,12 @@ def process_check_cl1_sheet(
 
             # Retry logic for connection errors
             max_retries = 3
-            retry_delay = 2
             rebuild_success = False
 
             for attempt in range(max_retries):
                 try:
                     # Step A: Remove old tree
-                    safe_remove_entire_listing_tree(client, customer_id, ad_group_id)
-                    time.sleep(1.0)
+                    _remove_listing_tree(client, customer_id, ad_group_id)
 
                     # Step B: Build new tree with CL1
                     build_listing_tree_with_cl1(
@@ -5539,7 +7183,6 @@ def process_check_cl1_sheet(
                         maincat_ids=maincat_ids,
                         custom_label_1=cl1
                     )
-                    time.sleep(1.0)
 
                     # Step C: Re-add CL3 exclusions if any
                     if existing_cl3_exclusions:
@@ -5561,9 +7204,9 @@ def process_check_cl1_sheet(
                     error_str = str(e)
                     if "failed to connect" in error_str.lower() or "unavailable" in error_str.lower():
                         if attempt < max_retries - 1:
-                            print(f"      Connection error, retrying in {retry_delay}s...")
+                            retry_delay = _backoff_delay(attempt)
+                            print(f"      Connection error, retrying in {retry_delay:.1f}s...")
                             time.sleep(retry_delay)
-                            retry_delay *= 2
                             continue
                     # Non-retryable or max retries
                     error_msg = str(e)[:80]
@@ -5579,9 +7222,6 @@ def process_check_cl1_sheet(
                     sheet.cell(row=row_info['idx'], column=COL_RESULT + 1).value = True
                     sheet.cell(row=row_info['idx'], column=COL_ERR + 1).value = ""
 
-            # Rate limiting
-            time.sleep(0.3)
-
         # Save periodically
         if file_path and campaigns_processed % save_interval == 0:
             print(f"\nSaving progress ({campaigns_processed} campaigns processed)...")
@@ -5598,15 +7238,15 @@ def process_check_cl1_sheet(
         except Exception as save_error:
             print(f"Error on final save: {save_error}")
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"CL1 CHECK SUMMARY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Campaigns processed: {campaigns_processed}")
     print(f"Ad groups checked: {ag_checked}")
     print(f"  Already OK: {ag_already_ok}")
     print(f"  Rebuilt: {ag_rebuilt}")
     print(f"  Errors: {ag_errors}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
 def process_check_new_sheet(
@@ -5639,10 +7279,10 @@ def process_check_new_sheet(
         file_path: Path to Excel file (for saving)
         save_interval: Save progress every N rows
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING CHECK_NEW SHEET: '{SHEET_CHECK_NEW}'")
     print(f"(Replace CL3 pipe-version targeting with clean lowercase versions)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
 
     try:
         sheet = workbook[SHEET_CHECK_NEW]
@@ -5659,8 +7299,7 @@ def process_check_new_sheet(
     for camp_name, camp_data in campaign_cache.items():
         campaign_ag_lookup[camp_name] = {ag['name']: ag for ag in camp_data['ad_groups']}
 
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
+    ga_service = get_cached_service(client, "GoogleAdsService")
 
     # =========================================================================
     # Process each row
@@ -5670,16 +7309,15 @@ def process_check_new_sheet(
     skip_count = 0
     error_count = 0
 
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
+    # Plain value tuples (columns A up to the result column), unpacked per row.
+    # Results are written with sheet.cell(), which the value-only read doesn't need.
+    for idx, row in enumerate(sheet.iter_rows(min_row=2, max_col=COL_CHNEW_STATUS + 1, values_only=True), start=2):
+        shop_name, ad_group_name, campaign_name, status_value = row
+
         # Check if already processed
-        status_value = row[COL_CHNEW_STATUS].value if len(row) > COL_CHNEW_STATUS else None
-        if status_value is not None and status_value != '':
+        if status_value not in EMPTY_STATUS_VALUES:
             continue
 
-        shop_name = row[COL_CHNEW_SHOP_NAME].value
-        ad_group_name = row[COL_CHNEW_AD_GROUP_NAME].value
-        campaign_name = row[COL_CHNEW_CAMPAIGN_NAME].value
-
         # Skip empty rows
         if not shop_name:
             continue
@@ -5730,7 +7368,7 @@ def process_check_new_sheet(
             continue
 
         ad_group_id = str(cached_ag['id'])
-        ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+        ag_path = f"customers/{customer_id}/adGroups/{ad_group_id}"
 
         # Read existing tree
         query = f"""
@@ -5747,7 +7385,7 @@ def process_check_new_sheet(
         """
 
         try:
-            tree_rows = list(ga_service.search(customer_id=customer_id, query=query))
+            tree_rows = search_stream_rows(ga_service, customer_id, query)
         except Exception as e:
             error_msg = f"Error reading tree: {str(e)[:50]}"
             print(f"  {error_msg}")
@@ -5770,28 +7408,22 @@ def process_check_new_sheet(
         cl3_exclusions = []
 
         for tree_row in tree_rows:
+            # Bind the nested fields once per row
             criterion = tree_row.ad_group_criterion
             lg = criterion.listing_group
-
-            try:
-                index_name = lg.case_value.product_custom_attribute.index.name
-            except (AttributeError, TypeError):
-                index_name = None
+            index_name, value = _custom_attribute_fields(lg.case_value.product_custom_attribute)
 
             if index_name == 'INDEX3':
-                value = lg.case_value.product_custom_attribute.value
                 if value and lg.type_.name == 'SUBDIVISION':
                     cl3_subdivision_value = value
                 elif value and criterion.negative:
                     cl3_exclusions.append(value)
 
             elif index_name == 'INDEX4':
-                value = lg.case_value.product_custom_attribute.value
                 if value and not criterion.negative:
                     maincat_ids.append(value)
 
             elif index_name == 'INDEX1':
-                value = lg.case_value.product_custom_attribute.value
                 if value and not criterion.negative:
                     cl1_value = value
 
@@ -5828,14 +7460,12 @@ def process_check_new_sheet(
 
         # Rebuild the tree
         max_retries = 3
-        retry_delay = 2
         rebuild_success = False
 
         for attempt in range(max_retries):
             try:
                 # Step 1: Remove old tree
-                safe_remove_entire_listing_tree(client, customer_id, ad_group_id)
-                time.sleep(1.0)
+                _remove_listing_tree(client, customer_id, ad_group_id)
 
                 # Step 2: Rebuild with clean name
                 if cl1_value:
@@ -5855,7 +7485,6 @@ def process_check_new_sheet(
                         shop_name=clean_name,
                         maincat_ids=maincat_ids
                     )
-                time.sleep(1.0)
 
                 # Step 3: Re-add CL3 exclusions if any
                 if cl3_exclusions:
@@ -5878,9 +7507,9 @@ def process_check_new_sheet(
                 error_str = str(e)
                 if "failed to connect" in error_str.lower() or "unavailable" in error_str.lower():
                     if attempt < max_retries - 1:
-                        print(f"  Connection error, retrying in {retry_delay}s...")
+                        retry_delay = _backoff_delay(attempt)
+                        print(f"  Connection error, retrying in {retry_delay:.1f}s...")
                         time.sleep(retry_delay)
-                        retry_delay *= 2
                         continue
                 error_msg = str(e)[:80]
                 print(f"  Error: {error_msg}")
@@ -5894,9 +7523,6 @@ def process_check_new_sheet(
             sheet.cell(row=idx, column=COL_CHNEW_ERROR + 1).value = ""
             success_count += 1
 
-        # Rate limiting
-        time.sleep(0.3)
-
         # Save periodically
         if file_path and rows_processed % save_interval == 0:
             print(f"\nSaving progress ({rows_processed} rows processed)...")
@@ -5913,14 +7539,14 @@ def process_check_new_sheet(
         except Exception as save_error:
             print(f"Error on final save: {save_error}")
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"CHECK_NEW SHEET SUMMARY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Rows processed: {rows_processed}")
     print(f"Successful replacements: {success_count}")
     print(f"Skipped (already clean): {skip_count}")
     print(f"Errors: {error_count}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
 def process_exclusion_sheet(
@@ -5935,21 +7561,22 @@ def process_exclusion_sheet(
 
     Groups rows by campaign (cat_uitsluiten + custom_label_1) and collects all
     shops to exclude for each campaign. Then rebuilds each campaign's tree once
-    with all shop exclusions.
+    with all shop exclusions, several campaigns at a time (see
+    rebuild_trees_concurrently).
 
     Args:
         client: Google Ads client
         workbook: Excel workbook
         customer_id: Customer ID
         file_path: Path to Excel file for saving
-        save_interval: Save workbook every N campaign groups (default: 10)
+        save_interval: Save workbook every N rebuilt campaign groups (default: 10)
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING EXCLUSION SHEET: '{SHEET_EXCLUSION}' (GROUPED MODE)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"  Strategy: Group rows by campaign, apply all shop exclusions at once")
     print(f"  Save interval: Every {save_interval} campaign groups")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
     try:
         sheet = workbook[SHEET_EXCLUSION]
@@ -5969,7 +7596,7 @@ def process_exclusion_sheet(
 
         # Skip rows that already have a status
         status_cell = sheet.cell(row=idx, column=COL_EX_STATUS + 1)  # +1 because openpyxl is 1-indexed
-        if status_cell.value is not None and status_cell.value != '':
+        if status_cell.value not in EMPTY_STATUS_VALUES:
             continue
 
         # Extract values safely
@@ -6007,14 +7634,16 @@ def process_exclusion_sheet(
         print("✅ No campaign groups to process")
         return
 
-    # Step 2: Process each campaign group
+    # Step 2: Find each campaign group's ad group
     print("="*70)
-    print("Step 2: Processing campaign groups...")
+    print("Step 2: Finding ad groups...")
     print("="*70)
 
     success_count = 0
     fail_count = 0
     groups_processed = 0
+    rebuilds = []  # (customer_id, rebuild function, kwargs) per found group
+    rebuild_groups = []  # Group key per entry of rebuilds
 
     for i, (group_key, group_data) in enumerate(campaign_groups.items(), 1):
         try:
@@ -6031,9 +7660,9 @@ def process_exclusion_sheet(
 
         campaign_pattern = f"PLA/{cat_uitsluiten}_{custom_label_1}"
 
-        print(f"\n{'─'*70}")
+        print(f"\n{SUB_SEPARATOR}")
         print(f"GROUP {i}/{len(campaign_groups)}: {campaign_pattern}")
-        print(f"{'─'*70}")
+        print(SUB_SEPARATOR)
         print(f"   Rows in group: {len(rows)}")
         print(f"   Diepste cat ID (CL0): {diepste_cat_id}")
         print(f"   Shops to exclude: {len(shops)}")
@@ -6042,77 +7671,81 @@ def process_exclusion_sheet(
         try:
             # Find campaign and ad group
             result = get_campaign_and_ad_group_by_pattern(client, customer_id, campaign_pattern)
+        except Exception as e:
+            print(f"   ❌ ERROR: {e}")
+            error_msg = friendly_error_message(str(e))
+            for row_info in rows:
+                row_num = row_info['row_number']
+                sheet.cell(row=row_num, column=COL_EX_STATUS + 1).value = False
+                sheet.cell(row=row_num, column=COL_EX_ERROR + 1).value = error_msg
+                fail_count += 1
+            continue
 
-            if not result:
-                print(f"   ❌ Campaign not found")
-                # Mark all rows in group as NOT_FOUND
-                for row_info in rows:
-                    row_num = row_info['row_number']
-                    sheet.cell(row=row_num, column=COL_EX_STATUS + 1).value = False
-                    sheet.cell(row=row_num, column=COL_EX_ERROR + 1).value = "Campaign not found"
-                    fail_count += 1
-                continue
+        if not result:
+            print(f"   ❌ Campaign not found")
+            # Mark all rows in group as NOT_FOUND
+            for row_info in rows:
+                row_num = row_info['row_number']
+                sheet.cell(row=row_num, column=COL_EX_STATUS + 1).value = False
+                sheet.cell(row=row_num, column=COL_EX_ERROR + 1).value = "Campaign not found"
+                fail_count += 1
+            continue
 
-            print(f"   ✅ Found: Campaign ID {result['campaign']['id']}, Ad Group ID {result['ad_group']['id']}")
+        print(f"   ✅ Found: Campaign ID {result['campaign']['id']}, Ad Group ID {result['ad_group']['id']}")
 
-            # Rebuild tree with all shop exclusions and required CL0 targeting
-            rebuild_tree_with_shop_exclusions(
-                client,
-                customer_id,
-                result['ad_group']['id'],
-                shop_names=shops,  # Pass all shops for this campaign
-                required_cl0_value=diepste_cat_id  # Required CL0 from Excel
-            )
+        # Rebuild tree with all shop exclusions and required CL0 targeting
+        rebuilds.append((customer_id, rebuild_tree_with_shop_exclusions, {
+            'ad_group_id': result['ad_group']['id'],
+            'shop_names': shops,  # Pass all shops for this campaign
+            'required_cl0_value': diepste_cat_id  # Required CL0 from Excel
+        }))
+        rebuild_groups.append(group_key)
 
-            # Mark all rows in group as SUCCESS
-            for row_info in rows:
-                row_num = row_info['row_number']
-                sheet.cell(row=row_num, column=COL_EX_STATUS + 1).value = True
-                sheet.cell(row=row_num, column=COL_EX_ERROR + 1).value = ""  # Clear error message
-                success_count += 1
+    # Step 3: Rebuild the found trees concurrently, marking rows as each finishes
+    print("\n" + "="*70)
+    print(f"Step 3: Rebuilding {len(rebuilds)} tree(s) ({TREE_REBUILD_WORKERS} in parallel)...")
+    print("="*70)
 
-            groups_processed += 1
-            print(f"   ✅ SUCCESS - Tree rebuilt with {len(shops)} shop exclusion(s)")
+    # Trees of different groups share mutate requests (see RebuildScheduler)
+    with RebuildScheduler(client) as scheduler:
+        for _, _, kwargs in rebuilds:
+            kwargs['scheduler'] = scheduler
 
-        except Exception as e:
-            print(f"   ❌ ERROR: {e}")
-            # Mark all rows in group as ERROR
-            # Create brief, user-friendly error message
-            error_str = str(e)
-
-            # Shorten common error types
-            if "SUBDIVISION_REQUIRES_OTHERS_CASE" in error_str:
-                error_msg = "Tree structure error: missing OTHERS case"
-            elif "LISTING_GROUP_SUBDIVISION_REQUIRES_OTHERS_CASE" in error_str:
-                error_msg = "Tree structure error: missing OTHERS case"
-            elif "CONCURRENT_MODIFICATION" in error_str:
-                error_msg = "Concurrent modification (retry needed)"
-            elif "NOT_FOUND" in error_str or "not found" in error_str.lower():
-                error_msg = "Resource not found"
-            elif "INVALID_ARGUMENT" in error_str:
-                error_msg = "Invalid argument in API call"
-            elif "PERMISSION_DENIED" in error_str:
-                error_msg = "Permission denied"
-            elif "Could not find CL0" in error_str or "Could not find CL1" in error_str:
-                error_msg = error_str[:80]  # Keep this one as-is, it's informative
+        for done, (index, error) in enumerate(rebuild_trees_concurrently(client, rebuilds), 1):
+            cat_uitsluiten, custom_label_1 = rebuild_groups[index]
+            group_data = campaign_groups[rebuild_groups[index]]
+            campaign_pattern = f"PLA/{cat_uitsluiten}_{custom_label_1}"
+
+            if error is None:
+                # Mark all rows in group as SUCCESS
+                for row_info in group_data['rows']:
+                    row_num = row_info['row_number']
+                    sheet.cell(row=row_num, column=COL_EX_STATUS + 1).value = True
+                    sheet.cell(row=row_num, column=COL_EX_ERROR + 1).value = ""  # Clear error message
+                    success_count += 1
+
+                groups_processed += 1
+                print(f"   ✅ SUCCESS ({campaign_pattern}) - Tree rebuilt with {len(group_data['shops'])} shop exclusion(s)")
             else:
-                # Generic error - truncate but keep key info
-                error_msg = error_str[:80] if len(error_str) > 80 else error_str
+                print(f"   ❌ ERROR ({campaign_pattern}): {error}")
+                # Mark all rows in group as ERROR
+                # Create brief, user-friendly error message
+                error_msg = friendly_error_message(error)
 
-            for row_info in rows:
-                row_num = row_info['row_number']
-                sheet.cell(row=row_num, column=COL_EX_STATUS + 1).value = False
-                sheet.cell(row=row_num, column=COL_EX_ERROR + 1).value = error_msg
-                fail_count += 1
+                for row_info in group_data['rows']:
+                    row_num = row_info['row_number']
+                    sheet.cell(row=row_num, column=COL_EX_STATUS + 1).value = False
+                    sheet.cell(row=row_num, column=COL_EX_ERROR + 1).value = error_msg
+                    fail_count += 1
 
-        # Save every N groups
-        if i % save_interval == 0:
-            print(f"\n   💾 Saving progress... ({i}/{len(campaign_groups)} groups processed)")
-            try:
-                workbook.save(file_path)
-                print(f"   ✅ Progress saved successfully")
-            except Exception as save_error:
-                print(f"   ⚠️  Error saving file: {save_error}")
+            # Save every N finished groups
+            if done % save_interval == 0:
+                print(f"\n   💾 Saving progress... ({done}/{len(rebuilds)} groups rebuilt)")
+                try:
+                    workbook.save(file_path)
+                    print(f"   ✅ Progress saved successfully")
+                except Exception as save_error:
+                    print(f"   ⚠️  Error saving file: {save_error}")
 
     # Final save
     print(f"\n   💾 Final save...")
@@ -6122,15 +7755,15 @@ def process_exclusion_sheet(
     except Exception as save_error:
         print(f"   ⚠️  Error on final save: {save_error}")
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"EXCLUSION SHEET SUMMARY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total campaign groups processed: {len(campaign_groups)}")
     print(f"✅ Groups successful: {groups_processed}")
     print(f"❌ Groups failed: {len(campaign_groups) - groups_processed}")
     print(f"✅ Total rows marked success: {success_count}")
     print(f"❌ Total rows marked failed: {fail_count}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 
 # ============================================================================
@@ -6189,10 +7822,9 @@ def validate_cl1_targeting_for_ad_group(
     result['required_cl1'] = required_cl1
 
     # Step 2: Query existing listing tree
-    ga_service = client.get_service("GoogleAdsService")
-    ag_service = client.get_service("AdGroupService")
-    agc_service = client.get_service("AdGroupCriterionService")
-    ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
+    ga_service = get_cached_service(client, "GoogleAdsService")
+    agc_service = get_cached_service(client, "AdGroupCriterionService")
+    ag_path = f"customers/{customer_id}/adGroups/{ad_group_id}"
 
     query = f"""
         SELECT
@@ -6209,7 +7841,7 @@ def validate_cl1_targeting_for_ad_group(
     """
 
     try:
-        rows = list(ga_service.search(customer_id=customer_id, query=query))
+        rows = search_stream_rows(ga_service, customer_id, query)
     except Exception as e:
         result['status'] = 'error'
         result['message'] = f"Error querying listing tree: {str(e)[:100]}"
@@ -6279,9 +7911,8 @@ def validate_cl1_targeting_for_ad_group(
     # If CL1 OTHERS doesn't exist, we need to add it first
     # (Every subdivision must have an OTHERS case)
     if not cl1_others_exists:
-        dim_cl1_others = client.get_type("ListingDimensionInfo")
-        dim_cl1_others.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-        # Don't set value - this is the OTHERS case
+        # No value - this is the OTHERS case
+        dim_cl1_others = make_custom_label_dim(client, client.enums.ProductCustomAttributeIndexEnum.INDEX1)
 
         ops.append(
             create_listing_group_unit_biddable(
@@ -6296,9 +7927,7 @@ def validate_cl1_targeting_for_ad_group(
         )
 
     # Add the positive CL1 target
-    dim_cl1 = client.get_type("ListingDimensionInfo")
-    dim_cl1.product_custom_attribute.index = client.enums.ProductCustomAttributeIndexEnum.INDEX1
-    dim_cl1.product_custom_attribute.value = required_cl1
+    dim_cl1 = make_custom_label_dim(client, client.enums.ProductCustomAttributeIndexEnum.INDEX1, required_cl1)
 
     ops.append(
         create_listing_group_unit_biddable(
@@ -6313,20 +7942,19 @@ def validate_cl1_targeting_for_ad_group(
     )
 
     try:
-        agc_service.mutate_ad_group_criteria(customer_id=customer_id, operations=ops)
+        mutate_ad_group_criteria_with_retry(agc_service, customer_id, ops)
         result['status'] = 'fixed'
         result['message'] = f"Added CL1='{required_cl1}' targeting (bid: {existing_bid/1_000_000:.2f}€)"
         if not cl1_others_exists:
             result['message'] += " + added CL1 OTHERS"
         return result
     except Exception as e:
-        error_msg = str(e)
-        if "LISTING_GROUP_ALREADY_EXISTS" in error_msg:
+        if isinstance(e, GoogleAdsException) and "LISTING_GROUP_ALREADY_EXISTS" in google_ads_error_codes(e):
             result['status'] = 'ok'
             result['message'] = f"CL1='{required_cl1}' already exists (concurrent update)"
             return result
         result['status'] = 'error'
-        result['message'] = f"Error adding CL1 targeting: {error_msg[:100]}"
+        result['message'] = f"Error adding CL1 targeting: {str(e)[:100]}"
         return result
 
 
@@ -6353,21 +7981,20 @@ def validate_cl1_targeting_for_campaigns(
     Returns:
         dict with summary statistics and details
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print("CL1 TARGETING VALIDATION")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Customer ID: {customer_id}")
     print(f"Campaign filter: {campaign_name_pattern or '(all campaigns)'}")
     print(f"Dry run: {dry_run}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
-    ga_service = client.get_service("GoogleAdsService")
+    ga_service = get_cached_service(client, "GoogleAdsService")
 
     # Step 1: Query campaigns and ad groups
     where_clause = "campaign.status != 'REMOVED' AND ad_group.status != 'REMOVED'"
     if campaign_name_pattern:
-        # Escape single quotes in pattern
-        escaped_pattern = campaign_name_pattern.replace("'", "\\'")
+        escaped_pattern = escape_gaql_string(campaign_name_pattern)
         where_clause += f" AND campaign.name LIKE '{escaped_pattern}'"
 
     query = f"""
@@ -6384,7 +8011,7 @@ def validate_cl1_targeting_for_campaigns(
     """
 
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
+        results = search_stream_rows(ga_service, customer_id, query)
     except Exception as e:
         print(f"❌ Error querying campaigns/ad groups: {e}")
         return {'error': str(e)}
@@ -6443,28 +8070,24 @@ def validate_cl1_targeting_for_campaigns(
             **result
         })
 
-        # Rate limiting
-        if result['status'] == 'fixed' and not dry_run:
-            time.sleep(0.5)
-
     # Print summary
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print("CL1 VALIDATION SUMMARY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total ad groups: {stats['total']}")
     print(f"✅ Already correct: {stats['ok']}")
     print(f"🔧 Fixed: {stats['fixed']}")
     print(f"⏭️  Skipped (no _a/_b/_c suffix): {stats['skipped']}")
     print(f"❌ Errors: {stats['error']}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
     # Write ad groups that need fixing to xlsx file
     to_fix = [d for d in stats['details'] if d['status'] == 'fixed']
     if to_fix:
         from openpyxl import Workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Ad Groups to Fix"
+        # Freshly built report: stream it with a write-only workbook
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Ad Groups to Fix")
         ws.append(["Campaign Name", "Ad Group Name"])
         for item in to_fix:
             ws.append([item['campaign'], item['ad_group']])
@@ -6480,7 +8103,6 @@ def process_reverse_exclusion_sheet(
     workbook: openpyxl.Workbook,
     customer_id: str,
     file_path: str = None,
-    save_interval: int = 10,
     sheet_name: str = "verwijderen"
 ):
     """
@@ -6512,17 +8134,16 @@ def process_reverse_exclusion_sheet(
         workbook: Excel workbook
         customer_id: Customer ID
         file_path: Path to save progress
-        save_interval: Save every N groups processed
         sheet_name: Name of the sheet to process (default: "verwijderen")
     """
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"PROCESSING REVERSE EXCLUSION SHEET: '{sheet_name}'")
     print(f"(OPTIMIZED: Grouping shops by maincat_id + cl1)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
 
     # Load cat_ids mapping (same as process_exclusion_sheet_v2)
     print("\nLoading cat_ids mapping...")
-    cat_ids_mapping = load_cat_ids_mapping(workbook)
+    cat_ids_mapping = load_cat_ids_mapping(workbook, file_path)
     if not cat_ids_mapping:
         print("❌ No cat_ids mapping loaded, cannot process reverse exclusions")
         return
@@ -6535,9 +8156,8 @@ def process_reverse_exclusion_sheet(
     sheet = workbook[sheet_name]
 
     # Column indices (0-based) - same structure as uitsluiten sheet
+    # (B shop ID and C maincat are not used)
     COL_SHOP_NAME = 0      # A: Shop name
-    COL_SHOP_ID = 1        # B: Shop ID (not used)
-    COL_MAINCAT = 2        # C: maincat (category name, for reference)
     COL_MAINCAT_ID = 3     # D: maincat_id (used to look up deepest_cats)
     COL_CL1 = 4            # E: custom label 1
     COL_STATUS = 5         # F: Status
@@ -6547,6 +8167,10 @@ def process_reverse_exclusion_sheet(
     print("\nPre-fetching PLA campaigns and ad groups...")
     campaign_cache = prefetch_pla_campaigns_and_ad_groups(client, customer_id, "PLA/")
 
+    # Row results are buffered until finish_sheet; the journal lets an
+    # interrupted run resume without periodic workbook saves
+    journal, results_by_row = ProgressJournal.open_and_replay(file_path, sheet_name, "reverse_exclusion")
+
     # =========================================================================
     # STEP 1: Group all rows by (maincat_id, cl1) for efficient batch processing
     # =========================================================================
@@ -6556,16 +8180,17 @@ def process_reverse_exclusion_sheet(
     groups = defaultdict(list)
     rows_with_missing_fields = []  # Track rows with missing required fields
 
-    for idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=False), start=2):
+    # Plain value tuples (columns A up to the result column)
+    for idx, row in enumerate(sheet.iter_rows(min_row=2, max_col=COL_STATUS + 1, values_only=True), start=2):
+        shop_name = row[COL_SHOP_NAME]
+        maincat_id = row[COL_MAINCAT_ID]
+        custom_label_1 = row[COL_CL1]
+        status_value = row[COL_STATUS]
+
         # Check if already processed
-        status_value = row[COL_STATUS].value if len(row) > COL_STATUS else None
-        if status_value is not None and status_value != '':
+        if status_value not in EMPTY_STATUS_VALUES or idx in results_by_row:
             continue
 
-        shop_name = row[COL_SHOP_NAME].value
-        maincat_id = row[COL_MAINCAT_ID].value
-        custom_label_1 = row[COL_CL1].value
-
         # Skip empty rows
         if not shop_name:
             continue
@@ -6582,8 +8207,7 @@ def process_reverse_exclusion_sheet(
     # Mark rows with missing fields as errors
     for idx in rows_with_missing_fields:
         print(f"[Row {idx}] ⚠️  Missing required fields, skipping")
-        sheet.cell(row=idx, column=COL_STATUS + 1).value = False
-        sheet.cell(row=idx, column=COL_ERROR + 1).value = "Missing required fields"
+        results_by_row[idx] = (False, "Missing required fields")
 
     total_groups = len(groups)
     total_rows = sum(len(rows) for rows in groups.values())
@@ -6592,6 +8216,9 @@ def process_reverse_exclusion_sheet(
 
     if total_groups == 0:
         print("No rows to process.")
+        flush_row_results(sheet, results_by_row, COL_STATUS, COL_ERROR)
+        if journal:
+            journal.close()
         return
 
     # =========================================================================
@@ -6601,7 +8228,18 @@ def process_reverse_exclusion_sheet(
     error_count = 0
     groups_processed = 0
 
-    for (maincat_id_str, cl1_str), rows in groups.items():
+    # Listing trees of all ad groups of each group's campaigns, one bulk query
+    # per group; the next group is read while the current one is mutated
+    group_trees = pipelined_cl3_tree_reads(client, customer_id, [
+        [
+            ag['id']
+            for deepest_cat in cat_ids_mapping.get(maincat_id_str, [])
+            for ag in campaign_cache.get(f"PLA/{deepest_cat}_{cl1_str}", {}).get('ad_groups', [])
+        ]
+        for maincat_id_str, cl1_str in groups
+    ])
+
+    for ((maincat_id_str, cl1_str), rows), tree_cache in zip(groups.items(), group_trees):
         groups_processed += 1
         shop_names = [shop_name for _, shop_name in rows]
         row_indices = [idx for idx, _ in rows]
@@ -6609,6 +8247,8 @@ def process_reverse_exclusion_sheet(
         # For CL3 targeting, split shop_name at | and use first part
         # e.g. "Hbm-machines.com|NL" becomes "Hbm-machines.com"
         shop_names_for_targeting = [name.split('|')[0] if '|' in name else name for name in shop_names]
+        # Unique targeting names (in sheet order), sent to every ad group of the group
+        unique_targeting_names = list(dict.fromkeys(shop_names_for_targeting))
         # Create mapping from targeting name back to original name(s)
         targeting_to_original = {}
         for orig, tgt in zip(shop_names, shop_names_for_targeting):
@@ -6631,9 +8271,10 @@ def process_reverse_exclusion_sheet(
             print(f"  ⚠️  No deepest_cats found for maincat_id={maincat_id_str}")
             # Mark all rows in this group as failed
             for idx in row_indices:
-                sheet.cell(row=idx, column=COL_STATUS + 1).value = False
-                sheet.cell(row=idx, column=COL_ERROR + 1).value = f"No deepest_cats for maincat_id={maincat_id_str}"
+                results_by_row[idx] = (False, f"No deepest_cats for maincat_id={maincat_id_str}")
                 error_count += 1
+            if journal:
+                journal.append({idx: results_by_row[idx] for idx in row_indices})
             continue
 
         print(f"  Found {len(deepest_cats)} deepest_cat(s)")
@@ -6658,19 +8299,17 @@ def process_reverse_exclusion_sheet(
 
                     # Retry logic for connection errors
                     max_retries = 3
-                    retry_delay = 2
 
                     for attempt in range(max_retries):
                         try:
                             # Call batch function with targeting names (split at |)
-                            # Use unique targeting names to avoid duplicates
-                            unique_targeting_names = list(set(shop_names_for_targeting))
                             result = reverse_exclusion_batch(
                                 client=client,
                                 customer_id=customer_id,
                                 ad_group_id=ag_id,
                                 ad_group_name=ag_name,
-                                shop_names=unique_targeting_names
+                                shop_names=unique_targeting_names,
+                                tree_cache=tree_cache
                             )
 
                             # Aggregate results - map targeting names back to original names
@@ -6694,9 +8333,9 @@ def process_reverse_exclusion_sheet(
                             error_str = str(e)
                             if "failed to connect" in error_str.lower() or "unavailable" in error_str.lower():
                                 if attempt < max_retries - 1:
-                                    print(f"    ⚠️  Connection error, retrying in {retry_delay}s...")
+                                    retry_delay = _backoff_delay(attempt)
+                                    print(f"    ⚠️  Connection error, retrying in {retry_delay:.1f}s...")
                                     time.sleep(retry_delay)
-                                    retry_delay *= 2
                                     continue
                             # Non-retryable error or max retries reached
                             error_msg = str(e)[:50]
@@ -6705,9 +8344,6 @@ def process_reverse_exclusion_sheet(
                                 shop_results[shop]['errors'].append(f"{ag_name}: {error_msg}")
                             break
 
-                    # Rate limiting delay after each ad group (not each shop!)
-                    time.sleep(0.3)
-
         print(f"  Found {campaigns_found} campaign(s), removed {total_exclusions_removed} exclusion(s) total")
 
         # =========================================================================
@@ -6723,47 +8359,34 @@ def process_reverse_exclusion_sheet(
 
             if campaigns_found == 0:
                 # No campaigns found at all - this is an error
-                sheet.cell(row=idx, column=COL_STATUS + 1).value = False
-                sheet.cell(row=idx, column=COL_ERROR + 1).value = f"No campaigns found for maincat_id={maincat_id_str}"
+                results_by_row[idx] = (False, f"No campaigns found for maincat_id={maincat_id_str}")
                 error_count += 1
-                print(f"    Row {idx} ({shop_name}): ❌ No campaigns")
+                log.warning("    Row %s (%s): ❌ No campaigns", idx, shop_name)
             elif has_errors:
-                sheet.cell(row=idx, column=COL_STATUS + 1).value = False
                 error_summary = "; ".join(result['errors'][:3])
-                sheet.cell(row=idx, column=COL_ERROR + 1).value = error_summary[:100]
+                results_by_row[idx] = (False, error_summary[:100])
                 error_count += 1
-                print(f"    Row {idx} ({shop_name}): ❌ {len(result['errors'])} error(s)")
+                log.warning("    Row %s (%s): ❌ %s error(s)", idx, shop_name, len(result['errors']))
             else:
-                sheet.cell(row=idx, column=COL_STATUS + 1).value = True
-                sheet.cell(row=idx, column=COL_ERROR + 1).value = ""
+                results_by_row[idx] = (True, "")
                 success_count += 1
-                print(f"    Row {idx} ({shop_name}): ✅ removed={result['success']}, not_found={result['not_found']}")
+                log.debug("    Row %s (%s): ✅ removed=%s, not_found=%s", idx, shop_name, result['success'], result['not_found'])
 
-        # Save periodically (every N groups)
-        if file_path and groups_processed % save_interval == 0:
-            print(f"\n💾 Saving progress ({groups_processed} groups processed)...")
-            try:
-                workbook.save(file_path)
-            except Exception as save_error:
-                print(f"⚠️  Error saving: {save_error}")
+        # Record this group's results in the journal instead of saving the workbook
+        if journal:
+            journal.append({idx: results_by_row[idx] for idx in row_indices})
 
-    # Final save
-    if file_path:
-        print(f"\n💾 Final save...")
-        try:
-            workbook.save(file_path)
-        except Exception as save_error:
-            print(f"⚠️  Error on final save: {save_error}")
+    finish_sheet(sheet, workbook, file_path, journal, results_by_row, COL_STATUS, COL_ERROR)
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"REVERSE EXCLUSION SHEET SUMMARY (OPTIMIZED)")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Total groups processed: {groups_processed}")
     print(f"Total rows processed: {success_count + error_count}")
     print(f"Rows with missing fields: {len(rows_with_missing_fields)}")
     print(f"✅ Successful: {success_count}")
     print(f"❌ Failed: {error_count + len(rows_with_missing_fields)}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 # ============================================================================
 # MAIN EXECUTION
@@ -6773,13 +8396,14 @@ def main():
     """
     Main execution function.
     """
-    print(f"\n{'='*70}")
+    configure_logging()
+    print(f"\n{SEPARATOR}")
     print("DMA SHOP CAMPAIGNS PROCESSOR")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Operating System: {platform.system()}")
     print(f"Customer ID: {CUSTOMER_ID}")
     print(f"Excel File: {EXCEL_FILE_PATH}")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
     # Initialize Google Ads client
     client = initialize_google_ads_client()
@@ -6788,9 +8412,9 @@ def main():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     working_copy_path = EXCEL_FILE_PATH.replace(".xlsx", f"_working_copy_{timestamp}.xlsx")
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"CREATING WORKING COPY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Original file: {EXCEL_FILE_PATH}")
     print(f"Working copy:  {working_copy_path}")
 
@@ -6802,9 +8426,9 @@ def main():
         sys.exit(1)
 
     # Load Excel workbook from working copy
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"LOADING WORKING COPY")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"Loading: {working_copy_path}")
     try:
         workbook = load_workbook(working_copy_path)
@@ -6821,9 +8445,9 @@ def main():
         print(f"❌ Error processing exclusion sheet: {e}")
 
     # Load reverse exclusion file separately
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print(f"LOADING REVERSE EXCLUSION FILE")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"File: {REVERSE_EXCLUSION_FILE_PATH}")
     '''
 
@@ -6836,7 +8460,7 @@ def main():
         print(f"✅ Reverse exclusion file loaded successfully")
         print(f"   Available sheets: {reverse_workbook.sheetnames}")
 
-        #process_reverse_exclusion_sheet(client, reverse_workbook, CUSTOMER_ID, reverse_working_copy_path, 10, "verwijderen")
+        #process_reverse_exclusion_sheet(client, reverse_workbook, CUSTOMER_ID, reverse_working_copy_path, "verwijderen")
         #process_reverse_inclusion_sheet_v2(client, reverse_workbook, CUSTOMER_ID, reverse_working_copy_path)
         #process_enable_inclusion_sheet_v2(client, reverse_workbook, CUSTOMER_ID, reverse_working_copy_path, "toevoegen")
         #process_exclusion_sheet_v2(client, reverse_workbook, CUSTOMER_ID, reverse_working_copy_path)
@@ -6872,18 +8496,18 @@ def main():
     '''
 
     # Final save to working copy
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print("SAVING FINAL RESULTS")
-    print(f"{'='*70}")
+    print(SEPARATOR)
     print(f"All results saved to working copy: {working_copy_path}")
     print(f"Original file remains unchanged: {EXCEL_FILE_PATH}")
     print(f"\nTo use the results, rename or copy the working copy to:")
     print(f"  {EXCEL_FILE_PATH}")
-    print(f"{'='*70}")
+    print(SEPARATOR)
 
-    print(f"\n{'='*70}")
+    print(f"\n{SEPARATOR}")
     print("PROCESSING COMPLETE")
-    print(f"{'='*70}\n")
+    print(f"{SEPARATOR}\n")
 
 if __name__ == "__main__":
     main()
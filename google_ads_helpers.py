@@ -5,17 +5,78 @@ This file contains helper functions for Google Ads listing tree operations.
 """
 
 import time
+import random
+import threading
+from typing import Optional
 from google.ads.googleads.errors import GoogleAdsException
 
 # Global counter for temporary resource names
 _temp_id_counter = -1
+_temp_id_lock = threading.Lock()
 
 
 def next_id():
-    """Generate next temporary ID for criterion resource names"""
+    """Generate next temporary ID for criterion resource names (thread-safe)"""
     global _temp_id_counter
-    _temp_id_counter -= 1
-    return _temp_id_counter
+    with _temp_id_lock:
+        _temp_id_counter -= 1
+        return _temp_id_counter
+
+
+def error_code_field(error) -> str:
+    """
+    Name of the ErrorCode oneof field set on a GoogleAdsError, e.g.
+    'quota_error' or 'database_error' ('' if none is set).
+    """
+    error_code = error.error_code
+    return type(error_code).pb(error_code).WhichOneof("error_code") or ""
+
+
+def quota_retry_delay(ex: GoogleAdsException) -> Optional[float]:
+    """
+    Return the server-suggested retry delay (seconds) if the exception is a
+    quota error, 0.0 for a quota error without a delay, or None otherwise.
+    """
+    delay = None
+    for error in ex.failure.errors:
+        if error_code_field(error) != "quota_error":
+            continue
+        retry_delay = error._pb.details.quota_error_details.retry_delay
+        seconds = retry_delay.seconds + retry_delay.nanos / 1e9
+        delay = max(delay or 0.0, seconds)
+    return delay
+
+
+def is_concurrent_modification(ex: GoogleAdsException) -> bool:
+    """Return True if the exception is a database_error CONCURRENT_MODIFICATION."""
+    for error in ex.failure.errors:
+        if (error_code_field(error) == "database_error" and
+                error.error_code.database_error.name == 'CONCURRENT_MODIFICATION'):
+            return True
+    return False
+
+
+def mutate_with_backoff(mutate, max_tries: int = 4, base_delay: float = 1.0, **kwargs):
+    """
+    Call a service mutate method, retrying quota and CONCURRENT_MODIFICATION errors.
+
+    Replaces fixed sleeps before mutates: the call runs immediately and only
+    waits after a retryable error - the API's quota retry delay when given,
+    otherwise base_delay * 2^attempt plus up to 50% jitter. Other errors
+    (duplicate names, invalid arguments, ...) are re-raised immediately,
+    retryable ones after max_tries attempts.
+    """
+    for attempt in range(max_tries):
+        try:
+            return mutate(**kwargs)
+        except GoogleAdsException as ex:
+            retry_delay = quota_retry_delay(ex)
+            if retry_delay is None and not is_concurrent_modification(ex):
+                raise
+            if attempt == max_tries - 1:
+                raise
+            backoff = base_delay * (2 ** attempt) * (1 + random.uniform(0, 0.5))
+            time.sleep(max(retry_delay or 0.0, backoff))
 
 
 def list_listing_groups_with_depth(client, customer_id: str, ad_group_id: str):
@@ -78,12 +139,11 @@ def list_listing_groups_with_depth(client, customer_id: str, ad_group_id: str):
         return [], 0
 
 
-def safe_remove_entire_listing_tree(client, customer_id: str, ad_group_id: str):
+def get_listing_tree_root(client, customer_id: str, ad_group_id: str):
     """
-    Optimized version: Query only for the root node instead of all listing groups.
-    This reduces API calls by directly finding the root without fetching the entire tree.
+    Return the resource name of the listing tree root (node without parent),
+    or None if the ad group has no listing tree.
     """
-    agc = client.get_service("AdGroupCriterionService")
     ga_service = client.get_service("GoogleAdsService")
     ag_service = client.get_service("AdGroupService")
     ag_path = ag_service.ad_group_path(customer_id, ad_group_id)
@@ -99,13 +159,22 @@ def safe_remove_entire_listing_tree(client, customer_id: str, ad_group_id: str):
         LIMIT 1
     """
 
+    rows = ga_service.search(customer_id=customer_id, query=query)
+    return next((row.ad_group_criterion.resource_name for row in rows), None)
+
+
+def safe_remove_entire_listing_tree(client, customer_id: str, ad_group_id: str):
+    """
+    Optimized version: Query only for the root node instead of all listing groups.
+    This reduces API calls by directly finding the root without fetching the entire tree.
+    """
+    agc = client.get_service("AdGroupCriterionService")
+
     try:
-        results = list(ga_service.search(customer_id=customer_id, query=query))
-        if not results:
+        root_resource_name = get_listing_tree_root(client, customer_id, ad_group_id)
+        if not root_resource_name:
             return  # No root node found, tree already empty
 
-        root_resource_name = results[0].ad_group_criterion.resource_name
-
         # Remove only the root - the API will cascade-delete all children
         op = client.get_type("AdGroupCriterionOperation")
         op.remove = root_resource_name
@@ -178,6 +247,49 @@ def create_listing_group_unit_biddable(
     return operation
 
 
+def set_campaign_budget_fields(client, campaign_budget, budget_name, amount_micros):
+    """Fill in a new daily budget that is NOT shared by multiple campaigns."""
+    campaign_budget.name = budget_name
+    campaign_budget.delivery_method = client.enums.BudgetDeliveryMethodEnum.STANDARD
+    campaign_budget.amount_micros = amount_micros
+    campaign_budget.explicitly_shared = False
+
+
+def set_shopping_campaign_fields(
+    client, campaign, campaign_name, merchant_center_account_id,
+    bidding_strategy_resource_name=None, tracking_template=None, final_url_suffix=None
+):
+    """
+    Fill in a new standard shopping campaign: PAUSED, with the portfolio bid
+    strategy if given and manual CPC otherwise. The caller sets the budget.
+    """
+    campaign.name = campaign_name
+    campaign.advertising_channel_type = client.enums.AdvertisingChannelTypeEnum.SHOPPING
+    campaign.shopping_setting.merchant_id = merchant_center_account_id
+    campaign.shopping_setting.campaign_priority = 0
+    campaign.shopping_setting.enable_local = True
+
+    # Only set tracking_url_template if it's provided and not empty
+    if tracking_template:
+        campaign.tracking_url_template = tracking_template
+
+    campaign.contains_eu_political_advertising = (
+        client.enums.EuPoliticalAdvertisingStatusEnum.DOES_NOT_CONTAIN_EU_POLITICAL_ADVERTISING
+    )
+
+    if final_url_suffix:
+        campaign.final_url_suffix = final_url_suffix
+    campaign.status = client.enums.CampaignStatusEnum.PAUSED
+
+    # Set bidding strategy
+    if bidding_strategy_resource_name:
+        # Use portfolio bid strategy
+        campaign.bidding_strategy = bidding_strategy_resource_name
+    else:
+        # Use manual CPC
+        campaign.manual_cpc.enhanced_cpc_enabled = False
+
+
 def add_standard_shopping_campaign(
     client, customer_id, merchant_center_account_id, campaign_name, budget_name,
     tracking_template, country, shopid, shopname, label, budget, final_url_suffix=None,
@@ -214,12 +326,7 @@ def add_standard_shopping_campaign(
     # Create a budget that is NOT shared by multiple campaigns
     campaign_budget_service = client.get_service("CampaignBudgetService")
     campaign_budget_operation = client.get_type("CampaignBudgetOperation")
-    campaign_budget = campaign_budget_operation.create
-    campaign_budget.name = budget_name
-    campaign_budget.delivery_method = client.enums.BudgetDeliveryMethodEnum.STANDARD
-    campaign_budget.amount_micros = budget
-    #campaign_budget.amount_micros = 5000000
-    campaign_budget.explicitly_shared = False
+    set_campaign_budget_fields(client, campaign_budget_operation.create, budget_name, budget)
 
     try:
         campaign_budget_response = campaign_budget_service.mutate_campaign_budgets(
@@ -232,37 +339,14 @@ def add_standard_shopping_campaign(
     # Create standard shopping campaign
     campaign_operation = client.get_type("CampaignOperation")
     campaign = campaign_operation.create
-    campaign.name = campaign_name
-    campaign.advertising_channel_type = client.enums.AdvertisingChannelTypeEnum.SHOPPING
-    campaign.shopping_setting.merchant_id = merchant_center_account_id
-    campaign.shopping_setting.campaign_priority = 0
-    campaign.shopping_setting.enable_local = True
-
-    # Only set tracking_url_template if it's provided and not empty
-    if tracking_template:
-        campaign.tracking_url_template = tracking_template
-
-    campaign.contains_eu_political_advertising = (
-        client.enums.EuPoliticalAdvertisingStatusEnum.DOES_NOT_CONTAIN_EU_POLITICAL_ADVERTISING
+    set_shopping_campaign_fields(
+        client, campaign, campaign_name, merchant_center_account_id,
+        bidding_strategy_resource_name, tracking_template, final_url_suffix
     )
-
-    if final_url_suffix:
-        campaign.final_url_suffix = final_url_suffix
-    campaign.status = client.enums.CampaignStatusEnum.PAUSED
-
-    # Set bidding strategy
-    if bidding_strategy_resource_name:
-        # Use portfolio bid strategy
-        campaign.bidding_strategy = bidding_strategy_resource_name
-    else:
-        # Use manual CPC
-        campaign.manual_cpc.enhanced_cpc_enabled = False
-
     campaign.campaign_budget = campaign_budget_response.results[0].resource_name
-    time.sleep(1)
     try:
-        campaign_response = campaign_service.mutate_campaigns(
-            customer_id=customer_id, operations=[campaign_operation]
+        campaign_response = mutate_with_backoff(
+            campaign_service.mutate_campaigns, customer_id=customer_id, operations=[campaign_operation]
         )
     except GoogleAdsException as ex:
         print(f"Failed to create campaign '{campaign_name}': {ex}")
@@ -298,10 +382,10 @@ def add_standard_shopping_campaign(
         campaign_label = campaign_label_operation.create
         campaign_label.campaign = campaign_resource_name
         campaign_label.label = label_resource_name
-        time.sleep(2)
 
         try:
-            campaign_label_service.mutate_campaign_labels(
+            mutate_with_backoff(
+                campaign_label_service.mutate_campaign_labels,
                 customer_id=customer_id, operations=[campaign_label_operation]
             )
             #print(f"                Label '{script_label}' toegevoegd aan campagne '{campaign_name}'.")
@@ -324,10 +408,10 @@ def labelCampaign(client, customer_id, campaign_name, campaign_resource_name):
         campaign_label = campaign_label_operation.create
         campaign_label.campaign = campaign_resource_name
         campaign_label.label = label_resource_name
-        time.sleep(2)
 
         try:
-            campaign_label_service.mutate_campaign_labels(
+            mutate_with_backoff(
+                campaign_label_service.mutate_campaign_labels,
                 customer_id=customer_id, operations=[campaign_label_operation]
             )
             print(f"                Label '{script_label}' toegevoegd aan campagne '{campaign_name}'.")
@@ -407,8 +491,9 @@ def add_shopping_ad_group(client, customer_id, campaign_resource_name, ad_group_
     ad_group.status = client.enums.AdGroupStatusEnum.ENABLED
 
     try:
-        ad_group_response = ad_group_service.mutate_ad_groups(
-            customer_id=customer_id, operations=[ad_group_operation]
+        # Parallel setup workers add ad groups to the same campaign
+        ad_group_response = mutate_with_backoff(
+            ad_group_service.mutate_ad_groups, customer_id=customer_id, operations=[ad_group_operation]
         )
     except GoogleAdsException as ex:
         print(f"      ⚠️  Failed to create ad group '{ad_group_name}'. Checking again...")
@@ -482,7 +567,7 @@ def add_shopping_product_ad(client, customer_id, ad_group_resource_name):
     try:
         response = google_ads_service.search(customer_id=customer_id, query=query)
         for row in response:
-            print(f"      ℹ️  Shopping ad already exists in ad group (ID: {row.ad_group_ad.ad.id})")
+            print(f"      ℹ️  Shopping ad already exists in ad group {ad_group_resource_name} (ID: {row.ad_group_ad.ad.id})")
             return row.ad_group_ad.resource_name
     except Exception:
         pass  # No existing ad found, proceed to create
@@ -505,14 +590,15 @@ def add_shopping_product_ad(client, customer_id, ad_group_resource_name):
     ad_group_ad.ad._pb.shopping_product_ad.CopyFrom(shopping_product_ad_info._pb)
 
     try:
-        ad_group_ad_response = ad_group_ad_service.mutate_ad_group_ads(
-            customer_id=customer_id, operations=[ad_group_ad_operation]
+        # Parallel setup workers add ads to ad groups of the same campaign
+        ad_group_ad_response = mutate_with_backoff(
+            ad_group_ad_service.mutate_ad_group_ads, customer_id=customer_id, operations=[ad_group_ad_operation]
         )
         ad_resource_name = ad_group_ad_response.results[0].resource_name
-        print(f"      ✅ Shopping product ad created")
+        print(f"      ✅ Shopping product ad created in {ad_group_resource_name}")
         return ad_resource_name
     except GoogleAdsException as ex:
-        print(f"      ⚠️  Failed to create shopping ad: {ex}")
+        print(f"      ⚠️  Failed to create shopping ad in {ad_group_resource_name}: {ex}")
         return None
 
 def enable_negative_list_for_campaign(
@@ -6,6 +6,7 @@ Includes incremental saving and rate limiting.
 import sys
 from openpyxl import load_workbook
 from campaign_processor import (
+    configure_logging,
     initialize_google_ads_client,
     process_exclusion_sheet,
     EXCEL_FILE_PATH,
@@ -15,6 +16,7 @@ from campaign_processor import (
 
 
 def main():
+    configure_logging()
     print("="*70)
     print("PROCESSING EXCLUSION SHEET ONLY")
     print("Custom Label 3 (INDEX3) Shop Exclusions")
@@ -44,8 +46,8 @@ def main():
             client=client,
             workbook=workbook,
             customer_id=CUSTOMER_ID,
-            save_interval=25,       # Save every 25 campaigns (more frequent)
-            rate_limit_seconds=0.05 # 0.05s delay per worker (Phase 3 optimized)
+            file_path=EXCEL_FILE_PATH,
+            save_interval=25        # Save every 25 campaigns (more frequent)
         )
         print("\n✅ Exclusion sheet processing completed")
     except Exception as e:
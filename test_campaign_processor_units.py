@@ -0,0 +1,195 @@
+"""
+Unit tests for the offline helpers in campaign_processor (no API calls).
+
+Run with: python -m unittest test_campaign_processor_units
+"""
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from campaign_processor import (
+    TokenBucket,
+    ProgressJournal,
+    friendly_error_message,
+    failure_errors_by_index,
+    escape_gaql_string,
+    gaql_string_list,
+)
+
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        # Frozen clock: no tokens refill between calls, so waits are exact
+        patcher = mock.patch("campaign_processor.time.monotonic", return_value=100.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sleep_patcher = mock.patch("campaign_processor.time.sleep")
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_acquire_within_burst_does_not_sleep(self):
+        bucket = TokenBucket(rate_qps=10, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        self.sleep.assert_not_called()
+
+    def test_acquire_on_empty_bucket_waits_for_one_token(self):
+        bucket = TokenBucket(rate_qps=10, burst=2)
+        for _ in range(3):
+            bucket.acquire()
+        self.sleep.assert_called_once()
+        self.assertAlmostEqual(self.sleep.call_args[0][0], 0.1)
+
+    def test_slow_down_halves_rate_but_not_below_minimum(self):
+        bucket = TokenBucket(rate_qps=8, burst=16, min_rate_qps=0.5)
+        bucket.slow_down()
+        self.assertEqual(bucket.rate, 4)
+        for _ in range(10):
+            bucket.slow_down()
+        self.assertEqual(bucket.rate, 0.5)
+
+    def test_slow_down_hold_for_delays_next_token(self):
+        bucket = TokenBucket(rate_qps=10, burst=5, min_rate_qps=1)
+        bucket.slow_down(hold_for=2.0)
+        bucket.acquire()
+        # Rate is halved to 5/s: 2s hold plus one token at 5/s
+        self.assertAlmostEqual(self.sleep.call_args[0][0], 2.2)
+
+    def test_slow_down_without_minimum_keeps_rate(self):
+        bucket = TokenBucket(rate_qps=10, burst=5)
+        bucket.slow_down()
+        self.assertEqual(bucket.rate, 10)
+
+    def test_rate_recovers_by_step_up_to_max(self):
+        bucket = TokenBucket(rate_qps=4, burst=100, min_rate_qps=1, step_qps=1)
+        bucket.slow_down()
+        self.assertEqual(bucket.rate, 2)
+        bucket.acquire()
+        self.assertEqual(bucket.rate, 3)
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(bucket.rate, 4)
+
+
+class ProgressJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.file_path = os.path.join(self.tmp_dir.name, "dma_working_copy_20260101_120000.xlsx")
+
+    def test_path_drops_working_copy_suffix(self):
+        journal = ProgressJournal(self.file_path, "toevoegen", "inclusion_v2")
+        self.assertEqual(
+            journal.path,
+            os.path.join(self.tmp_dir.name, "dma.xlsx.toevoegen.inclusion_v2.progress.jsonl")
+        )
+
+    def test_operation_is_part_of_the_key(self):
+        first = ProgressJournal(self.file_path, "toevoegen", "inclusion_v2")
+        second = ProgressJournal(self.file_path, "toevoegen", "inclusion_legacy")
+        self.assertNotEqual(first.path, second.path)
+
+    def test_replay_skips_partial_last_line(self):
+        journal = ProgressJournal(self.file_path, "uitsluiten", "exclusion_v2")
+        journal.append({2: (True, ""), 3: (False, "Campaign not found")})
+        journal.close()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"row": 4, "res')  # Crash mid-write
+
+        self.assertEqual(
+            ProgressJournal(self.file_path, "uitsluiten", "exclusion_v2").replay(),
+            {2: (True, ""), 3: (False, "Campaign not found")}
+        )
+
+    def test_append_after_partial_line_starts_a_new_line(self):
+        journal = ProgressJournal(self.file_path, "uitsluiten", "exclusion_v2")
+        with open(journal.path, "w", encoding="utf-8") as f:
+            f.write('{"row": 2, "result": true, "err": ""}\n{"row": 3, "res')
+        journal.append({5: (True, "")})
+        journal.close()
+
+        self.assertEqual(journal.replay(), {2: (True, ""), 5: (True, "")})
+
+    def test_close_remove_deletes_journal(self):
+        journal = ProgressJournal(self.file_path, "check", "check")
+        journal.append({2: (True, "")})
+        journal.close(remove=True)
+        self.assertFalse(os.path.exists(journal.path))
+        self.assertEqual(journal.replay(), {})
+
+    def test_open_and_replay_without_file_path(self):
+        self.assertEqual(ProgressJournal.open_and_replay(None, "check", "check"), (None, {}))
+
+
+class FriendlyErrorMessageTest(unittest.TestCase):
+    def test_known_code_maps_to_fixed_message(self):
+        self.assertEqual(
+            friendly_error_message("error_code: CONCURRENT_MODIFICATION ... details"),
+            "Concurrent modification (retry needed)"
+        )
+
+    def test_not_found_text_maps_to_not_found(self):
+        self.assertEqual(friendly_error_message("Ad group Not Found for pattern"), "Resource not found")
+
+    def test_codes_are_checked_in_priority_order(self):
+        self.assertEqual(
+            friendly_error_message("NOT_FOUND / SUBDIVISION_REQUIRES_OTHERS_CASE"),
+            "Tree structure error: missing OTHERS case"
+        )
+
+    def test_unknown_error_is_truncated(self):
+        self.assertEqual(friendly_error_message("x" * 200), "x" * 80)
+        self.assertEqual(friendly_error_message("x" * 200, max_length=10), "x" * 10)
+
+
+def _failure(*errors):
+    """GoogleAdsFailure stand-in: errors are (operation index or None, message)."""
+    return SimpleNamespace(errors=[
+        SimpleNamespace(
+            error_code="code",
+            message=message,
+            location=SimpleNamespace(
+                field_path_elements=[] if index is None else [SimpleNamespace(index=index)]
+            )
+        )
+        for index, message in errors
+    ])
+
+
+class FailureErrorsByIndexTest(unittest.TestCase):
+    def test_errors_are_keyed_by_operation_index(self):
+        self.assertEqual(
+            failure_errors_by_index(_failure((0, "bad"), (2, "worse"))),
+            {0: "code: bad", 2: "code: worse"}
+        )
+
+    def test_first_error_per_operation_wins(self):
+        self.assertEqual(failure_errors_by_index(_failure((1, "first"), (1, "second"))), {1: "code: first"})
+
+    def test_unindexed_error_fails_every_operation(self):
+        self.assertEqual(
+            failure_errors_by_index(_failure((1, "bad"), (None, "request")), operation_count=3),
+            {0: "code: request", 1: "code: bad", 2: "code: request"}
+        )
+
+    def test_unindexed_error_is_skipped_without_operation_count(self):
+        self.assertEqual(failure_errors_by_index(_failure((None, "request"))), {})
+
+
+class GaqlStringTest(unittest.TestCase):
+    def test_escape_quotes_and_backslashes(self):
+        self.assertEqual(escape_gaql_string("it's"), "it\\'s")
+        self.assertEqual(escape_gaql_string("a\\b"), "a\\\\b")
+        self.assertEqual(escape_gaql_string("a\\'b"), "a\\\\\\'b")
+
+    def test_list_is_deduplicated_sorted_and_quoted(self):
+        self.assertEqual(gaql_string_list(["b", "a", "b", "o'neil"]), "'a', 'b', 'o\\'neil'")
+
+    def test_empty_list(self):
+        self.assertEqual(gaql_string_list([]), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
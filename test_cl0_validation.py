@@ -2,12 +2,14 @@
 Test CL0 validation from Excel diepste_cat_id column.
 """
 from campaign_processor import (
+    configure_logging,
     initialize_google_ads_client,
     rebuild_tree_with_shop_exclusions,
     CUSTOMER_ID
 )
 
 def main():
+    configure_logging()
     ad_group_id = 161157611033  # PLA/Zwemvesten_b
     campaign_id = 21089623885
 
@@ -7,9 +7,10 @@ import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from campaign_processor import rebuild_tree_with_custom_label_3_exclusion
+from campaign_processor import configure_logging, rebuild_tree_with_custom_label_3_exclusion
 
 load_dotenv()
+configure_logging()
 
 credentials = {
     'developer_token': os.getenv('GOOGLE_ADS_DEVELOPER_TOKEN'),
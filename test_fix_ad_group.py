@@ -4,12 +4,14 @@ Testing: Ad Group 161157611033 in Campaign 21089623885 (PLA/Zwemvesten_b)
 Shop to exclude: Knivesandtools.nl
 """
 from campaign_processor import (
+    configure_logging,
     initialize_google_ads_client,
     rebuild_tree_with_shop_exclusions,
     CUSTOMER_ID
 )
 
 def main():
+    configure_logging()
     print("="*70)
     print("TESTING FIX ON AD GROUP 161157611033")
     print("="*70)
@@ -10,6 +10,7 @@ This processes a small batch of 10 campaigns as a test.
 import sys
 from openpyxl import load_workbook
 from campaign_processor import (
+    configure_logging,
     initialize_google_ads_client,
     process_exclusion_sheet,
     EXCEL_FILE_PATH,
@@ -63,15 +64,14 @@ def test_improved_migration(customer_id: str, start_row: int = 26, end_row: int
     # Process exclusion sheet with improved parameters
     print("\nProcessing exclusion sheet with improvements:")
     print("  - Save interval: Every 5 campaigns (small batch)")
-    print("  - Rate limit: 0.5s delay between campaigns")
     print()
 
     process_exclusion_sheet(
         client=client,
         workbook=workbook,
         customer_id=customer_id,
-        save_interval=5,  # Save every 5 campaigns for testing
-        rate_limit_seconds=0.5  # 500ms delay between campaigns
+        file_path=EXCEL_FILE_PATH,
+        save_interval=5  # Save every 5 campaigns for testing
     )
 
     # Close workbook
@@ -120,6 +120,7 @@ def test_improved_migration(customer_id: str, start_row: int = 26, end_row: int
 
 def main():
     """Main function"""
+    configure_logging()
     if len(sys.argv) < 2:
         print("Usage: python3 test_improved_migration.py <customer_id> [start_row] [end_row]")
         print("\nExample:")
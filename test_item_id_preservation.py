@@ -3,12 +3,14 @@ Test the item ID preservation logic on ad group 189081353036.
 This ad group has 2 item ID exclusions that should be preserved.
 """
 from campaign_processor import (
+    configure_logging,
     initialize_google_ads_client,
     rebuild_tree_with_shop_exclusions,
     CUSTOMER_ID
 )
 
 def main():
+    configure_logging()
     ad_group_id = 189081353036
     shops_to_exclude = ["TestShop1.nl", "TestShop2.nl"]
 